@@ -10,6 +10,7 @@
 
 import os
 import sys
+import time
 import optparse
 
 import pickle
@@ -30,8 +31,12 @@ def main():
     try:
         sys.path.append(os.path.dirname(opts.utilities))
         module_name, _ = os.path.splitext(os.path.basename((opts.utilities)))
+        start = time.perf_counter()
         utilities = __import__(module_name)
 
+        # Profile the imports done during bootstrap if it was requested.
+        utilities.start_import_profiler(time.perf_counter() - start)
+
         # load up the pickle file with the data payload
         #
         # The pickle file comes from the app launching this instance of the
@@ -54,13 +54,23 @@ class LaunchPython(tank.Hook):
             "launching %s", " ".join(["'%s'" % arg for arg in args])
         )
 
-        # Very important to set close_fds otherwise the websocket server file descriptor
-        # will be shared with the child process and it prevent restarting the server
-        # after the process closes.
-        # Solution was found here: http://stackoverflow.com/a/13593715
-        process = subprocess.Popen(
-            args, startupinfo=startupinfo, close_fds=True
-        )  # nosec B603 - args are built from trusted toolkit internals, not user input
+        # On Linux, the process can be forked from a server that has already imported
+        # Toolkit, which is a lot faster than starting a new interpreter.
+        process = None
+        launch_forked_python = getattr(self.parent, "launch_forked_python", None)
+        if launch_forked_python is not None:
+            process = launch_forked_python(
+                project_python, pickle_data_path, utilities_module_path
+            )
+
+        if process is None:
+            # Very important to set close_fds otherwise the websocket server file descriptor
+            # will be shared with the child process and it prevent restarting the server
+            # after the process closes.
+            # Solution was found here: http://stackoverflow.com/a/13593715
+            process = subprocess.Popen(
+                args, startupinfo=startupinfo, close_fds=True
+            )  # nosec B603 - args are built from trusted toolkit internals, not user input
 
         # Keep track of the bootstrap process so it can be terminated when the
         # desktop app disconnects from the project or quits.
@@ -13,6 +13,8 @@ Helpers for managing the project bootstrap subprocess launched by tk-desktop.
 """
 
 import subprocess  # nosec B404
+import threading
+import time
 import typing
 
 import sgtk
@@ -64,3 +66,104 @@ def terminate_process(
         logger.warning(
             "Bootstrap process (pid %s) did not exit after kill().", process.pid
         )
+
+
+class ProcessReaper:
+    """
+    Takes ownership of bootstrap processes being retired and terminates them
+    on background threads, so the caller doesn't have to wait for them to exit.
+    """
+
+    def __init__(self, timeout: int = DEFAULT_TERMINATION_TIMEOUT) -> None:
+        """
+        :param timeout: Number of seconds to wait for graceful termination before killing.
+        """
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._threads = set()
+
+    @property
+    def pending_count(self) -> int:
+        """
+        Number of processes still being terminated.
+        """
+        with self._lock:
+            return len(self._threads)
+
+    def retire(self, process: typing.Optional[subprocess.Popen]) -> None:
+        """
+        Terminates a process in the background if it is still running.
+
+        :param process: A :class:`subprocess.Popen` instance, or None.
+        """
+        if process is None or process.poll() is not None:
+            return
+
+        thread = threading.Thread(
+            target=self._reap,
+            args=(process, time.monotonic()),
+            name="ProcessReaper-%s" % process.pid,
+            daemon=True,
+        )
+        with self._lock:
+            self._threads.add(thread)
+        thread.start()
+
+    def wait(self, timeout: typing.Optional[float] = None) -> bool:
+        """
+        Waits for the retired processes to be terminated.
+
+        :param timeout: Number of seconds to wait for, or None to wait forever.
+
+        :returns: ``True`` if all the processes were terminated.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            threads = list(self._threads)
+        for thread in threads:
+            thread.join(
+                None if deadline is None else max(0, deadline - time.monotonic())
+            )
+        return self.pending_count == 0
+
+    def _reap(self, process: subprocess.Popen, start: float) -> None:
+        """
+        Terminates a process and reports how it went.
+        """
+        try:
+            terminate_process(process, self._timeout)
+            duration = time.monotonic() - start
+            returncode = process.poll()
+            logger.debug(
+                "Bootstrap process (pid %s) exited with code %s after %.2f seconds.",
+                process.pid,
+                returncode,
+                duration,
+            )
+            _log_retirement_metric(returncode, duration)
+        except Exception:
+            logger.exception("Unexpected error terminating the bootstrap process:")
+        finally:
+            with self._lock:
+                self._threads.discard(threading.current_thread())
+
+
+def _log_retirement_metric(returncode: typing.Optional[int], duration: float) -> None:
+    """
+    Logs how long a bootstrap process took to exit and how it exited.
+    """
+    try:
+        from sgtk.util.metrics import EventMetric
+
+        EventMetric.log(
+            EventMetric.GROUP_TOOLKIT,
+            "Retired Background Process",
+            properties={
+                "Exit Code": returncode,
+                "Duration": round(duration, 3),
+            },
+            bundle=sgtk.platform.current_engine(),
+        )
+    except Exception:
+        # ignore all errors. ex: using a core that doesn't support metrics
+        pass
@@ -0,0 +1,142 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Rules from the ``collapse_rules`` setting, which collapse commands with similar
+titles into a single button with a menu.
+"""
+
+import collections
+import re
+import string
+
+from sgtk import LogManager
+
+logger = LogManager.get_logger(__name__)
+
+
+class KeyedDefaultDict(collections.defaultdict):
+    """
+    Simple class to provide a dictionary whose default value for a key is a
+    function of that key.
+    """
+
+    def __missing__(self, key):
+        # call the default factory with the key as an argument
+        ret = self[key] = self.default_factory(key)
+        return ret
+
+
+def _get_template_regex(template, group_name_func):
+    """
+    :param str template: Template of a title, e.g. ``Maya $version``.
+    :param group_name_func: Callable taking the name of a variable and returning
+        the name of the regular expression group matching it.
+
+    :returns: Regular expression string matching the titles of the template.
+    """
+    # since the template is going to be used as a regex, escape everything
+    # except $ so that it isn't interpreted as part of the re we are building
+    template = string.Template(re.escape(template).replace("\\$", "$"))
+
+    # do a substitution where we build a regular expression with a group
+    # for each dollar var we match, substitute in a group named after
+    # the variable that will match any non-whitespace characters
+    return template.safe_substitute(
+        KeyedDefaultDict(lambda k: r"(?P<%s>\S+)" % group_name_func(k))
+    )
+
+
+class CollapseRules(object):
+    """
+    Matches command titles against collapse rules.
+
+    The rules are compiled once into a single regular expression with an
+    alternative per rule, tried in order so the first matching rule wins, and the
+    result for each title is remembered.
+    """
+
+    def __init__(self, rules):
+        """
+        :param list rules: Collapse rules, which are dictionaries with the
+            ``match``, ``button_label`` and ``menu_label`` keys.
+        """
+        self._rules = rules
+        # (rule, button template, menu template, {group name: variable name}) by
+        # rule group name.
+        self._labels = {}
+        # (button name, menu name) or None by title.
+        self._matches = {}
+
+        alternatives = []
+        for index, rule in enumerate(rules):
+            rule_group = "rule%d" % index
+            variables = {}
+
+            def get_group_name(variable):
+                variables[rule_group + "_" + variable] = variable
+                return rule_group + "_" + variable
+
+            regex = _get_template_regex(rule["match"], get_group_name)
+            try:
+                re.compile(regex)
+            except re.error as e:
+                logger.warning("Ignoring collapse rule %s: %s", rule["match"], e)
+                continue
+            alternatives.append("(?P<%s>%s)" % (rule_group, regex))
+            self._labels[rule_group] = (
+                rule,
+                string.Template(rule["button_label"]),
+                (
+                    None
+                    if rule["menu_label"] == "None"
+                    else string.Template(rule["menu_label"])
+                ),
+                variables,
+            )
+
+        self._regex = re.compile("|".join(alternatives)) if alternatives else None
+
+    @property
+    def rules(self):
+        """
+        Collapse rules the matcher was created from.
+        """
+        return self._rules
+
+    def match(self, title):
+        """
+        :param str title: Title of a command.
+
+        :returns: Tuple of the button name and the menu name of the command, the
+            latter being None if it isn't in a menu, or None if no rule matches.
+        """
+        if title not in self._matches:
+            self._matches[title] = self._match(title)
+        return self._matches[title]
+
+    def _match(self, title):
+        match = self._regex.match(title) if self._regex is not None else None
+        if match is None:
+            return None
+
+        # The group of the rule encloses the groups of its variables, so it is the
+        # last one to close.
+        rule, button_template, menu_template, variables = self._labels[match.lastgroup]
+        logger.debug("matching %s against %s", title, rule["match"])
+        values = dict(
+            (variables[group_name], value)
+            for group_name, value in match.groupdict().items()
+            if group_name in variables
+        )
+        button_name = button_template.safe_substitute(values)
+        if menu_template is None:
+            return button_name, None
+        return button_name, menu_template.safe_substitute(values)
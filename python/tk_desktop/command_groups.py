@@ -0,0 +1,64 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Groups from the ``groups`` setting, which sort commands into sections of the command
+panel.
+"""
+
+import fnmatch
+import re
+
+
+class CommandGroups(object):
+    """
+    Matches the display name of commands against the ``matches`` patterns of the
+    groups.
+
+    The patterns of each group are compiled once into a single case insensitive
+    regular expression, and the groups of each display name are remembered.
+    """
+
+    def __init__(self, groups, default_group):
+        """
+        :param list groups: Groups from the ``groups`` setting, which are
+            dictionaries with the ``name`` and ``matches`` keys.
+        :param str default_group: Group of the commands that don't match any group.
+        """
+        self._default_group = default_group
+        # (group name, regular expression) for the groups with patterns.
+        self._groups = [
+            (
+                group["name"],
+                re.compile(
+                    "|".join(fnmatch.translate(match) for match in group["matches"]),
+                    re.IGNORECASE,
+                ),
+            )
+            for group in groups
+            if group["matches"]
+        ]
+        # Group names by display name.
+        self._matches = {}
+
+    def get_groups(self, display_name):
+        """
+        :param str display_name: Display name of a command.
+
+        :returns: List of the names of the groups of the command, which is the
+            default group if it doesn't match any.
+        """
+        matches = self._matches.get(display_name)
+        if matches is None:
+            matches = [
+                name for name, regex in self._groups if regex.match(display_name)
+            ] or [self._default_group]
+            self._matches[display_name] = matches
+        return list(matches)
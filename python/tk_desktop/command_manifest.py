@@ -0,0 +1,180 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Persistence of the commands registered by a project engine.
+
+The site engine records everything the project engine sends over during command
+registration and saves it once ``project_commands_finished`` is received. The next
+time the same project is opened with the same pipeline configuration and
+configuration descriptor, the command panel can be drawn from that manifest right
+away instead of waiting for the background process to bootstrap.
+"""
+
+import copy
+
+
+class CommandManifest(object):
+    """
+    Records and persists the command set of a project.
+
+    The settings object needs to provide a ``save(key, value)`` and ``load(key)``
+    method, like the ``ProjectCommandSettings`` used by the command panel.
+    """
+
+    # Bump this value if the format of the manifest changes. Manifests
+    # saved with a different version will be ignored.
+    VERSION = 1
+
+    def __init__(self, settings):
+        """
+        :param settings: Settings object to persist and restore manifests.
+        """
+        self._settings = settings
+        self._project = None
+        self._pipeline_configuration_id = None
+        self._descriptor_uri = None
+        self.reset()
+
+    def start_recording(self, project, pipeline_configuration_id, descriptor_uri):
+        """
+        Starts recording the command set of a project.
+
+        :param dict project: Project entity dictionary with key ``id``.
+        :param int pipeline_configuration_id: Id of the pipeline configuration
+            being loaded, or None when bootstrapping into the fallback configuration.
+        :param str descriptor_uri: Uri of the configuration descriptor.
+        """
+        self._project = project
+        self._pipeline_configuration_id = pipeline_configuration_id
+        self._descriptor_uri = descriptor_uri
+        self.reset()
+
+    def reset(self):
+        """
+        Forgets everything that was recorded so far, but keeps recording for
+        the same project.
+        """
+        self._groups = []
+        self._show_recents = True
+        self._collapse_rules = []
+        # List of (name, properties, groups) tuples, in registration order.
+        self._commands = []
+
+    @property
+    def is_recording(self):
+        """
+        ``True`` if a project is currently being recorded.
+        """
+        return self._project is not None
+
+    def record_groups(self, groups, show_recents):
+        """
+        :param list(str) groups: Groups configured for the project.
+        :param bool show_recents: If True, recent commands are displayed.
+        """
+        self._groups = list(groups)
+        self._show_recents = show_recents
+
+    def record_collapse_rules(self, collapse_rules):
+        """
+        :param list(dict) collapse_rules: Collapse rules configured for the project.
+        """
+        self._collapse_rules = copy.deepcopy(collapse_rules)
+
+    def record_command(self, name, properties, groups):
+        """
+        :param str name: Name of the command.
+        :param dict properties: GUI properties of the command.
+        :param list(str) groups: Groups the command belongs to.
+        """
+        self._commands.append((name, dict(properties), list(groups)))
+
+    @property
+    def commands(self):
+        """
+        List of (name, properties, groups) tuples recorded so far.
+        """
+        return self._commands
+
+    @property
+    def groups(self):
+        """
+        Groups recorded so far.
+        """
+        return self._groups
+
+    @property
+    def show_recents(self):
+        """
+        Recent commands display flag recorded so far.
+        """
+        return self._show_recents
+
+    @property
+    def collapse_rules(self):
+        """
+        Collapse rules recorded so far.
+        """
+        return self._collapse_rules
+
+    def save(self):
+        """
+        Saves what was recorded for the current project.
+        """
+        if not self.is_recording:
+            return
+
+        self._settings.save(
+            self._get_key(self._project),
+            {
+                "version": self.VERSION,
+                "pipeline_configuration_id": self._pipeline_configuration_id,
+                "descriptor_uri": self._descriptor_uri,
+                "groups": self._groups,
+                "show_recents": self._show_recents,
+                "collapse_rules": self._collapse_rules,
+                "commands": [
+                    {"name": name, "properties": properties, "groups": groups}
+                    for name, properties, groups in self._commands
+                ],
+            },
+        )
+
+    def load(self, project, pipeline_configuration_id, descriptor_uri):
+        """
+        Loads the manifest saved for a project.
+
+        :param dict project: Project entity dictionary with key ``id``.
+        :param int pipeline_configuration_id: Id of the pipeline configuration
+            being loaded, or None.
+        :param str descriptor_uri: Uri of the configuration descriptor.
+
+        :returns: A dictionary with keys ``groups``, ``show_recents``, ``collapse_rules``
+            and ``commands`` or None if nothing was saved for this combination of
+            project, pipeline configuration and descriptor.
+        """
+        manifest = self._settings.load(self._get_key(project))
+        if not manifest or manifest.get("version") != self.VERSION:
+            return None
+
+        if (
+            manifest.get("pipeline_configuration_id") != pipeline_configuration_id
+            or manifest.get("descriptor_uri") != descriptor_uri
+        ):
+            return None
+
+        return manifest
+
+    def _get_key(self, project):
+        """
+        :returns: The settings key for the given project.
+        """
+        return "project_command_manifest.%d" % project["id"]
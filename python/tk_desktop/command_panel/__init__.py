@@ -46,5 +46,6 @@ The following graph shows those relationships
 """
 
 from .command_panel import CommandPanel
+from .icon_cache import IconUpdater, get_icon, get_icon_cache
 
-__all__ = ("CommandPanel",)
+__all__ = ("CommandPanel", "IconUpdater", "get_icon", "get_icon_cache")
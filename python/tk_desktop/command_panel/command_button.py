@@ -8,13 +8,34 @@
 # agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
 # not expressly granted therein are reserved by Shotgun Software Inc.
 
-import functools
-
-from sgtk.deploy import util
+import bisect
+import re
 
 from sgtk.platform.qt import QtCore, QtGui
 
 from .shared import ICON_SIZE, BUTTON_STYLE
+from .icon_cache import IconUpdater, get_icon
+
+# Splits a version into numbers and words, like distutils' LooseVersion.
+_VERSION_COMPONENT_RE = re.compile(r"(\d+|[a-z]+|\.)")
+
+
+def _get_version_key(menu_name):
+    """
+    Computes a key that sorts menu names from the oldest version to the newest,
+    in the same order as ``sgtk.deploy.util.is_version_newer``.
+
+    :param str menu_name: Name of the command in the menu, e.g. Maya 2019.
+
+    :returns: List of the components of the version.
+    """
+    if menu_name.startswith("v"):
+        menu_name = menu_name[1:]
+    return [
+        (1, int(component)) if component.isdecimal() else (0, component)
+        for component in _VERSION_COMPONENT_RE.split(menu_name)
+        if component and component != "."
+    ]
 
 
 class CommandButton(QtGui.QToolButton):
@@ -51,9 +72,23 @@ class CommandButton(QtGui.QToolButton):
 
         self.setText(" %s" % button_name)
 
+        # Icons are displayed once they are loaded in the background.
+        self._icon_updater = IconUpdater(
+            self, lambda path: self.setIcon(get_icon(path))
+        )
         self._set_default(tooltip, icon)
 
+        # Commands on the button, as [command name, menu name, tooltip, icon, is
+        # menu default] lists, sorted from the newest version to the oldest.
         self._commands = []
+        # Version keys of the commands, sorted from the oldest to the newest.
+        self._sort_keys = []
+        # Menu actions of the commands, in the same order as the commands.
+        self._actions = []
+        # Command displayed at the top of the menu and run by the button.
+        self._default = None
+        # Names of the commands that are displayed but can't be launched yet.
+        self._disabled_commands = set()
 
         # This menu will implement the drop down behaviour of the tool button.
         self._menu = QtGui.QMenu(self)
@@ -78,8 +113,17 @@ class CommandButton(QtGui.QToolButton):
 
         self._menu.aboutToHide.connect(cleanup)
 
-        # Clicking on the button triggers the first action.
-        self.clicked.connect(lambda: self._menu.actions()[0].trigger())
+        self.clicked.connect(self._on_clicked)
+
+    def _on_clicked(self):
+        """
+        Triggers the first action that can be launched, which is the default one
+        unless it is disabled.
+        """
+        for action in self._menu.actions():
+            if action.isEnabled():
+                action.trigger()
+                return
 
     @property
     def name(self):
@@ -96,9 +140,11 @@ class CommandButton(QtGui.QToolButton):
         :param str icon: Path to the icon.
         """
         self.setToolTip(tooltip)
-        self.setIcon(QtGui.QIcon(icon))
+        self._icon_updater.set_path(icon)
 
-    def add_command(self, command_name, menu_name, icon, tooltip, is_menu_default):
+    def add_command(
+        self, command_name, menu_name, icon, tooltip, is_menu_default, is_enabled=True
+    ):
         """
         Add a command for this button.
 
@@ -110,7 +156,13 @@ class CommandButton(QtGui.QToolButton):
         :param str icon: Path of the icon for the menu dropdown.
         :param bool is_menu_default: If True, this command will become the default
             command for the button.
+        :param bool is_enabled: If False, the command is displayed but can't be launched
+            until it is enabled with ``set_command_enabled``.
         """
+        if is_enabled:
+            self._disabled_commands.discard(command_name)
+        else:
+            self._disabled_commands.add(command_name)
 
         # Menu name is set when an app returns multiple actions to be put inside a group
         # and gives each of them a different name (e.g. Maya 2018, Maya 2019, Maya 2020).
@@ -127,68 +179,127 @@ class CommandButton(QtGui.QToolButton):
         if menu_name is None:
             menu_name = command_name
 
-        # The default menu entry is always denoted with a star next to it.
-        if is_menu_default:
-            for command in self._commands:
-                command[-1] = False
-
-        # QMenu doesn't support insertion of an action in the middle of the menu
-        # so we'll recreate the items every single time one is added.
-        self._menu.clear()
-
         # Only keep the last default as the default. This can happen when
         # software entities are unproperly registered and multiple
         # defaults are defined.
+        if is_menu_default:
+            for command in self._commands:
+                command[-1] = False
 
-        # Keep track of the new item being added.
-        self._commands.append([command_name, menu_name, tooltip, icon, is_menu_default])
-
-        # For all actions on the menu name
-        is_first = True
-        for command_name, menu_name, tooltip, icon, _ in sorted(
-            self._commands, key=functools.cmp_to_key(self._compare_menu_actions)
+        # Insert the command after the newer versions and the versions that are
+        # the same, so commands with the same version stay in the order they were
+        # added.
+        command = [command_name, menu_name, tooltip, icon, is_menu_default]
+        key = _get_version_key(menu_name)
+        key_index = bisect.bisect_left(self._sort_keys, key)
+        self._sort_keys.insert(key_index, key)
+        index = len(self._commands) - key_index
+        self._commands.insert(index, command)
+
+        action = QtGui.QAction(menu_name, self._menu)
+        action.setToolTip(tooltip)
+        action.setData(command_name)
+        action.setEnabled(command_name not in self._disabled_commands)
+        self._actions.insert(index, action)
+
+        # The default menu entry is always at the top, denoted with a star next to
+        # it. Without an explicit default, it is the newest version.
+        previous_default = self._default
+        if is_menu_default:
+            default = command
+        elif previous_default is not None and previous_default[-1]:
+            default = previous_default
+        else:
+            default = self._commands[0]
+
+        # Only the actions that move are taken out of the menu and inserted back.
+        to_place = [command]
+        if default is not previous_default:
+            for moved in (previous_default, default):
+                if moved is not None and moved is not command:
+                    self._menu.removeAction(self._actions[self._index_of(moved)])
+                    to_place.append(moved)
+            self._default = default
+            self._set_default(default[2], default[3])
+        # The default is placed first, then the other actions from the top of the
+        # menu down, so the actions above them are already in place.
+        for moved in sorted(
+            to_place,
+            key=lambda moved: -1 if moved is default else self._index_of(moved),
         ):
-            # Add an asterix to the first item since it is the default.
-            if is_first:
-                is_first = False
-                self._set_default(tooltip, icon)
-                menu_name += "*"
-            action = self._menu.addAction(menu_name)
-            action.setToolTip(tooltip)
-            action.setData(command_name)
+            self._place_action(self._index_of(moved))
 
         # If there is more than one available item in the menu, show it so the
         # user can pick one.
-        if len(self._menu.actions()) > 1:
+        if len(self._commands) > 1:
             self.setPopupMode(QtGui.QToolButton.MenuButtonPopup)
             self.setMenu(self._menu)
 
-    def _compare_menu_actions(self, lhs, rhs):
+        self._update_enabled_state()
+
+    def _index_of(self, command):
+        """
+        :returns: The index of a command in the list of commands.
+        """
+        for index, other in enumerate(self._commands):
+            if other is command:
+                return index
+        raise ValueError("Unknown command %s" % command[0])
+
+    def _place_action(self, index):
         """
-        Compare two menu actions.
+        Inserts the action of a command into the menu. The default action and the
+        actions of the newer commands must already be in the menu.
+
+        :param int index: Index of the command.
+        """
+        command = self._commands[index]
+        action = self._actions[index]
+        if command is self._default:
+            position = 0
+            action.setText(command[1] + "*")
+        else:
+            # Below the default, if it isn't already counted in the newer commands.
+            position = index + (0 if self._index_of(self._default) < index else 1)
+            action.setText(command[1])
 
-        Actions are sorted alphabetically, but the default note, denoted by a *,
-        is always at the top.
+        actions = self._menu.actions()
+        if position < len(actions):
+            self._menu.insertAction(actions[position], action)
+        else:
+            self._menu.addAction(action)
+
+    def set_command_enabled(self, command_name, is_enabled):
         """
-        # extract the action name so we can sort based on that.
-        lhs_action_name = lhs[1]
-        rhs_action_name = rhs[1]
+        Enable or disable a command on this button.
 
-        lhs_is_default = lhs[-1]
-        rhs_is_default = rhs[-1]
+        :param str command_name: Name of the command.
+        :param bool is_enabled: If True, the command can be launched.
 
-        # The default action, denoted by a * in the menu, is always at the top.
-        # Everything else is sorted alphabetically.
-        if lhs_is_default:
-            return -1
-        elif rhs_is_default:
-            return 1
-        elif util.is_version_newer(lhs_action_name, rhs_action_name):
-            return -1
-        elif util.is_version_older(lhs_action_name, rhs_action_name):
-            return 1
+        :returns: True if the command is on this button, False otherwise.
+        """
+        if not any(command[0] == command_name for command in self._commands):
+            return False
+
+        if is_enabled:
+            self._disabled_commands.discard(command_name)
         else:
-            return 0
+            self._disabled_commands.add(command_name)
+
+        for action in self._menu.actions():
+            if str(action.data()) == command_name:
+                action.setEnabled(is_enabled)
+
+        self._update_enabled_state()
+        return True
+
+    def _update_enabled_state(self):
+        """
+        The button can be clicked as long as one of its commands can be launched.
+        """
+        self.setEnabled(
+            any(command[0] not in self._disabled_commands for command in self._commands)
+        )
 
     def sizeHint(self):
         """
@@ -30,9 +30,59 @@ class CommandList(BaseIconList):
         self._filler = QtGui.QWidget(self)
         # This will hold the CommandButton instances index by the button name.
         self._buttons = {}
+        # True between begin_update and end_update.
+        self._is_updating = False
+        # True if buttons were added since the grid was last laid out.
+        self._needs_layout = False
+
+    def begin_update(self):
+        """
+        Defers laying out the grid until ``end_update`` is called, so adding many
+        buttons only lays it out once.
+        """
+        self._is_updating = True
+
+    def end_update(self):
+        """
+        Lays out the buttons added since ``begin_update`` was called.
+        """
+        self._is_updating = False
+        if self._needs_layout:
+            self._layout_buttons()
+
+    def _layout_buttons(self):
+        """
+        Lays out the buttons on the grid, sorted by name.
+        """
+        self._needs_layout = False
+        # Remove all buttons from the grid since we can't insert and move things
+        # around in such a layout.
+        for btn in self._buttons:
+            self._layout.removeWidget(self._buttons[btn])
+        self._layout.removeWidget(self._filler)
+
+        self._layout.update()
+
+        # Adds two button per rows, use as many rows as needed.
+        for idx, name in enumerate(sorted(self._buttons)):
+            column = idx % 2
+            row = idx // 2
+            self._layout.addWidget(self._buttons[name], row, column)
+
+        # If the last row had only one button, insert the filler so the
+        # button does not occupy the whole row.
+        if column == 0:
+            self._layout.addWidget(self._filler, row, column + 1)
 
     def add_command(
-        self, command_name, button_name, menu_name, icon, tooltip, is_menu_default
+        self,
+        command_name,
+        button_name,
+        menu_name,
+        icon,
+        tooltip,
+        is_menu_default,
+        is_enabled=True,
     ):
         """
         Add a command to the list of command.
@@ -44,42 +94,42 @@ class CommandList(BaseIconList):
         :param str icon: Path to the icon file.
         :param str tooltip: Tooltip for the button.
         :param bool: If ``True``, clicking on the button will run this action.
+        :param bool is_enabled: If ``False``, the command can't be launched yet.
         """
 
         # If this button does not currently exist.
         if button_name not in self._buttons:
-            # Remove all buttons from the grid since we can't insert and move things
-            # around in such a layout.
-            for btn in self._buttons:
-                self._layout.removeWidget(self._buttons[btn])
-            self._layout.removeWidget(self._filler)
-
-            self._layout.update()
             # Create and hook up the button so clicks are propagated.
             self._buttons[button_name] = CommandButton(
                 self, command_name, button_name, icon, tooltip
             )
             self._buttons[button_name].command_triggered.connect(self.command_triggered)
 
-            # Adds two button per rows, use as many rows as needed.
-            for idx, name in enumerate(sorted(self._buttons)):
-                column = idx % 2
-                row = idx // 2
-                self._layout.addWidget(self._buttons[name], row, column)
-
-            # If the last row had only one button, insert the filler so the
-            # button does not occupy the whole row.
-            if column == 0:
-                self._layout.addWidget(self._filler, row, column + 1)
+            # While updating, the grid is laid out once when the update ends.
+            if self._is_updating:
+                self._needs_layout = True
+            else:
+                self._layout_buttons()
 
         self._buttons[button_name].add_command(
-            command_name, menu_name, icon, tooltip, is_menu_default
+            command_name, menu_name, icon, tooltip, is_menu_default, is_enabled
         )
 
+    def set_command_enabled(self, command_name, is_enabled):
+        """
+        Enable or disable a command in the list.
+
+        :param str command_name: Name of the command.
+        :param bool is_enabled: If ``True``, the command can be launched.
+        """
+        for button in self._buttons.values():
+            button.set_command_enabled(command_name, is_enabled)
+
     @property
     def buttons(self):
         """
         An iterator over the buttons in the list.
         """
-        for i in range(len(self._buttons)):
-            yield self._layout.itemAt(i).widget()
+        # Same order as on the grid.
+        for name in sorted(self._buttons):
+            yield self._buttons[name]
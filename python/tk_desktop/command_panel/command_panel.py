@@ -35,6 +35,10 @@ class CommandPanel(QtGui.QWidget):
     # Emits the command name to execute.
     command_triggered = QtCore.Signal(str)
 
+    # Number of milliseconds the panel stays suspended while a project registers
+    # its commands, in case registration never finishes.
+    REGISTRATION_TIMEOUT = 5000
+
     def __init__(self, parent, settings):
         """
         :param parent: Parent widget.
@@ -85,6 +89,13 @@ class CommandPanel(QtGui.QWidget):
         self._show_recents = False
         # Keeps a reference to scroll view that owns this widget.
         self._scroll_view_owner = parent
+        # Number of nested begin_update calls.
+        self._update_depth = 0
+        # True between begin_registration and end_registration.
+        self._is_registering = False
+        self._registration_timer = QtCore.QTimer(self)
+        self._registration_timer.setSingleShot(True)
+        self._registration_timer.timeout.connect(self.end_registration)
 
     def _on_parent_resized(self):
         """
@@ -174,6 +185,7 @@ class CommandPanel(QtGui.QWidget):
 
         self._command_info = {}
         self._recents = {}
+        self.end_registration()
 
     def _update_recents_list(self, command_name):
         """
@@ -218,6 +230,7 @@ class CommandPanel(QtGui.QWidget):
             command["tooltip"],
             timestamp,
         )
+        self._recents_widget.set_command_enabled(command_name, command["is_enabled"])
 
     def add_command(
         self,
@@ -228,6 +241,7 @@ class CommandPanel(QtGui.QWidget):
         tooltip,
         groups,
         is_menu_default=False,
+        is_enabled=True,
     ):
         """
         Add a command to the panel.
@@ -240,12 +254,20 @@ class CommandPanel(QtGui.QWidget):
         :param list(str) groups: List of groups this command should be added to.
         :param bool is_menu_default: If True, this command will be the default
             command of it's group.
+        :param bool is_enabled: If False, the command is displayed but can't be
+            launched until ``set_command_enabled`` is called.
         """
         for group_name in groups:
             # Search for the requested group.
             current_group = self._find_or_insert_section(group_name)
             current_group.add_command(
-                command_name, button_name, menu_name, icon, tooltip, is_menu_default
+                command_name,
+                button_name,
+                menu_name,
+                icon,
+                tooltip,
+                is_menu_default,
+                is_enabled,
             )
             # Caches information about the command so that if we need to show a recent
             # button for it we have it at the ready instead of retrieving it from the
@@ -256,11 +278,91 @@ class CommandPanel(QtGui.QWidget):
                 "menu_name": menu_name or button_name,
                 "icon": icon,
                 "tooltip": tooltip,
+                "is_enabled": is_enabled,
             }
         if self._show_recents and command_name in self._recents:
             self._refresh_recent_list(command_name)
 
+        # While updating, the widths are restricted once when the update ends.
+        if not self._update_depth:
+            self._restrict_children()
+
+    def add_commands(self, commands):
+        """
+        Add many commands to the panel, laying out each section once.
+
+        :param commands: Iterable of tuples with the arguments of ``add_command``.
+        """
+        self.begin_update()
+        try:
+            for command in commands:
+                self.add_command(*command)
+        finally:
+            self.end_update()
+
+    def begin_update(self):
+        """
+        Suspends painting and laying out the sections until the matching
+        ``end_update`` call, so commands can be added in bulk. Calls can be nested.
+        """
+        self._update_depth += 1
+        if self._update_depth > 1:
+            return
+        self.setUpdatesEnabled(False)
+        for section in self.sections:
+            section.begin_update()
+
+    def end_update(self):
+        """
+        Lays out the sections once all the ``begin_update`` calls have been
+        matched.
+        """
+        self._update_depth -= 1
+        if self._update_depth > 0:
+            return
+        for section in self.sections:
+            section.end_update()
         self._restrict_children()
+        self.setUpdatesEnabled(True)
+
+    def begin_registration(self):
+        """
+        Suspends painting and laying out the panel while a project registers its
+        commands, until ``end_registration`` is called or ``REGISTRATION_TIMEOUT``
+        milliseconds have passed.
+        """
+        if self._is_registering:
+            return
+        self._is_registering = True
+        self.begin_update()
+        self._registration_timer.start(self.REGISTRATION_TIMEOUT)
+
+    def end_registration(self):
+        """
+        Lays out and paints the commands registered since ``begin_registration``
+        was called.
+        """
+        if not self._is_registering:
+            return
+        self._is_registering = False
+        self._registration_timer.stop()
+        self.end_update()
+
+    def set_command_enabled(self, command_name, is_enabled):
+        """
+        Enable or disable a command that was previously added to the panel.
+
+        :param str command_name: Name of the command.
+        :param bool is_enabled: If True, the command can be launched.
+        """
+        if command_name not in self._command_info:
+            return
+
+        self._command_info[command_name]["is_enabled"] = is_enabled
+        for section in self.sections:
+            section.set_command_enabled(command_name, is_enabled)
+        if self._recents_widget:
+            self._recents_widget.set_command_enabled(command_name, is_enabled)
 
     @property
     def sections(self):
@@ -337,6 +439,8 @@ class CommandPanel(QtGui.QWidget):
         new_group.set_expanded(self._expanded_state.get(new_group.name.upper(), True))
         new_group.command_triggered.connect(self.command_triggered)
         new_group.expand_toggled.connect(self._update_expanded_state)
+        if self._update_depth:
+            new_group.begin_update()
         self._layout.insertWidget(
             insert_position + first_group_index, new_group, alignment=QtCore.Qt.AlignTop
         )
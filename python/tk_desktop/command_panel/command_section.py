@@ -15,6 +15,9 @@ from .command_list import CommandList
 class CommandSection(Section):
     """
     Implement the section that contains a list of "CommandButton"s.
+
+    The buttons of a collapsed section are only created when it is first
+    expanded. Until then, the commands added to it are kept aside.
     """
 
     def __init__(self, name):
@@ -22,9 +25,74 @@ class CommandSection(Section):
         :param str name: Name of the section.
         """
         super().__init__(name, CommandList)
+        # Arguments of the commands added to the list once the section is
+        # expanded, or None once it has been.
+        self._pending_commands = []
+        # True between begin_update and end_update.
+        self._is_updating = False
+
+    def begin_update(self):
+        """
+        Defers laying out the buttons until ``end_update`` is called.
+        """
+        self._is_updating = True
+        self._list.begin_update()
+
+    def end_update(self):
+        """
+        Lays out the buttons added since ``begin_update`` was called.
+        """
+        self._is_updating = False
+        self._list.end_update()
+
+    def set_expanded(self, checked):
+        """
+        Expand or collapse the group, creating the buttons the first time it is
+        expanded.
+
+        :param bool checked: If True, expands the group, collapses it otherwise.
+        """
+        if checked:
+            self._create_buttons()
+        super().set_expanded(checked)
+
+    def _create_buttons(self):
+        """
+        Adds the commands kept aside while the section was collapsed to the list.
+        """
+        commands, self._pending_commands = self._pending_commands, None
+        if not commands:
+            return
+        self._list.begin_update()
+        for command in commands:
+            self._list.add_command(*command)
+        # While updating, the buttons are laid out when the update ends.
+        if not self._is_updating:
+            self._list.end_update()
+
+    def set_command_enabled(self, command_name, is_enabled):
+        """
+        Enable or disable a command in this section.
+
+        :param str command_name: Name of the command.
+        :param bool is_enabled: If True, the command can be launched.
+        """
+        if self._pending_commands is None:
+            self._list.set_command_enabled(command_name, is_enabled)
+            return
+        for command in self._pending_commands:
+            if command[0] == command_name:
+                command[-1] = is_enabled
 
     def add_command(
-        self, command_name, button_name, menu_name, icon, tooltip, is_menu_default
+        self,
+        command_name,
+        button_name,
+        menu_name,
+        icon,
+        tooltip,
+        is_menu_default,
+        is_enabled=True,
     ):
         """
         Add a command to the panel.
@@ -37,7 +105,19 @@ class CommandSection(Section):
         :param list(str) groups: List of groups this command should be added to.
         :param bool is_menu_default: If True, this command will be the default
             command of it's group.
+        :param bool is_enabled: If False, the command can't be launched yet.
         """
-        self._list.add_command(
-            command_name, button_name, menu_name, icon, tooltip, is_menu_default
-        )
+        command = [
+            command_name,
+            button_name,
+            menu_name,
+            icon,
+            tooltip,
+            is_menu_default,
+            is_enabled,
+        ]
+        if self._pending_commands is not None and not self.is_expanded():
+            self._pending_commands.append(command)
+        else:
+            self._create_buttons()
+            self._list.add_command(*command)
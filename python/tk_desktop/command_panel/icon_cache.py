@@ -0,0 +1,373 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Command icons shared by the whole process, so an icon file is only decoded once no
+matter how many buttons, recents and menu actions display it.
+
+Icon files are checked and decoded in background threads, since they can live on
+slow network storage.
+"""
+
+import collections
+import concurrent.futures
+import os
+import time
+
+from sgtk.platform.qt import QtGui, QtCore
+from sgtk import LogManager
+
+from .shared import ICON_SIZE
+
+logger = LogManager.get_logger(__name__)
+
+
+def _load_images(path, mtime, sizes):
+    """
+    Decodes an icon file at the given sizes. Runs in a background thread.
+
+    :param str path: Path to the icon file.
+    :param mtime: Modification time of the cached icon, or None if it isn't cached.
+    :param sizes: List of ``QSize`` to scale the icon to.
+
+    :returns: Tuple of the modification time of the file and the ``QImage`` objects
+        by size, which are ``None`` if the file is unchanged or can't be decoded. The
+        modification time is ``None`` if the file doesn't exist.
+    """
+    try:
+        current_mtime = os.path.getmtime(path)
+    except (IOError, OSError):
+        return None, None
+    if current_mtime == mtime:
+        return current_mtime, None
+
+    image = QtGui.QImage(path)
+    if image.isNull():
+        return current_mtime, None
+    images = {}
+    for size in sizes:
+        # Like QIcon.pixmap, images are only ever scaled down.
+        if image.width() > size.width() or image.height() > size.height():
+            scaled = image.scaled(
+                size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation
+            )
+        else:
+            scaled = image
+        images[(size.width(), size.height())] = scaled
+    return current_mtime, images
+
+
+class IconCache(QtCore.QObject):
+    """
+    Least recently used cache of icons by path, bounded by the memory used by their
+    pixmaps.
+
+    The pixmaps are rendered when an icon is loaded, at the size of the buttons, of
+    the menu entries and at twice the size of the buttons for high resolution
+    screens. Until an icon is loaded, a transparent placeholder is returned and
+    ``icon_loaded`` is emitted once it is. Loaded icons are checked for
+    modifications every ``REVALIDATE_INTERVAL`` seconds, and missing icons are not
+    checked again for ``MISSING_INTERVAL`` seconds.
+    """
+
+    # Default number of bytes the pixmaps can use.
+    DEFAULT_BUDGET = 16 * 1024 * 1024
+    # Number of icon files checked and decoded at the same time.
+    MAX_THREADS = 2
+    # Number of seconds before a loaded icon is checked for modifications.
+    REVALIDATE_INTERVAL = 60
+    # Number of seconds before a missing icon is checked again.
+    MISSING_INTERVAL = 10 * 60
+
+    # Emitted with the path of an icon once it is loaded or modified.
+    icon_loaded = QtCore.Signal(str)
+    # Emitted from the background threads with the results of a load.
+    _images_loaded = QtCore.Signal(str, object, object)
+
+    def __init__(self, budget=DEFAULT_BUDGET, max_threads=MAX_THREADS, parent=None):
+        """
+        :param int budget: Number of bytes the pixmaps can use.
+        :param int max_threads: Number of icon files loaded at the same time.
+        :param parent: Parent of this Qt object.
+        """
+        super().__init__(parent)
+        self._budget = budget
+        self._cost = 0
+        # (modification time, QIcon, pixmaps by size, time checked) lists by path.
+        self._entries = collections.OrderedDict()
+        # Time the missing icons were checked, by path.
+        self._missing = {}
+        # Paths of the icons being loaded.
+        self._pending = set()
+        self._placeholders = {}
+        self._menu_icon_size = None
+
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_threads, thread_name_prefix="IconCache"
+        )
+        # Queued, so the results are handled in the thread of the cache.
+        self._images_loaded.connect(self._on_images_loaded, QtCore.Qt.QueuedConnection)
+        app = QtCore.QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shut_down)
+
+    @property
+    def cost(self):
+        """
+        Number of bytes used by the cached pixmaps.
+        """
+        return self._cost
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def sizes(self):
+        """
+        Sizes the pixmaps are rendered at.
+        """
+        if self._menu_icon_size is None:
+            # Only known once the application is created.
+            extent = QtGui.QApplication.style().pixelMetric(
+                QtGui.QStyle.PM_SmallIconSize
+            )
+            self._menu_icon_size = QtCore.QSize(extent, extent)
+        return [ICON_SIZE, self._menu_icon_size, ICON_SIZE * 2]
+
+    def is_loaded(self, path):
+        """
+        :returns: True if the icon is loaded, False if it is still loading or
+            missing.
+        """
+        return path in self._entries
+
+    def get_icon(self, path):
+        """
+        :param str path: Path to the icon file.
+
+        :returns: The ``QIcon`` of the file, or a placeholder until it is loaded.
+        """
+        entry = self._get_entry(path)
+        if entry is None:
+            return QtGui.QIcon(self._get_placeholder(ICON_SIZE))
+        return entry[1]
+
+    def get_pixmap(self, path, size=ICON_SIZE):
+        """
+        :param str path: Path to the icon file.
+        :param size: ``QSize`` of the pixmap.
+
+        :returns: The ``QPixmap`` of the icon at the given size, or a placeholder
+            until it is loaded.
+        """
+        entry = self._get_entry(path)
+        if entry is None:
+            return self._get_placeholder(size)
+        key = (size.width(), size.height())
+        if key not in entry[2]:
+            # Not one of the sizes rendered up front. QIcon caches it anyway.
+            return entry[1].pixmap(size)
+        return entry[2][key]
+
+    def clear(self):
+        """
+        Removes all the icons.
+        """
+        self._entries.clear()
+        self._missing.clear()
+        self._cost = 0
+
+    def shut_down(self):
+        """
+        Stops the background threads. Loads in progress are not reported.
+        """
+        self._executor.shutdown(wait=False)
+        self._pending.clear()
+
+    def _get_entry(self, path):
+        """
+        :returns: The cache entry of an icon, or None if it isn't loaded. It is
+            loaded or revalidated in the background if needed.
+        """
+        if not path:
+            return None
+
+        now = time.time()
+        entry = self._entries.get(path)
+        if entry is not None:
+            self._entries.move_to_end(path)
+            if now - entry[3] > self.REVALIDATE_INTERVAL:
+                entry[3] = now
+                self._load(path, entry[0])
+            return entry
+
+        missing_since = self._missing.get(path)
+        if missing_since is None or now - missing_since > self.MISSING_INTERVAL:
+            self._load(path, None)
+        return None
+
+    def _load(self, path, mtime):
+        """
+        Loads an icon in the background, unless it is already being loaded.
+        """
+        if path in self._pending:
+            return
+        try:
+            future = self._executor.submit(_load_images, path, mtime, self.sizes)
+        except RuntimeError:
+            # The cache was shut down.
+            return
+        self._pending.add(path)
+        future.add_done_callback(lambda future: self._on_load_done(path, future))
+
+    def _on_load_done(self, path, future):
+        """
+        Called in the background thread once a load is over.
+        """
+        try:
+            mtime, images = future.result()
+        except Exception as e:
+            logger.debug("Could not load icon '%s': %s", path, e)
+            mtime, images = None, None
+        self._images_loaded.emit(path, mtime, images)
+
+    def _on_images_loaded(self, path, mtime, images):
+        """
+        Called in the thread of the cache with the results of a load.
+        """
+        if path not in self._pending:
+            # The cache was shut down.
+            return
+        self._pending.discard(path)
+
+        if mtime is None:
+            if path not in self._missing:
+                logger.error("Icon not found: '%s'" % path)
+            self._missing[path] = time.time()
+            self._remove(path)
+            return
+        self._missing.pop(path, None)
+
+        if images is None:
+            # Unchanged, or not an image, in which case it is not retried.
+            if path not in self._entries:
+                logger.debug("Could not decode icon '%s'", path)
+                self._missing[path] = time.time()
+            return
+
+        icon = QtGui.QIcon()
+        pixmaps = {}
+        for key, image in images.items():
+            pixmaps[key] = QtGui.QPixmap.fromImage(image)
+            icon.addPixmap(pixmaps[key])
+        self._remove(path)
+        entry = [mtime, icon, pixmaps, time.time()]
+        self._entries[path] = entry
+        self._cost += self._get_cost(entry)
+        while self._cost > self._budget and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self._cost -= self._get_cost(evicted)
+
+        self.icon_loaded.emit(path)
+
+    def _remove(self, path):
+        entry = self._entries.pop(path, None)
+        if entry is not None:
+            self._cost -= self._get_cost(entry)
+
+    def _get_placeholder(self, size):
+        """
+        :returns: A transparent ``QPixmap`` of the given size, so buttons don't
+            change size once their icon is loaded.
+        """
+        key = (size.width(), size.height())
+        if key not in self._placeholders:
+            pixmap = QtGui.QPixmap(size)
+            pixmap.fill(QtCore.Qt.transparent)
+            self._placeholders[key] = pixmap
+        return self._placeholders[key]
+
+    @staticmethod
+    def _get_cost(entry):
+        return sum(
+            pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+            for pixmap in entry[2].values()
+        )
+
+
+class IconUpdater(QtCore.QObject):
+    """
+    Displays an icon on a widget or an action right away, and again once it is
+    loaded or modified.
+    """
+
+    def __init__(self, parent, update_func):
+        """
+        :param parent: Widget or action displaying the icon. The updater is
+            destroyed with it.
+        :param update_func: Callable taking the path of the icon, which displays it
+            with :func:`get_icon` or :func:`get_pixmap`.
+        """
+        super().__init__(parent)
+        self._path = None
+        self._update_func = update_func
+        get_icon_cache().icon_loaded.connect(self._on_icon_loaded)
+
+    def set_path(self, path):
+        """
+        Displays an icon.
+
+        :param str path: Path to the icon file.
+        """
+        self._path = path
+        self._update_func(path)
+
+    def _on_icon_loaded(self, path):
+        if path == self._path:
+            self._update_func(path)
+
+
+_icon_cache = None
+
+
+def get_icon_cache():
+    """
+    :returns: The :class:`IconCache` shared by the process.
+    """
+    global _icon_cache
+    if _icon_cache is None:
+        _icon_cache = IconCache()
+    return _icon_cache
+
+
+def get_icon(icon):
+    """
+    :param icon: ``QIcon``, path to an icon file or ``None``.
+
+    :returns: The ``QIcon``, from the shared cache for paths.
+    """
+    if icon is None:
+        return QtGui.QIcon()
+    if isinstance(icon, QtGui.QIcon):
+        return icon
+    return get_icon_cache().get_icon(icon)
+
+
+def get_pixmap(icon, size=ICON_SIZE):
+    """
+    :param icon: ``QIcon``, path to an icon file or ``None``.
+    :param size: ``QSize`` of the pixmap.
+
+    :returns: The ``QPixmap`` of the icon at the given size, from the shared cache
+        for paths.
+    """
+    if icon is None or isinstance(icon, QtGui.QIcon):
+        return get_icon(icon).pixmap(size)
+    return get_icon_cache().get_pixmap(icon, size)
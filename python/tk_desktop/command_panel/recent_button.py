@@ -11,6 +11,7 @@
 from sgtk.platform.qt import QtGui, QtCore
 
 from .shared import ICON_SIZE, BUTTON_STYLE, MAX_RECENTS
+from .icon_cache import IconUpdater, get_pixmap
 
 
 class RecentButton(QtGui.QPushButton):
@@ -66,10 +67,11 @@ class RecentButton(QtGui.QPushButton):
         self.setStyleSheet(BUTTON_STYLE)
 
         self.text_label.setText(button_name)
-        if icon is None:
-            self.icon_label.setPixmap(QtGui.QIcon().pixmap(ICON_SIZE))
-        else:
-            self.icon_label.setPixmap(QtGui.QIcon(icon).pixmap(ICON_SIZE))
+        # Icons are displayed once they are loaded in the background.
+        self._icon_updater = IconUpdater(
+            self, lambda path: self.icon_label.setPixmap(get_pixmap(path, ICON_SIZE))
+        )
+        self._icon_updater.set_path(icon)
 
         self.setToolTip(tooltip)
 
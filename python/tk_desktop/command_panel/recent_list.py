@@ -83,6 +83,17 @@ class RecentList(BaseIconList):
             if widget:
                 widget.deleteLater()
 
+    def set_command_enabled(self, command_name, is_enabled):
+        """
+        Enable or disable the recent button of a command.
+
+        :param str command_name: Name of the command.
+        :param bool is_enabled: If ``True``, the command can be launched.
+        """
+        for button in self.buttons:
+            if button.command_name == command_name:
+                button.setEnabled(is_enabled)
+
     @property
     def buttons(self):
         """
@@ -92,6 +92,15 @@ class Section(QtGui.QWidget):
         self._list.setVisible(checked)
         self.expand_toggled.emit(self._name, checked)
 
+    def set_command_enabled(self, command_name, is_enabled):
+        """
+        Enable or disable a command in this section.
+
+        :param str command_name: Name of the command.
+        :param bool is_enabled: If True, the command can be launched.
+        """
+        self._list.set_command_enabled(command_name, is_enabled)
+
     @property
     def buttons(self):
         """
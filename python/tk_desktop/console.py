@@ -18,6 +18,8 @@ from .ui import resources_rc  # noqa
 
 settings = sgtk.platform.import_framework("tk-framework-shotgunutils", "settings")
 
+logger = sgtk.platform.get_logger(__name__)
+
 
 COLOR_MAP = {
     # colors from the Tomorrow Night Eighties theme
@@ -104,11 +106,20 @@ class Console(QtGui.QDialog):
         menu = self.__logs.createStandardContextMenu()
         clear_action = menu.addAction("Clear")
         clear_action.triggered.connect(self.clear)
+        resources_action = menu.addAction("Show Background Process Resources")
+        resources_action.triggered.connect(self.show_background_process_resources)
         close_action = menu.addAction("Close")
         close_action.triggered.connect(self.close)
 
         menu.exec_(self.__logs.mapToGlobal(point))
 
+    def show_background_process_resources(self):
+        """
+        Logs the resources used by the project background process.
+        """
+        monitor = sgtk.platform.current_engine().site_comm.resource_monitor
+        logger.info(monitor.format_summary())
+
     def append_text(self, text, force_show=False):
         self.__logs.appendHtml(text)
         cursor = self.__logs.textCursor()
@@ -15,7 +15,6 @@ Flow Production Tracking project-level engine implementation.
 import time
 import os
 import sys
-import fnmatch
 import traceback
 import threading
 
@@ -23,6 +22,7 @@ from sgtk import LogManager
 import sgtk
 
 from .project_communication import ProjectCommunication
+from .command_groups import CommandGroups
 from .extensions import osutils
 
 logger = LogManager.get_logger(__name__)
@@ -42,6 +42,8 @@ class DesktopEngineProjectImplementation(object):
         self._project_comm.set_engine(engine)
         self.__callback_map = {}
         self._lock = threading.Lock()
+        # Compiled from the groups setting once the engine has started.
+        self._command_groups = None
 
     def post_app_init(self):
         """
@@ -124,8 +126,10 @@ class DesktopEngineProjectImplementation(object):
     def _register_groups(self):
         # get the list of configured groups
         # add the default group in if it isn't already in the list.
-        groups = [g["name"] for g in self._engine.get_setting("groups", [])]
-        default_group = self._engine.get_setting("default_group", [])
+        groups_setting = self._engine.get_setting("groups", [])
+        default_group = self._engine.get_setting("default_group", "Studio")
+        self._command_groups = CommandGroups(groups_setting, default_group)
+        groups = [g["name"] for g in groups_setting]
         if default_group not in groups:
             groups.insert(0, default_group)
 
@@ -467,18 +471,6 @@ class DesktopEngineProjectImplementation(object):
     def _get_groups(self, name, properties):
         display_name = properties.get("title", name)
 
-        default_group = self._engine.get_setting("default_group", "Studio")
-        groups = self._engine.get_setting("groups", [])
-
-        matches = []
-        for group in groups:
-            for match in group["matches"]:
-                if fnmatch.fnmatch(display_name.lower(), match.lower()):
-                    matches.append(group["name"])
-                    break
-
-        if not matches:
-            matches = [default_group]
-
+        matches = self._command_groups.get_groups(display_name)
         logger.debug("'%s' goes in groups: %s" % (display_name, matches))
         return matches
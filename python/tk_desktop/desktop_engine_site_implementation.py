@@ -9,10 +9,8 @@
 # not expressly granted therein are reserved by Shotgun Software Inc.
 
 import os
-import re
 import sys
-import string
-import collections
+import importlib.util
 
 import sgtk
 from tank_vendor.shotgun_authentication import ShotgunAuthenticator, DefaultsManager
@@ -20,6 +18,8 @@ from tank_vendor.shotgun_authentication import ShotgunAuthenticator, DefaultsMan
 from sgtk import LogManager
 
 from .site_communication import SiteCommunication
+from .command_manifest import CommandManifest
+from .collapse_rules import CollapseRules
 
 shotgun_globals = sgtk.platform.import_framework(
     "tk-framework-shotgunutils", "shotgun_globals"
@@ -30,6 +30,9 @@ task_manager = sgtk.platform.import_framework(
 
 logger = LogManager.get_logger(__name__)
 
+# Set this environment variable to launch the background processes from a fork server on Linux.
+FORK_SERVER_ENV_VAR = "SGTK_DESKTOP_FORK_SERVER"
+
 
 class DesktopEngineSiteImplementation(object):
     def __init__(self, engine):
@@ -38,14 +41,37 @@ class DesktopEngineSiteImplementation(object):
         self.site_comm.set_engine(engine)
         self.site_comm.proxy_closing.connect(self._on_proxy_closing)
         self.site_comm.proxy_created.connect(self._on_proxy_created)
+        self.site_comm.resource_monitor.memory_threshold = (
+            engine.get_setting("background_process_memory_warning", 4096) * 1024**2
+            or None
+        )
 
         self._engine = engine
         self.app_version = None
 
         # rules that determine how to collapse commands into buttons
         # each rule is a dictionary with keys for match, button_label, and
-        # menu_label
-        self._collapse_rules = []
+        # menu_label. They are compiled once into a matcher.
+        self._collapse_rules = CollapseRules([])
+
+        # Records the commands registered by the project engine so the command panel
+        # can be drawn from them the next time the project is opened. It is created
+        # once the desktop window exists.
+        self._command_manifest = None
+        # Manifest the command panel was drawn from while the project engine
+        # bootstraps. None when the panel only displays live commands.
+        self._restored_manifest = None
+        # Commands restored from the manifest that the project engine hasn't
+        # registered yet, indexed by command name.
+        self._unconfirmed_commands = {}
+        # Set when the project engine registers something that doesn't match the
+        # restored manifest. The panel is rebuilt once registration is over.
+        self._is_manifest_stale = False
+
+        # Module implementing the fork server, loaded on demand, and the servers
+        # started so far, indexed by interpreter and utilities module.
+        self._fork_server_module = None
+        self._fork_servers = {}
 
         self._task_manager = task_manager.BackgroundTaskManager(parent=None)
         shotgun_globals.register_bg_task_manager(self._task_manager)
@@ -53,6 +79,75 @@ class DesktopEngineSiteImplementation(object):
     def destroy_engine(self):
         shotgun_globals.unregister_bg_task_manager(self._task_manager)
         self.site_comm.shut_down()
+        # Don't leave a background process behind when the app quits.
+        self.site_comm.wait_for_retired_processes()
+        self.site_comm.resource_monitor.stop()
+        for fork_server in self._fork_servers.values():
+            fork_server.shut_down()
+        self._fork_servers = {}
+
+    def launch_forked_python(
+        self, project_python, pickle_data_path, utilities_module_path
+    ):
+        """
+        Launches the background process by forking a server that has already imported
+        Toolkit, instead of starting a new interpreter. This is only available on Linux
+        when the SGTK_DESKTOP_FORK_SERVER environment variable is set.
+
+        The server for an interpreter is started in the background the first time it
+        is needed. Until it has preloaded Toolkit, or when it doesn't reply quickly,
+        processes are launched normally, so opening a project never waits for it.
+
+        :param str project_python: Path to the interpreter of the project.
+        :param str pickle_data_path: Path to the data needed to start the engine.
+        :param str utilities_module_path: Path to the utilities module that can start the engine.
+
+        :returns: A process handle compatible with :class:`subprocess.Popen` or None if
+            the process needs to be launched normally.
+        """
+        if FORK_SERVER_ENV_VAR not in os.environ:
+            return None
+
+        if self._fork_server_module is None:
+            # The fork server ships with the bootstrap utilities, since it runs
+            # in the project's interpreter.
+            spec = importlib.util.spec_from_file_location(
+                "tk_desktop_fork_server",
+                os.path.join(os.path.dirname(utilities_module_path), "fork_server.py"),
+            )
+            self._fork_server_module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(self._fork_server_module)
+
+        fork_server_module = self._fork_server_module
+        if not fork_server_module.is_supported():
+            return None
+
+        key = (project_python, utilities_module_path)
+        fork_server = self._fork_servers.get(key)
+        if fork_server is None:
+            logger.debug("Starting fork server for %s", project_python)
+            fork_server = fork_server_module.ForkServer(
+                project_python, sgtk.get_sgtk_module_path(), utilities_module_path
+            )
+            self._fork_servers[key] = fork_server
+
+        try:
+            process = fork_server.launch(pickle_data_path)
+            if process is None:
+                logger.debug("Fork server for %s is not ready yet.", project_python)
+                return None
+        except (fork_server_module.ForkServerError, OSError, ValueError):
+            logger.warning(
+                "Could not launch the background process from the fork server, "
+                "it will be spawned instead.",
+                exc_info=True,
+            )
+            fork_server.shut_down()
+            del self._fork_servers[key]
+            return None
+
+        logger.debug("Forked background process (pid %s)", process.pid)
+        return process
 
     def set_global_debug(self, state):
         """
@@ -230,6 +325,8 @@ class DesktopEngineSiteImplementation(object):
         """
         Invoked when background process is closing down.
         """
+        self._restored_manifest = None
+        self._unconfirmed_commands = {}
         # Clear the UI, we can't launch anything anymore!
         self.desktop_window.clear_app_uis()
 
@@ -242,19 +339,174 @@ class DesktopEngineSiteImplementation(object):
         # Restart"), it calls destroy_app_proxy which only closes the RPC proxy
         # without emitting proxy_closing - so _on_proxy_closing / clear_app_uis
         # never runs.
-        self.desktop_window.clear_app_uis()
+        if self._restored_manifest is not None:
+            # The command panel displays the commands restored from the manifest,
+            # which are reconciled as the engine registers its own.
+            self.desktop_window.clear_actions_from_project_menu()
+        else:
+            self.desktop_window.clear_app_uis()
+
+        if self._command_manifest is not None:
+            self._command_manifest.reset()
+
+    def restore_command_manifest(
+        self, project, pipeline_configuration_id, descriptor_uri
+    ):
+        """
+        Draws the command panel from the commands registered the last time this
+        project was opened with the same pipeline configuration and descriptor.
+
+        The commands are disabled until the project engine registers them.
+
+        :param dict project: Project entity dictionary being opened.
+        :param int pipeline_configuration_id: Id of the pipeline configuration
+            being loaded, or None.
+        :param str descriptor_uri: Uri of the configuration descriptor.
+        """
+        self._restored_manifest = None
+        self._unconfirmed_commands = {}
+        self._is_manifest_stale = False
+
+        if self._command_manifest is None:
+            return
+
+        self._command_manifest.start_recording(
+            project, pipeline_configuration_id, descriptor_uri
+        )
+
+        manifest = self._command_manifest.load(
+            project, pipeline_configuration_id, descriptor_uri
+        )
+        if manifest is None:
+            return
+
+        logger.debug(
+            "Drawing %d commands from the manifest of project %s.",
+            len(manifest["commands"]),
+            project["id"],
+        )
+        self._restored_manifest = manifest
+        self.desktop_window.set_groups(manifest["groups"], manifest["show_recents"])
+        self._collapse_rules = CollapseRules(manifest["collapse_rules"])
+        commands = []
+        for command in manifest["commands"]:
+            # Context menu actions are only added once the engine is up.
+            if command["properties"].get("type") == "context_menu":
+                continue
+            self._unconfirmed_commands[command["name"]] = (
+                command["properties"],
+                command["groups"],
+            )
+            commands.append((command["name"], command["properties"], command["groups"]))
+        self._add_commands(commands, False)
 
     def set_groups(self, groups, show_recents=True):
+        if self._command_manifest is not None:
+            self._command_manifest.record_groups(groups, show_recents)
+        if self._restored_manifest is not None and (
+            groups != self._restored_manifest["groups"]
+            or show_recents != self._restored_manifest["show_recents"]
+        ):
+            self._is_manifest_stale = True
         self.desktop_window.set_groups(groups, show_recents)
 
     def set_collapse_rules(self, collapse_rules):
-        self._collapse_rules = collapse_rules
+        if self._command_manifest is not None:
+            self._command_manifest.record_collapse_rules(collapse_rules)
+        if (
+            self._restored_manifest is not None
+            and collapse_rules != self._restored_manifest["collapse_rules"]
+        ):
+            self._is_manifest_stale = True
+        self._collapse_rules = CollapseRules(collapse_rules)
 
     def trigger_register_command(self, name, properties, groups):
         """GUI side handler for the add_command call."""
+        logger.debug("register_command(%s, %s)", name, properties)
+
+        if self._command_manifest is not None:
+            self._command_manifest.record_command(name, properties, groups)
+
+        if self._reconcile_command(name, properties, groups):
+            return
+
+        self._add_command(name, properties, groups)
+
+    def _reconcile_command(self, name, properties, groups):
+        """
+        Reconciles a command registered by the project engine with the commands
+        restored from the manifest.
+
+        :returns: True if the command has been taken care of, False if it still
+            needs to be added to the UI.
+        """
+        if self._restored_manifest is None or properties.get("type") == "context_menu":
+            return False
+
+        cached = self._unconfirmed_commands.pop(name, None)
+        if cached is None:
+            # A command the manifest didn't know about, unless the panel is going
+            # to be rebuilt it can simply be added.
+            return self._is_manifest_stale
+
+        if not self._is_manifest_stale and cached == (properties, groups):
+            self.desktop_window.enable_project_command(name)
+            return True
+
+        # The command changed since the manifest was saved, so the panel will be
+        # rebuilt from what the engine registered once registration is over.
+        self._is_manifest_stale = True
+        return True
+
+    def _add_command(self, name, properties, groups, is_enabled=True):
+        """
+        Adds a command to the project menu or the command panel.
+
+        :param str name: Name of the command.
+        :param dict properties: GUI properties of the command.
+        :param list(str) groups: Groups the command belongs to.
+        :param bool is_enabled: If False, the command can't be launched yet.
+        """
+        project_command = self._get_project_command(
+            name, properties, groups, is_enabled
+        )
+        if project_command is not None:
+            self.desktop_window.add_project_command(*project_command)
+
+    def _add_commands(self, commands, is_enabled=True):
+        """
+        Adds commands to the project menu or the command panel, laying out the
+        command panel once.
+
+        :param commands: List of (name, properties, groups) tuples.
+        :param bool is_enabled: If False, the commands can't be launched yet.
+        """
+        project_commands = []
+        for name, properties, groups in commands:
+            project_command = self._get_project_command(
+                name, properties, groups, is_enabled
+            )
+            if project_command is not None:
+                project_commands.append(project_command)
+        if project_commands:
+            self.desktop_window.add_project_commands(project_commands)
+
+    def _get_project_command(self, name, properties, groups, is_enabled):
+        """
+        Adds a context menu command to the project menu, or computes how to display
+        a command in the command panel.
+
+        :param str name: Name of the command.
+        :param dict properties: GUI properties of the command.
+        :param list(str) groups: Groups the command belongs to.
+        :param bool is_enabled: If False, the command can't be launched yet.
+
+        :returns: Tuple of the arguments of ``DesktopWindow.add_project_command``,
+            or None if the command was added to the project menu.
+        """
         from tank.platform.qt import QtGui
 
-        logger.debug("register_command(%s, %s)", name, properties)
+        from .command_panel import IconUpdater, get_icon
 
         command_type = properties.get("type")
         command_icon = properties.get("icon")
@@ -262,15 +514,8 @@ class DesktopEngineSiteImplementation(object):
         command_group = properties.get("group")
         command_is_menu_default = properties.get("group_default") or False
 
-        icon = None
-        if command_icon is not None:
-            # Only register an icon for the command if it exists.
-            if os.path.exists(command_icon):
-                icon = QtGui.QIcon(command_icon)
-            else:
-                logger.error(
-                    "Icon for command '%s' not found: '%s'" % (name, command_icon)
-                )
+        # The icon is checked and loaded in the background, and displayed once it is.
+        icon = command_icon
 
         title = properties.get("title", name)
 
@@ -278,7 +523,10 @@ class DesktopEngineSiteImplementation(object):
             # Add the command to the project menu
             action = QtGui.QAction(self.desktop_window)
             if icon is not None:
-                action.setIcon(icon)
+                updater = IconUpdater(
+                    action, lambda path: action.setIcon(get_icon(path))
+                )
+                updater.set_path(icon)
             if command_tooltip is not None:
                 action.setToolTip(command_tooltip)
             action.setText(title)
@@ -293,6 +541,7 @@ class DesktopEngineSiteImplementation(object):
 
             action.triggered.connect(action_triggered)
             self.desktop_window.add_to_project_menu(action)
+            return None
         else:
             # Default is to add an icon/label for the command
 
@@ -301,36 +550,20 @@ class DesktopEngineSiteImplementation(object):
             # the display name of the command
             menu_name = None
             button_name = title
-            found_collapse_match = False
 
             # First check for collapse rules specified for this title in the desktop
             # configuration. These take precedence over the group property.
-            for collapse_rule in self._collapse_rules:
-                template = DisplayNameTemplate(collapse_rule["match"])
-                match = template.match(title)
-                if match is not None:
-                    logger.debug(
-                        "matching %s against %s" % (title, collapse_rule["match"])
-                    )
-                    if collapse_rule["menu_label"] == "None":
-                        menu_name = None
-                    else:
-                        menu_name = string.Template(
-                            collapse_rule["menu_label"]
-                        ).safe_substitute(match)
-                    button_name = string.Template(
-                        collapse_rule["button_label"]
-                    ).safe_substitute(match)
-                    found_collapse_match = True
-                    break
+            match = self._collapse_rules.match(title)
+            if match is not None:
+                button_name, menu_name = match
 
             # If no collapse rules were found for this title, and the group property is
             # not empty, treat the specified group as if it were a collapse rule.
-            if not found_collapse_match and command_group:
+            elif command_group:
                 button_name = command_group
                 menu_name = title
 
-            self.desktop_window.add_project_command(
+            return (
                 name,
                 button_name,
                 menu_name,
@@ -338,15 +571,46 @@ class DesktopEngineSiteImplementation(object):
                 command_tooltip,
                 groups,
                 command_is_menu_default,
+                is_enabled,
             )
 
     def project_commands_finished(self):
         """
         Invoked when all commands found for a project have been registered.
         """
+        if self._command_manifest is not None:
+            self._command_manifest.save()
+
+        if self._restored_manifest is not None:
+            if self._is_manifest_stale or self._unconfirmed_commands:
+                self._rebuild_project_commands()
+            self._restored_manifest = None
+            self._unconfirmed_commands = {}
+
         # Let the desktop window know all commands for the project have been registered.
         self.desktop_window.on_project_commands_finished()
 
+    def _rebuild_project_commands(self):
+        """
+        Redraws the command panel from the commands the project engine registered,
+        discarding what was restored from the manifest.
+        """
+        logger.debug("Manifest is out of date, rebuilding the command panel.")
+        self.desktop_window.reset_project_commands()
+        self.desktop_window.set_groups(
+            self._command_manifest.groups, self._command_manifest.show_recents
+        )
+        if self._command_manifest.collapse_rules != self._collapse_rules.rules:
+            self._collapse_rules = CollapseRules(self._command_manifest.collapse_rules)
+        # Context menu actions have already been added to the project menu.
+        self._add_commands(
+            [
+                (name, properties, groups)
+                for name, properties, groups in self._command_manifest.commands
+                if properties.get("type") != "context_menu"
+            ]
+        )
+
     def _handle_button_command_triggered(self, name):
         """Button clicked from a registered command."""
         self.refresh_user_credentials()
@@ -496,6 +760,9 @@ class DesktopEngineSiteImplementation(object):
 
         # initialize System Tray
         self.desktop_window = desktop_window.DesktopWindow(console)
+        self._command_manifest = CommandManifest(
+            desktop_window.ProjectCommandSettings(self.desktop_window)
+        )
 
         # We need for the dialog to exist for messages to get to the UI console.
         if kwargs.get("server") is not None:
@@ -605,41 +872,3 @@ class DesktopEngineSiteImplementation(object):
             )
 
         return False
-
-
-class KeyedDefaultDict(collections.defaultdict):
-    """
-    Simple class to provide a dictionary whose default value for a key is a
-    function of that key.
-    """
-
-    def __missing__(self, key):
-        # call the default factory with the key as an argument
-        ret = self[key] = self.default_factory(key)
-        return ret
-
-
-class DisplayNameTemplate(string.Template):
-    def __init__(self, template):
-        # since the template is going to be used as a regex, escape everything
-        # except $ so that it isn't interpreted as part of the re we are building
-        template = re.escape(template).replace("\\$", "$")
-        string.Template.__init__(self, template)
-
-        # do a substitution where we build a regular expression with a group
-        # for each dollar var we match, substitute in a group named after
-        # the variable that will match any non-whitespace characters
-        default_kwargs = KeyedDefaultDict(lambda k: r"(?P<%s>\S+)" % k)
-        self.match_re = re.compile(self.safe_substitute(default_kwargs))
-
-    def match(self, match_string):
-        """
-        Given a string, if the string matches the template, return a dictionary
-        where each key:value represents a substitution from the variables that
-        matched the template.  If the string does not match the template, returns
-        None.
-        """
-        match = self.match_re.match(match_string)
-        if match:
-            return match.groupdict()
-        return None
@@ -17,6 +17,7 @@ import subprocess
 import pprint
 import inspect
 import re
+import threading
 from collections import OrderedDict
 
 
@@ -42,12 +43,16 @@ from .setup_new_os import SetupNewOS
 from .project_model import SgProjectModel
 from .project_model import SgProjectModelProxy
 from .project_delegate import SgProjectDelegate
+from .project_painter_delegate import SgProjectPainterDelegate
 from .update_project_config import UpdateProjectConfig
 from .loading_project_widget import LoadingProjectWidget
 from .browser_integration_user_switch_dialog import BrowserIntegrationUserSwitchDialog
 from .banner_widget import BannerWidget
 
 from .project_menu import ProjectMenu
+from .precache_scheduler import PrecacheScheduler
+from .site_capabilities import get_site_capabilities
+from .settings_writer import SettingsWriter
 from .command_panel import CommandPanel
 from . import rpc
 
@@ -144,12 +149,13 @@ class ProjectCommandSettings(object):
 
     def save(self, key, value):
         """
-        Save key/value pair into persistent storage.
+        Save key/value pair into persistent storage. The value is written in the
+        background.
 
         :param str key: Name of the setting to save.
         :param dict value: Value of the setting to save.
         """
-        self._dlg._save_setting(key, value, site_specific=True)
+        self._dlg._settings_writer.write(key, value)
 
     def load(self, key):
         """
@@ -157,7 +163,11 @@ class ProjectCommandSettings(object):
 
         :returns: Dict of the value or an empty dict if missing.
         """
-        return self._dlg._load_setting(key, None, True) or {}
+        # The last value saved may not have been written yet.
+        value = self._dlg._settings_writer.get(key)
+        if value is None:
+            value = self._dlg._load_setting(key, None, True)
+        return value or {}
 
 
 class DesktopWindow(SystrayWindow):
@@ -169,6 +179,8 @@ class DesktopWindow(SystrayWindow):
     _LAUNCHING_PYTHON_RATIO = 0.95
     _CHROME_SUPPORT_URL = "https://developer.shotgridsoftware.com/95518180"
     _FIREFOX_SUPPORT_URL = "https://developer.shotgridsoftware.com/d4936105"
+    # Number of milliseconds to wait after a keystroke before searching projects.
+    _SEARCH_DELAY = 100
 
     def __init__(self, console, parent=None):
         SystrayWindow.__init__(self, parent)
@@ -177,6 +189,12 @@ class DesktopWindow(SystrayWindow):
         self.current_project = None
         self.__activation_hotkey = None
         self._settings_manager = settings.UserSettings(sgtk.platform.current_bundle())
+        # The project command settings change on every click, so they are written
+        # in the background, with a settings object per thread.
+        self._settings_bundle = sgtk.platform.current_bundle()
+        self._thread_settings = threading.local()
+        self._settings_writer = SettingsWriter(self._store_site_setting)
+        self._settings_writer.start()
 
         self._app_icon = QtGui.QIcon(sgtk.platform.current_engine().icon_256)
         self._is_quitting = False
@@ -326,7 +344,11 @@ class DesktopWindow(SystrayWindow):
         self._project_command_count = 0
 
         # load and initialize cached projects
-        self._project_model = SgProjectModel(self, self.ui.projects)
+        self._project_model = SgProjectModel(
+            self,
+            self.ui.projects,
+            delta_sync=engine.get_setting("project_delta_sync", False),
+        )
         self._project_proxy = SgProjectModelProxy(self)
 
         # hook up sorting/filtering GUI
@@ -334,11 +356,24 @@ class DesktopWindow(SystrayWindow):
         self._project_proxy.sort(0)
         self.ui.projects.setModel(self._project_proxy)
 
-        # tell our project view to use a custom delegate to produce widgets
-        self._project_delegate = SgProjectDelegate(
-            self.ui.projects, QtCore.QSize(130, 150)
+        # tell our project view to use a custom delegate to produce widgets, or to
+        # paint the projects directly for large numbers of projects.
+        if engine.get_setting("paint_project_grid", False):
+            delegate_class = SgProjectPainterDelegate
+        else:
+            delegate_class = SgProjectDelegate
+        self._project_delegate = delegate_class(
+            self.ui.projects,
+            QtCore.QSize(130, 150),
+            thumbnail_images=self._project_model.thumbnail_images,
         )
         self.ui.projects.setItemDelegate(self._project_delegate)
+        self._project_model.thumbnail_updated.connect(
+            self._project_delegate.cache_thumbnail
+        )
+        self._project_model.modelAboutToBeReset.connect(
+            self._project_delegate.cancel_thumbnail_loading
+        )
 
         # handle project selection change
         self._project_selection_model = self.ui.projects.selectionModel()
@@ -357,6 +392,11 @@ class DesktopWindow(SystrayWindow):
         self._search_x_icon = QtGui.QIcon(":/tk-desktop/icon_inbox_clear.png")
         self._search_magnifier_icon = QtGui.QIcon(":/tk-desktop/search_transparent.png")
         self.ui.search_button.clicked.connect(self.search_button_clicked)
+        # Searching waits for the user to stop typing.
+        self._search_timer = QtCore.QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self._SEARCH_DELAY)
+        self._search_timer.timeout.connect(self._apply_search_text)
         self.ui.search_text.textChanged.connect(self.search_text_changed)
         self.search_button_clicked()
 
@@ -388,6 +428,17 @@ class DesktopWindow(SystrayWindow):
         # Flag indicating if we are currently handling a switch user request from the browser integration.
         self._is_handling_switch_request = False
 
+        # Caches the favourite and recent projects while the app is idle. Loading the
+        # settings below will suspend it if a project gets opened.
+        self._precache_scheduler = PrecacheScheduler(
+            self._get_projects,
+            self._create_precache_manager,
+            ProjectCommandSettings(self),
+            engine.get_setting("precache_project_count", 0),
+            parent=self,
+        )
+        self._precache_scheduler.start()
+
         # Do not put anything after this line, this can kick-off a Python process launch, which should
         # be done only when the dialog is fully initialized.
         self._load_settings()
@@ -526,6 +577,17 @@ class DesktopWindow(SystrayWindow):
         else:
             self._settings_manager.store(key, value)
 
+    def _store_site_setting(self, key, value):
+        """
+        Stores a site setting for the settings writer, which can call it from any
+        thread.
+        """
+        manager = getattr(self._thread_settings, "manager", None)
+        if manager is None:
+            manager = settings.UserSettings(self._settings_bundle)
+            self._thread_settings.manager = manager
+        manager.store(key, value, manager.SCOPE_SITE)
+
     def _load_setting(self, key, default_value, site_specific):
         if site_specific:
             ret = self._settings_manager.retrieve(
@@ -813,6 +875,10 @@ class DesktopWindow(SystrayWindow):
         # disconnect from the current project
         engine.site_comm.shut_down()
 
+        self._precache_scheduler.stop()
+        self._project_model.destroy()
+        self._settings_writer.stop(timeout=1)
+
         self._save_setting("pos", self.pos(), site_specific=True)
 
         self.close()
@@ -830,7 +896,7 @@ class DesktopWindow(SystrayWindow):
         if modifiers == QtCore.Qt.ShiftModifier:
             self._project_model.hard_refresh()
         else:
-            self._project_model._refresh_data()
+            self._project_model.refresh_projects()
 
     def handle_advanced_project_setup_action(self):
         """
@@ -896,7 +962,19 @@ class DesktopWindow(SystrayWindow):
         self.ui.search_frame.update()
 
     def search_text_changed(self, text):
-        self._project_proxy.search_text = text
+        if text:
+            # Restarts the timer if the user is still typing.
+            self._search_timer.start()
+        else:
+            # Clearing the search is immediate.
+            self._search_timer.stop()
+            self._apply_search_text()
+
+    def _apply_search_text(self):
+        """
+        Filters the projects with the current search text.
+        """
+        self._project_proxy.search_text = self.ui.search_text.text()
 
     def on_project_filesystem_folder_triggered(self):
         engine = sgtk.platform.current_engine()
@@ -920,6 +998,9 @@ class DesktopWindow(SystrayWindow):
             # ignore all errors. ex: using a core that doesn't support metrics
             pass
 
+        # Lay out and paint the commands registered by the project in one pass.
+        self._command_panel.end_registration()
+
         if self._project_command_count == 0:
             # Show the UI that indicates no project commands have been configured
             self.install_apps_widget.build_software_entity_config_widget(
@@ -1209,6 +1290,7 @@ class DesktopWindow(SystrayWindow):
         command_tooltip,
         groups,
         is_menu_default,
+        is_enabled=True,
     ):
         """
         Add a button command to the Project dialog. Keeps a running total of how
@@ -1218,20 +1300,64 @@ class DesktopWindow(SystrayWindow):
         :param str name: The name of the command used for internal tracking
         :param str button_name: The label for the command button.
         :param str menu_name: The label for the command button's drop-down menu item.
-        :param QtGui.QIcon icon: The icon to display for the command button and RECENT item.
+        :param str icon: Path to the icon to display for the command button and RECENT item.
         :param str command_tooltip: A brief summary of what this command does.
         :param list groups: The list of Desktop folder groups this command should appear in.
         :param bool is_menu_default: If this command is a menu item, indicate whether it should
                                      also be run by the command button.
+        :param bool is_enabled: If False, the command is displayed but can't be launched until
+                                ``enable_project_command`` is called.
         """
+        # The panel is laid out and painted once the project has registered all its
+        # commands, instead of after each one.
+        if self._project_command_count == 0:
+            self._command_panel.begin_registration()
         self._command_panel.add_command(
-            name, button_name, menu_name, icon, command_tooltip, groups, is_menu_default
+            name,
+            button_name,
+            menu_name,
+            icon,
+            command_tooltip,
+            groups,
+            is_menu_default,
+            is_enabled,
         )
         self._project_command_count += 1
 
+    def add_project_commands(self, commands):
+        """
+        Add many button commands to the Project dialog, laying out the command panel
+        only once.
+
+        :param commands: List of tuples with the arguments of ``add_project_command``.
+        """
+        self._command_panel.add_commands(commands)
+        self._project_command_count += len(commands)
+
+    def enable_project_command(self, name):
+        """
+        Allows a command previously added as disabled to be launched.
+
+        :param str name: The name of the command used for internal tracking
+        """
+        self._command_panel.set_command_enabled(name, True)
+
+    def reset_project_commands(self):
+        """
+        Removes all the button commands from the Project dialog without touching
+        the rest of the project UI.
+        """
+        self._command_panel.clear()
+        self._project_command_count = 0
+
     def _handle_project_data_changed(self):
         self._project_command_count = 0
         self._project_selection_model.clear()
+        # Lay out the project names before the view asks for the size of each one.
+        self._project_delegate.precompute_size_hints(
+            self._project_model.item(row, 0).data(SgProjectModel.DISPLAY_NAME_ROLE)
+            for row in range(self._project_model.rowCount())
+        )
         self._project_proxy.invalidate()
         self._project_proxy.sort(0)
 
@@ -1262,6 +1388,9 @@ class DesktopWindow(SystrayWindow):
 
         self.slide_view(self.ui.project_browser_page, "left")
 
+        # No project is running anymore, so idle time can be used to cache projects.
+        self._precache_scheduler.resume()
+
         # Validate user identity when returning to projects view
         # This catches user changes after session expiry
         self._validate_current_user()
@@ -1408,18 +1537,6 @@ class DesktopWindow(SystrayWindow):
         """
         return pc["name"] == constants.PRIMARY_PIPELINE_CONFIG_NAME
 
-    def __get_server_version(self, connection):
-        """
-        Retrieves the server version from the connection.
-
-        :param connection: Shotgun connection we want the server version from.
-        :returns: Tuple of (major, minor, patch) versions.
-        """
-        sg_major_ver = connection.server_info["version"][0]
-        sg_minor_ver = connection.server_info["version"][1]
-        sg_patch_ver = connection.server_info["version"][2]
-        return sg_major_ver, sg_minor_ver, sg_patch_ver
-
     def engine_startup_error(self, exception_type, exception_str, tb):
         """
         Handle an error starting up the engine for the app proxy.
@@ -1493,6 +1610,8 @@ class DesktopWindow(SystrayWindow):
         engine = sgtk.platform.current_engine()
         engine.site_comm.shut_down()
         self.clear_app_uis()
+        # Don't compete with the project being launched.
+        self._precache_scheduler.suspend()
         # Always hide the Refresh Projects menu item when launching the project engine
         # since no projects will be displayed in the app launcher pane.
         self.ui.actionRefresh_Projects.setVisible(False)
@@ -1521,16 +1640,7 @@ class DesktopWindow(SystrayWindow):
             ############################################################
             # Phase 2: Get information about the pipeline configuration.
 
-            toolkit_manager = ToolkitManager(engine.get_current_user())
-            # We need to cache all environments because we don't know which one the user will require.
-            toolkit_manager.caching_policy = ToolkitManager.CACHE_FULL
-            toolkit_manager.plugin_id = "basic.desktop"
-            toolkit_manager.base_configuration = (
-                "sgtk:descriptor:app_store?name=tk-config-basic"
-            )
-            toolkit_manager.bundle_cache_fallback_paths.extend(
-                engine.sgtk.bundle_cache_fallback_paths
-            )
+            toolkit_manager = self._create_toolkit_manager()
             pipeline_configurations = toolkit_manager.get_pipeline_configurations(
                 project
             )
@@ -1578,7 +1688,7 @@ class DesktopWindow(SystrayWindow):
                 True if pc["project"] else False for pc in pipeline_configurations
             ):
                 # If we have the new FPTR that supports zero config, add the setup project entry in the menu
-                if self.__get_server_version(engine.shotgun) >= (7, 2, 0):
+                if get_site_capabilities().get_server_version() >= (7, 2, 0):
                     self.ui.actionAdvanced_Project_Setup.setVisible(True)
                 else:
                     # Otherwise hide the entry and provide the same old experience as before and quit, as we can't
@@ -1647,6 +1757,49 @@ class DesktopWindow(SystrayWindow):
             self._current_download_thread.download_failed.connect(self._launch_failed)
             self._current_download_thread.start()
 
+    def _create_toolkit_manager(self):
+        """
+        :returns: A ``ToolkitManager`` set up to bootstrap the desktop engine of a project.
+        """
+        engine = sgtk.platform.current_engine()
+        toolkit_manager = ToolkitManager(engine.get_current_user())
+        # We need to cache all environments because we don't know which one the user will require.
+        toolkit_manager.caching_policy = ToolkitManager.CACHE_FULL
+        toolkit_manager.plugin_id = "basic.desktop"
+        toolkit_manager.base_configuration = (
+            "sgtk:descriptor:app_store?name=tk-config-basic"
+        )
+        toolkit_manager.bundle_cache_fallback_paths.extend(
+            engine.sgtk.bundle_cache_fallback_paths
+        )
+        return toolkit_manager
+
+    def _create_precache_manager(self, project):
+        """
+        :param dict project: Project to cache.
+
+        :returns: A ``ToolkitManager`` that caches the pipeline configuration
+            the project was last opened with.
+        """
+        toolkit_manager = self._create_toolkit_manager()
+        toolkit_manager.pipeline_configuration = self._load_setting(
+            "pipeline_configuration_for_project_%d" % project["id"],
+            None,
+            site_specific=True,
+        )
+        return toolkit_manager
+
+    def _get_projects(self):
+        """
+        :returns: The list of projects displayed in the project browser.
+        """
+        projects = []
+        for row in range(self._project_model.rowCount()):
+            project = self._project_model.item(row, 0).data(ShotgunModel.SG_DATA_ROLE)
+            if project is not None:
+                projects.append(project)
+        return projects
+
     def _on_config_downloaded(self, config_descriptor, toolkit_manager):
         """
         Called when a configuration has been synced locally and is ready to be bootstrapped into.
@@ -1762,6 +1915,13 @@ class DesktopWindow(SystrayWindow):
             log.exception("Unexpected error while launching Python:")
             self._launch_failed(str(e))
         else:
+            # While the background process bootstraps, draw the commands that were
+            # registered the last time this configuration was loaded.
+            engine.restore_command_manifest(
+                self.current_project,
+                toolkit_manager.pipeline_configuration,
+                config_descriptor.get_uri(),
+            )
             # and remember what we launched for next time
             self._save_setting(
                 "project_id", self.current_project["id"], site_specific=True
@@ -1927,6 +2087,10 @@ class DesktopWindow(SystrayWindow):
         body = "<center>"
         for name, version in versions.items():
             body += "    {0} {1}<br/>".format(name, version)
+        if engine.site_comm.resource_monitor.latest is not None:
+            body += "<br/>{0}<br/>".format(
+                engine.site_comm.resource_monitor.format_summary()
+            )
         body += "</center>"
 
         about = AboutScreen(parent=self, body=body)
@@ -0,0 +1,275 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Sends the times projects were last accessed to Shotgun in the background, so opening
+a project never waits on the site.
+"""
+
+import collections
+import json
+import os
+import threading
+import time
+
+from sgtk import LogManager
+
+logger = LogManager.get_logger(__name__)
+
+
+class LastAccessedQueue(object):
+    """
+    Write-behind queue of project accesses.
+
+    Accesses are written to a journal on disk and sent from a background thread, so
+    recording one never touches the disk. Accesses to a project that hasn't been sent
+    yet are coalesced into the most recent one. Failed updates are retried with an
+    exponential backoff, and the journal is replayed when the queue is started again
+    after a restart, unless it was written for another site or user.
+    """
+
+    # Number of seconds to wait before retrying after a failure. It doubles after
+    # each consecutive failure.
+    RETRY_DELAY = 5
+    # Maximum number of seconds to wait before retrying.
+    MAX_RETRY_DELAY = 10 * 60
+    # Number of times an access is sent before giving up on it.
+    MAX_ATTEMPTS = 10
+
+    def __init__(
+        self,
+        journal_path,
+        update_func,
+        site=None,
+        user=None,
+        retry_delay=RETRY_DELAY,
+        max_retry_delay=MAX_RETRY_DELAY,
+    ):
+        """
+        :param str journal_path: Path to the file accesses are journaled to.
+        :param update_func: Callable taking a project and a user entity dictionary,
+            which updates the time the user last accessed the project in Shotgun.
+        :param str site: URL of the site the accesses are sent to.
+        :param dict user: User the accesses are sent as. Journaled accesses of other
+            users are dropped, since they can't be sent on their behalf.
+        :param float retry_delay: Number of seconds to wait before retrying after a
+            failure.
+        :param float max_retry_delay: Maximum number of seconds to wait before
+            retrying.
+        """
+        self._journal_path = journal_path
+        self._update_func = update_func
+        self._site = site
+        self._user = self._get_user_entity(user)
+        self._retry_delay = retry_delay
+        self._max_retry_delay = max_retry_delay
+
+        self._lock = threading.Lock()
+        # Held while writing the journal, so the lock isn't held during disk access.
+        self._journal_lock = threading.Lock()
+        self._wake_up = threading.Event()
+        self._thread = None
+        self._is_stopping = False
+        # Accesses waiting to be sent, by project id, oldest first.
+        self._pending = collections.OrderedDict()
+        # True when accesses were recorded since the journal was last written.
+        self._is_journal_dirty = False
+        self._load_journal()
+
+    @staticmethod
+    def _get_user_entity(user):
+        """
+        :returns: The type and id of a user, or None.
+        """
+        return {"type": user["type"], "id": user["id"]} if user else None
+
+    @property
+    def pending_count(self):
+        """
+        Number of projects whose access hasn't been sent yet.
+        """
+        with self._lock:
+            return len(self._pending)
+
+    def record(self, project, user):
+        """
+        Queues an access to a project.
+
+        :param dict project: Project that was accessed.
+        :param dict user: User who accessed it.
+        """
+        entry = {
+            "project": {"type": "Project", "id": project["id"]},
+            "user": self._get_user_entity(user),
+            "timestamp": time.time(),
+            "attempts": 0,
+        }
+        with self._lock:
+            # Coalesce with the access that hasn't been sent yet, if any.
+            self._pending.pop(project["id"], None)
+            self._pending[project["id"]] = entry
+            # The background thread writes the journal.
+            self._is_journal_dirty = True
+        self._wake_up.set()
+
+    def start(self):
+        """
+        Starts sending the accesses, including the ones journaled before a restart.
+        """
+        if self._thread is not None:
+            return
+        self._is_stopping = False
+        self._thread = threading.Thread(
+            target=self._run, name="LastAccessedQueue", daemon=True
+        )
+        self._thread.start()
+        self._wake_up.set()
+
+    def stop(self, timeout=None):
+        """
+        Stops the background thread. Accesses that haven't been sent stay in the
+        journal, which the thread writes before stopping.
+
+        :param float timeout: Number of seconds to wait for an update in progress.
+        """
+        self._is_stopping = True
+        self._wake_up.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def flush(self):
+        """
+        Sends all the pending accesses once.
+
+        :returns: ``True`` if all of them were sent.
+        """
+        with self._lock:
+            entries = list(self._pending.values())
+
+        sent = []
+        failed = []
+        for entry in entries:
+            if self._is_stopping:
+                break
+            try:
+                self._update_func(entry["project"], entry["user"])
+            except Exception as e:
+                logger.debug(
+                    "Could not update last accessed time of project %s: %s",
+                    entry["project"]["id"],
+                    e,
+                )
+                failed.append(entry)
+            else:
+                sent.append(entry)
+
+        with self._lock:
+            for entry in sent:
+                # The project may have been accessed again while sending.
+                if self._pending.get(entry["project"]["id"]) is entry:
+                    del self._pending[entry["project"]["id"]]
+            for entry in failed:
+                entry["attempts"] += 1
+                if entry["attempts"] >= self.MAX_ATTEMPTS:
+                    logger.warning(
+                        "Giving up on updating the last accessed time of project %s.",
+                        entry["project"]["id"],
+                    )
+                    if self._pending.get(entry["project"]["id"]) is entry:
+                        del self._pending[entry["project"]["id"]]
+            is_done = not self._pending
+        if sent or failed:
+            self._save_journal()
+        return is_done
+
+    def _run(self):
+        """
+        Sends the accesses as they are queued, backing off after failures.
+        """
+        delay = None
+        while True:
+            self._wake_up.wait(delay)
+            self._wake_up.clear()
+            # Journal the new accesses before trying to send them, which can take a
+            # while.
+            if self._is_journal_dirty:
+                self._save_journal()
+            if self._is_stopping:
+                return
+
+            if self.flush():
+                delay = None
+            elif delay is None:
+                delay = self._retry_delay
+            else:
+                delay = min(delay * 2, self._max_retry_delay)
+
+    def _load_journal(self):
+        """
+        Reads the accesses that weren't sent before the last restart.
+        """
+        try:
+            with open(self._journal_path, "r") as fh:
+                journal = json.load(fh)
+            entries = journal["entries"]
+        except (IOError, OSError):
+            return
+        except Exception:
+            logger.warning(
+                "Ignoring invalid last accessed journal %s", self._journal_path
+            )
+            return
+
+        if journal.get("site") != self._site:
+            logger.debug("Ignoring the last accessed journal of another site.")
+            return
+
+        for entry in entries:
+            # The current connection can't update the accesses of another user.
+            if entry["user"] != self._user:
+                continue
+            self._pending[entry["project"]["id"]] = entry
+        if self._pending:
+            logger.debug(
+                "%d project access(es) to send from a previous session.",
+                len(self._pending),
+            )
+        if len(self._pending) != len(entries):
+            self._is_journal_dirty = True
+
+    def _save_journal(self):
+        """
+        Writes the pending accesses to the journal. Called from the background
+        thread, or by flush.
+        """
+        with self._journal_lock:
+            with self._lock:
+                entries = [dict(entry) for entry in self._pending.values()]
+                self._is_journal_dirty = False
+            self._write_journal(entries)
+
+    def _write_journal(self, entries):
+        """
+        Writes entries to the journal, or removes it if there are none.
+        """
+        try:
+            if not entries:
+                if os.path.exists(self._journal_path):
+                    os.remove(self._journal_path)
+                return
+            # Write to a temporary file first, so a crash never leaves a truncated
+            # journal behind.
+            tmp_path = self._journal_path + ".tmp"
+            with open(tmp_path, "w") as fh:
+                json.dump({"site": self._site, "entries": entries}, fh)
+            os.replace(tmp_path, self._journal_path)
+        except (IOError, OSError) as e:
+            logger.warning("Could not write the last accessed journal: %s", e)
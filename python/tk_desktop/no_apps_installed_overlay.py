@@ -16,6 +16,8 @@ from sgtk.platform.qt import QtCore
 from sgtk.platform.qt import QtGui
 
 from .ui import no_apps_installed_overlay
+from .thumbnail_loader import ThumbnailLoader
+from .site_capabilities import get_site_capabilities
 
 shotgun_data = sgtk.platform.import_framework(
     "tk-framework-shotgunutils", "shotgun_data"
@@ -44,6 +46,12 @@ class NoAppsInstalledOverlay(QtGui.QWidget):
         self._config_link_color = "#0000FF"
         self._config_link_text = "here"
 
+        # Icons are decoded and scaled in the background, and set on the labels
+        # stored here by icon path.
+        self._icon_labels = {}
+        self._icon_loader = ThumbnailLoader(parent=self)
+        self._icon_loader.thumbnail_loaded.connect(self._on_icon_loaded)
+
         # Hide this widget by default.
         self.setVisible(False)
 
@@ -67,6 +75,10 @@ class NoAppsInstalledOverlay(QtGui.QWidget):
         be the same from project to project, or can change
         if Software entities are reconfigured in Shotgun.
         """
+        # The labels of the icons being loaded are going away.
+        self._icon_loader.cancel_all()
+        self._icon_labels = {}
+
         while self.ui.icon_rows.count():
             qt_layout = self.ui.icon_rows.takeAt(0)
             while qt_layout.count():
@@ -112,13 +124,11 @@ class NoAppsInstalledOverlay(QtGui.QWidget):
                 continue
 
             # Create a label and set its pixmap to the downloaded
-            # thumbnail scaled to self._icon_size.
+            # thumbnail scaled to self._icon_size once it is loaded.
             qt_label = QtGui.QLabel(self)
-            qt_label.setPixmap(
-                QtGui.QPixmap(sg_icon).scaled(
-                    self._icon_size, mode=QtCore.Qt.SmoothTransformation
-                )
-            )
+            qt_label.setFixedSize(self._icon_size)
+            self._icon_labels[sg_icon] = qt_label
+            self._icon_loader.load(sg_icon, sg_icon, self._scale_icon)
 
             # Add the label to this widget, constructing necessary
             # layouts as needed.
@@ -138,6 +148,25 @@ class NoAppsInstalledOverlay(QtGui.QWidget):
         # evenly spaced out.
         self.ui.icon_rows.setSpacing(self._icon_layout_spacing)
 
+    def _scale_icon(self, image):
+        """
+        Scales a Software icon to self._icon_size. Runs in a background thread.
+
+        :param image: QImage of the icon.
+        """
+        return image.scaled(self._icon_size, mode=QtCore.Qt.SmoothTransformation)
+
+    def _on_icon_loaded(self, path, pixmap):
+        """
+        Sets a Software icon once it is loaded.
+
+        :param str path: Path to the icon.
+        :param pixmap: QPixmap of the icon.
+        """
+        qt_label = self._icon_labels.pop(path, None)
+        if qt_label is not None:
+            qt_label.setPixmap(pixmap)
+
     def _set_configuration_link(self, engine):
         """
         Update the ui.link_label with the appropriate link to open
@@ -183,7 +212,7 @@ class NoAppsInstalledOverlay(QtGui.QWidget):
         """
 
         # check that software entity is supported
-        if self.__get_sg_server_version(engine) < (7, 2, 0):
+        if get_site_capabilities().get_server_version() < (7, 2, 0):
             engine.logger.log_warning(
                 "Your version of PTR does not support Software entity based launching."
             )
@@ -269,15 +298,3 @@ class NoAppsInstalledOverlay(QtGui.QWidget):
             return
 
         return sg_softwares
-
-    def __get_sg_server_version(self, engine):
-        """
-        Retrieves the shotgun server version
-        from the currently connected Shotgun.
-
-        :returns: Tuple of (major, minor, patch) versions.
-        """
-        sg_major_ver = engine.shotgun.server_info["version"][0]
-        sg_minor_ver = engine.shotgun.server_info["version"][1]
-        sg_patch_ver = engine.shotgun.server_info["version"][2]
-        return sg_major_ver, sg_minor_ver, sg_patch_ver
@@ -0,0 +1,252 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Caches the configurations of the user's favourite and recent projects while the
+desktop app is idle, so opening them later doesn't have to download anything.
+"""
+
+import time
+
+from sgtk.platform.qt import QtCore
+from sgtk import LogManager
+
+from .project_synchronization_thread import ProjectSynchronizationThread
+
+logger = LogManager.get_logger(__name__)
+
+
+class PrecacheScheduler(QtCore.QObject):
+    """
+    Runs ``prepare_engine`` for the most relevant projects when the user hasn't
+    interacted with the app for a while and no project is opened.
+
+    Favourite projects come first, followed by the most recently accessed ones.
+    Projects cached recently enough are skipped, and the time each project was cached
+    at is saved in the settings.
+    """
+
+    # Number of milliseconds without user input before caching starts.
+    IDLE_DELAY = 60 * 1000
+    # Number of seconds during which a cached project is considered fresh.
+    FRESHNESS_PERIOD = 12 * 60 * 60
+    # Number of seconds to sleep on each progress report, to leave some
+    # bandwidth and disk access to the rest of the system.
+    THROTTLE_DELAY = 0.05
+    # Settings key for the freshness of each project.
+    SETTINGS_KEY = "project_precache_freshness"
+
+    # Events that indicate the user is interacting with the app.
+    _ACTIVITY_EVENTS = (
+        QtCore.QEvent.KeyPress,
+        QtCore.QEvent.MouseButtonPress,
+        QtCore.QEvent.Wheel,
+    )
+
+    def __init__(
+        self,
+        projects_provider,
+        manager_factory,
+        settings,
+        project_count,
+        max_concurrent=1,
+        parent=None,
+    ):
+        """
+        :param projects_provider: Callable returning the list of project dictionaries
+            with keys ``id``, ``current_user_favorite`` and ``last_accessed_by_current_user``.
+        :param manager_factory: Callable taking a project and returning the
+            ``ToolkitManager`` to cache it with.
+        :param settings: Settings object with ``save(key, value)`` and ``load(key)`` methods.
+        :param int project_count: Number of projects to keep cached. 0 disables caching.
+        :param int max_concurrent: Number of projects that can be cached at the same time.
+        :param parent: Parent of this Qt object.
+        """
+        super().__init__(parent)
+        self._projects_provider = projects_provider
+        self._manager_factory = manager_factory
+        self._settings = settings
+        self._project_count = project_count
+        self._max_concurrent = max_concurrent
+
+        # Threads caching projects, by project id.
+        self._threads = {}
+        # Projects that failed to cache during this session. They won't be retried.
+        self._failed_project_ids = set()
+        self._is_suspended = False
+        self._is_started = False
+
+        self._idle_timer = QtCore.QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.setInterval(self.IDLE_DELAY)
+        self._idle_timer.timeout.connect(self._on_idle)
+
+    @property
+    def is_enabled(self):
+        """
+        ``True`` if projects need to be cached.
+        """
+        return self._project_count > 0
+
+    def start(self):
+        """
+        Starts watching for idle time.
+        """
+        if not self.is_enabled or self._is_started:
+            return
+        self._is_started = True
+        QtCore.QCoreApplication.instance().installEventFilter(self)
+        self._restart_idle_timer()
+
+    def stop(self):
+        """
+        Stops watching for idle time and cancels the projects being cached.
+        """
+        if not self._is_started:
+            return
+        self._is_started = False
+        QtCore.QCoreApplication.instance().removeEventFilter(self)
+        self._idle_timer.stop()
+        self._abort_all()
+
+    def suspend(self):
+        """
+        Cancels the projects being cached and waits until :meth:`resume` is called.
+
+        This is called when the user opens a project, so caching doesn't compete
+        with it.
+        """
+        self._is_suspended = True
+        self._idle_timer.stop()
+        self._abort_all()
+
+    def resume(self):
+        """
+        Starts watching for idle time again after :meth:`suspend` was called.
+        """
+        self._is_suspended = False
+        self._restart_idle_timer()
+
+    def get_freshness(self, project_id):
+        """
+        :param int project_id: Id of the project.
+
+        :returns: The time at which the project was last cached, in seconds since
+            the epoch, or None if it never was.
+        """
+        entry = (self._settings.load(self.SETTINGS_KEY) or {}).get(str(project_id))
+        return entry["timestamp"] if entry else None
+
+    def eventFilter(self, obj, event):
+        """
+        Postpones caching whenever the user interacts with the app.
+        """
+        if event.type() in self._ACTIVITY_EVENTS:
+            self._restart_idle_timer()
+        return False
+
+    def _restart_idle_timer(self):
+        if self._is_started and not self._is_suspended:
+            self._idle_timer.start()
+
+    def _on_idle(self):
+        """
+        Starts caching projects, up to the allowed concurrency.
+        """
+        if self._is_suspended:
+            return
+
+        for project in self._get_candidates():
+            if len(self._threads) >= self._max_concurrent:
+                break
+            self._start(project)
+
+    def _get_candidates(self):
+        """
+        :returns: The projects that need to be cached, in order of priority.
+        """
+        projects = sorted(
+            self._projects_provider(),
+            key=lambda project: (
+                bool(project.get("current_user_favorite")),
+                project.get("last_accessed_by_current_user") or 0,
+            ),
+            reverse=True,
+        )[: self._project_count]
+
+        now = time.time()
+        candidates = []
+        for project in projects:
+            if (
+                project["id"] in self._threads
+                or project["id"] in self._failed_project_ids
+            ):
+                continue
+            timestamp = self.get_freshness(project["id"])
+            if timestamp is not None and now - timestamp < self.FRESHNESS_PERIOD:
+                continue
+            candidates.append(project)
+        return candidates
+
+    def _start(self, project):
+        """
+        Starts caching a project in a background thread.
+        """
+        logger.debug("Caching project %s while idle.", project.get("name"))
+        try:
+            manager = self._manager_factory(project)
+        except Exception:
+            logger.exception("Could not cache project %s:", project.get("name"))
+            self._failed_project_ids.add(project["id"])
+            return
+
+        thread = ProjectSynchronizationThread(
+            manager, project, throttle=self.THROTTLE_DELAY
+        )
+        thread.sync_success.connect(
+            lambda config_path, descriptor: self._on_project_cached(project, descriptor)
+        )
+        thread.sync_failed.connect(
+            lambda error: self._failed_project_ids.add(project["id"])
+        )
+        thread.finished.connect(lambda: self._on_thread_finished(project["id"]))
+        self._threads[project["id"]] = thread
+        thread.start(QtCore.QThread.LowestPriority)
+
+    def _on_project_cached(self, project, descriptor):
+        """
+        Records when a project was cached.
+        """
+        logger.debug("Project %s has been cached.", project.get("name"))
+        freshness = dict(self._settings.load(self.SETTINGS_KEY) or {})
+        freshness[str(project["id"])] = {
+            "timestamp": time.time(),
+            "descriptor": descriptor.get_uri() if descriptor else None,
+        }
+        self._settings.save(self.SETTINGS_KEY, freshness)
+
+    def _on_thread_finished(self, project_id):
+        """
+        Moves on to the next project once one is done.
+        """
+        thread = self._threads.pop(project_id, None)
+        if thread is not None:
+            thread.deleteLater()
+        if not self._threads:
+            # Wait for the app to be idle again, so we only cache one batch at a time.
+            self._restart_idle_timer()
+
+    def _abort_all(self):
+        """
+        Asks the running threads to stop. Aborting is cooperative, the threads
+        finish on their own.
+        """
+        for thread in self._threads.values():
+            thread.abort()
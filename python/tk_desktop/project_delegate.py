@@ -8,11 +8,15 @@
 # agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
 # not expressly granted therein are reserved by Shotgun Software Inc.
 
-from tank.platform.qt import QtCore
+import functools
+
+from tank.platform.qt import QtCore, QtGui
 
 import sgtk
 
 from .thumb_widget import ThumbWidget
+from .thumbnail_loader import ThumbnailLoader
+from .thumbnail_cache import ThumbnailCache, compose_thumbnail, get_thumbnail_mode
 from .project_model import SgProjectModel
 
 shotgun_model = sgtk.platform.import_framework(
@@ -23,32 +27,156 @@ views = sgtk.platform.import_framework("tk-framework-qtwidgets", "views")
 ShotgunModel = shotgun_model.ShotgunModel
 
 
+class ProjectThumbnails(QtCore.QObject):
+    """
+    Project thumbnails scaled to the size the project delegates display them at.
+
+    Thumbnails are decoded and scaled in the background, and the default thumbnail is
+    returned until they are ready.
+    """
+
+    # Emitted when a thumbnail is ready to be painted.
+    thumbnail_loaded = QtCore.Signal()
+
+    def __init__(self, images=None, parent=None):
+        """
+        :param images: :class:`ThumbnailCache` of the thumbnails the project model
+            already decoded, which are then only scaled.
+        :param parent: Parent of this Qt object.
+        """
+        super().__init__(parent)
+        self._images = images
+        self._cache = ThumbnailCache()
+        self._mode = get_thumbnail_mode()
+        # Known once the delegate knows its layout.
+        self.thumb_size = None
+
+        self._loader = ThumbnailLoader(parent=self)
+        self._loader.thumbnail_loaded.connect(self._on_thumbnail_loaded)
+
+    def cache(self, item):
+        """
+        Scales a project thumbnail that was just downloaded, so painting it is only a
+        cache lookup.
+
+        :param item: Project item from the project model.
+        """
+        project = item.data(ShotgunModel.SG_DATA_ROLE)
+        path = item.data(SgProjectModel.THUMBNAIL_PATH_ROLE)
+        if project is None or path is None or self.thumb_size is None:
+            return
+        # Thumbnails of the previous path won't be displayed anymore.
+        self._cache.remove_project(project["id"])
+        self._load(project, path)
+
+    def cancel(self):
+        """
+        Cancels the thumbnails being scaled.
+        """
+        self._loader.cancel_all()
+
+    def get(self, project, path):
+        """
+        :param dict project: Project to get the thumbnail of.
+        :param str path: Path to the project's thumbnail.
+
+        :returns: The thumbnail scaled to the thumbnail size if it is cached, the
+            default thumbnail otherwise.
+        """
+        if project is not None and path is not None:
+            pixmap = self._cache.get(
+                ThumbnailCache.key(project["id"], path, self.thumb_size, self._mode)
+            )
+            if pixmap is not None:
+                return pixmap
+            self._load(project, path)
+
+        # Projects without a thumbnail, or whose thumbnail is being scaled, share the
+        # default one.
+        key = ThumbnailCache.key(None, None, self.thumb_size, self._mode)
+        pixmap = self._cache.get(key)
+        if pixmap is None:
+            pixmap = compose_thumbnail(
+                QtGui.QPixmap(":/tk-desktop/missing_thumbnail_project.png"),
+                self.thumb_size,
+                self._mode,
+            )
+            self._cache.insert(key, pixmap)
+        return pixmap
+
+    def _load(self, project, path):
+        """
+        Decodes and scales a thumbnail in the background. Thumbnails the model
+        already decoded are only scaled.
+        """
+        image = None
+        if self._images is not None:
+            image = self._images.get(
+                ThumbnailCache.key(project["id"], path, None, None)
+            )
+        self._loader.load(
+            ThumbnailCache.key(project["id"], path, self.thumb_size, self._mode),
+            path if image is None else image,
+            functools.partial(compose_thumbnail, size=self.thumb_size, mode=self._mode),
+        )
+
+    def _on_thumbnail_loaded(self, key, pixmap):
+        """
+        Called when a thumbnail has been scaled in the background.
+        """
+        self._cache.insert(key, pixmap)
+        self.thumbnail_loaded.emit()
+
+
 class SgProjectDelegate(views.EditSelectedWidgetDelegate):
-    def __init__(self, view, size):
+    def __init__(self, view, size, thumbnail_images=None):
         self._size = size
         self._view = view
         views.EditSelectedWidgetDelegate.__init__(self, view)
 
+        # The thumbnail size is known once the first widget is created.
+        self._thumbnails = ProjectThumbnails(thumbnail_images, parent=self)
+        self._thumbnails.thumbnail_loaded.connect(self._view.viewport().update)
+
     def _create_widget(self, parent):
         """Widget factory as required by base class"""
-        return ThumbWidget(self._size.width(), parent)
+        widget = ThumbWidget(self._size.width(), parent)
+        self._thumbnails.thumb_size = widget.thumb_size
+        return widget
+
+    def cache_thumbnail(self, item):
+        """
+        Scales a project thumbnail that was just downloaded in the background, so
+        painting it is only a cache lookup.
+
+        :param item: Project item from the project model.
+        """
+        self._thumbnails.cache(item)
+
+    def cancel_thumbnail_loading(self):
+        """
+        Cancels the thumbnails being scaled, for example because the model is reset.
+        """
+        self._thumbnails.cancel()
 
     def _on_before_paint(self, widget, model_index, style_options, selected=False):
         """
         Called by the base class before the associated widget should be
         painted in the view.
         """
+        project = model_index.data(ShotgunModel.SG_DATA_ROLE)
+
         # setup thumbnail
-        icon = model_index.data(QtCore.Qt.DecorationRole)
-        if icon is not None:
-            thumb = icon.pixmap(512)
-            widget.set_thumbnail(thumb)
+        widget.set_scaled_thumbnail(
+            self._thumbnails.get(
+                project, model_index.data(SgProjectModel.THUMBNAIL_PATH_ROLE)
+            )
+        )
 
         # set name
         widget.set_text(model_index.data(SgProjectModel.DISPLAY_NAME_ROLE))
 
         # set description tooltip
-        project = model_index.data(ShotgunModel.SG_DATA_ROLE)
         if project is not None:
             tooltip = project.get("sg_description") or ""
             self._view.setToolTip(tooltip)
@@ -63,6 +191,14 @@ class SgProjectDelegate(views.EditSelectedWidgetDelegate):
         # rendering of a selected widget is the same
         self._on_before_paint(widget, model_index, style_options, selected=True)
 
+    def precompute_size_hints(self, texts):
+        """
+        Lays out the given project names ahead of the view's layout.
+
+        :param texts: Project names.
+        """
+        ThumbWidget.precompute_heights(self._size.width(), texts)
+
     def sizeHint(self, style_options, model_index):
         text = model_index.data(SgProjectModel.DISPLAY_NAME_ROLE)
         height = ThumbWidget.height_for_width(self._size.width(), text)
@@ -0,0 +1,259 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Downloads only the projects that changed since the project model was last synced,
+instead of every project on the site.
+"""
+
+import datetime
+import json
+import os
+import time
+
+from sgtk.platform.qt import QtCore
+from sgtk import LogManager
+
+logger = LogManager.get_logger(__name__)
+
+
+class ProjectDeltaSync(QtCore.QObject):
+    """
+    Queries the projects whose ``updated_at`` is newer than a watermark, one page at
+    a time, so the first projects can be displayed before the rest is downloaded.
+
+    Deleted projects, and projects that got archived or turned into templates, are
+    not returned by those queries. They are detected by periodically sweeping the ids
+    of all the projects that still match the filters, or by downloading all of them
+    when there is no watermark. The sweep also returns the fields that are specific
+    to the current user, since changing them doesn't update ``updated_at``.
+
+    Pages are requested by id, ``id > last id of the previous page``, so projects
+    created or updated while paging can't shift the pages.
+    """
+
+    # Number of projects requested at a time.
+    PAGE_SIZE = 200
+    # Number of seconds between two sweeps of the project ids.
+    SWEEP_INTERVAL = 60 * 60
+    # Number of seconds subtracted from the watermark so projects updated around the
+    # time of the last sync are not missed. Downloading them again is harmless.
+    WATERMARK_OVERLAP = 60
+    # Fields returned by the sweep.
+    SWEEP_FIELDS = ["id", "current_user_favorite", "last_accessed_by_current_user"]
+
+    # Emitted with a list of project dictionaries when a page of updated projects
+    # has been downloaded.
+    projects_updated = QtCore.Signal(list)
+    # Emitted with the list of all the projects matching the filters once a sweep or
+    # a sync without watermark is complete. Sweeps only return SWEEP_FIELDS.
+    projects_swept = QtCore.Signal(list)
+    # Emitted when a sync is complete.
+    sync_finished = QtCore.Signal()
+    # Emitted with an error message when a query failed.
+    sync_failed = QtCore.Signal(str)
+
+    def __init__(self, data_retriever, entity_type, filters, fields, parent=None):
+        """
+        :param data_retriever: Started ``ShotgunDataRetriever`` to run the queries with.
+        :param str entity_type: Type of the entities to sync.
+        :param list filters: Filters the entities to sync must match.
+        :param list fields: Fields to download for the updated entities.
+        :param parent: Parent of this Qt object.
+        """
+        super().__init__(parent)
+        self._data_retriever = data_retriever
+        self._entity_type = entity_type
+        self._filters = filters
+        self._fields = fields
+
+        self._last_sweep = None
+        # Id of the request in flight, what it is for and the results accumulated
+        # so far.
+        self._request_id = None
+        self._request_fields = None
+        self._request_filters = None
+        self._swept_projects = []
+        self._sweep_pending = False
+        self._is_full_sync = False
+
+        self._data_retriever.work_completed.connect(self._on_work_completed)
+        self._data_retriever.work_failure.connect(self._on_work_failure)
+
+    @property
+    def is_syncing(self):
+        """
+        ``True`` if a sync is in progress.
+        """
+        return self._request_id is not None
+
+    def sync(self, watermark=None, sweep=False):
+        """
+        Starts syncing the projects. A sync already in progress is abandoned.
+
+        :param float watermark: Unix timestamp of the most recent ``updated_at`` already
+            known. If ``None``, all the projects are downloaded.
+        :param bool sweep: If ``True``, the project ids are swept even if the last
+            sweep is recent enough.
+        """
+        filters = list(self._filters)
+        if watermark is not None:
+            since = datetime.datetime.fromtimestamp(
+                watermark - self.WATERMARK_OVERLAP, tz=datetime.timezone.utc
+            )
+            filters.append(["updated_at", "greater_than", since])
+
+        # Downloading every project already tells which ones exist.
+        self._is_full_sync = watermark is None
+        self._sweep_pending = not self._is_full_sync and (
+            sweep
+            or self._last_sweep is None
+            or time.time() - self._last_sweep > self.SWEEP_INTERVAL
+        )
+        self._swept_projects = []
+        self._request_filters = filters
+        self._request_fields = self._fields
+        self._request_page(0)
+
+    def stop(self):
+        """
+        Abandons the sync in progress, if any.
+        """
+        self._request_id = None
+
+    def _request_page(self, last_id):
+        """
+        Requests the projects after the given id.
+        """
+        self._request_id = self._data_retriever.execute_find(
+            self._entity_type,
+            self._request_filters + [["id", "greater_than", last_id]],
+            self._request_fields,
+            [{"field_name": "id", "direction": "asc"}],
+            limit=self.PAGE_SIZE,
+        )
+
+    def _on_work_completed(self, uid, request_type, data):
+        """
+        Called when a query ran by the data retriever is complete.
+        """
+        if uid != self._request_id:
+            return
+
+        projects = data["sg"]
+        is_sweeping = self._request_fields is self.SWEEP_FIELDS
+        if is_sweeping or self._is_full_sync:
+            self._swept_projects.extend(projects)
+        if not is_sweeping and projects:
+            self.projects_updated.emit(projects)
+
+        if len(projects) == self.PAGE_SIZE:
+            self._request_page(projects[-1]["id"])
+        elif not is_sweeping and self._sweep_pending:
+            self._sweep_pending = False
+            self._request_filters = list(self._filters)
+            self._request_fields = self.SWEEP_FIELDS
+            self._request_page(0)
+        else:
+            self._request_id = None
+            if is_sweeping or self._is_full_sync:
+                self._last_sweep = time.time()
+                swept_projects, self._swept_projects = self._swept_projects, []
+                self.projects_swept.emit(swept_projects)
+            self.sync_finished.emit()
+
+    def _on_work_failure(self, uid, msg):
+        """
+        Called when a query ran by the data retriever failed.
+        """
+        if uid != self._request_id:
+            return
+        self._request_id = None
+        self._swept_projects = []
+        logger.warning("Project sync failed: %s", msg)
+        self.sync_failed.emit(msg)
+
+
+class ProjectDeltaCache(object):
+    """
+    Projects downloaded by the delta sync and the watermark they are synced up to,
+    saved on disk so the next launch only downloads the projects that changed since.
+
+    The cache is ignored if it was saved with different filters or fields, since it
+    would then hold the wrong projects.
+    """
+
+    def __init__(self, path, filters, fields):
+        """
+        :param str path: Path to the cache file.
+        :param list filters: Filters the projects match.
+        :param list fields: Fields of the projects.
+        """
+        self._path = path
+        # Only the fields that were requested are saved, along with the ones Shotgun
+        # always returns.
+        self._fields = ["type", "id"] + [
+            field for field in fields if field not in ("type", "id")
+        ]
+        # Round-tripped through JSON so it compares equal to what is read back.
+        self._key = json.loads(json.dumps({"filters": filters, "fields": fields}))
+
+    def load(self):
+        """
+        :returns: Tuple of the watermark and the list of project dictionaries, or
+            ``(None, [])`` if there is no usable cache.
+        """
+        try:
+            with open(self._path, "r") as fh:
+                data = json.load(fh)
+        except (IOError, OSError):
+            return None, []
+        except Exception:
+            logger.warning("Ignoring invalid project cache %s", self._path)
+            return None, []
+
+        if data.get("key") != self._key:
+            logger.debug("Ignoring project cache saved with other filters or fields.")
+            return None, []
+        return data["watermark"], data["projects"]
+
+    def save(self, watermark, projects):
+        """
+        Writes the projects to the cache.
+
+        :param float watermark: Most recent ``updated_at`` the projects are synced
+            up to.
+        :param list projects: Project dictionaries.
+        """
+        projects = [
+            dict((field, project[field]) for field in self._fields if field in project)
+            for project in projects
+        ]
+        try:
+            # Write to a temporary file first, so a crash never leaves a truncated
+            # cache behind.
+            tmp_path = self._path + ".tmp"
+            with open(tmp_path, "w") as fh:
+                json.dump(
+                    {"key": self._key, "watermark": watermark, "projects": projects},
+                    fh,
+                )
+            os.replace(tmp_path, self._path)
+        except (IOError, OSError, TypeError, ValueError) as e:
+            logger.warning("Could not write the project cache: %s", e)
+
+    def clear(self):
+        """
+        Removes the cache from disk.
+        """
+        try:
+            os.remove(self._path)
+        except (IOError, OSError):
+            pass
@@ -8,6 +8,7 @@
 # agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
 # not expressly granted therein are reserved by Shotgun Software Inc.
 
+import os
 import re
 import sys
 import time
@@ -17,9 +18,18 @@ from tank.platform.qt import QtCore, QtGui
 
 import sgtk
 
+from .project_delta_sync import ProjectDeltaCache, ProjectDeltaSync
+from .last_accessed_queue import LastAccessedQueue
+from .site_capabilities import get_site_capabilities
+from .thumbnail_cache import ThumbnailCache
+from .thumbnail_loader import ThumbnailLoader
+
 shotgun_model = sgtk.platform.import_framework(
     "tk-framework-shotgunutils", "shotgun_model"
 )
+shotgun_data = sgtk.platform.import_framework(
+    "tk-framework-shotgunutils", "shotgun_data"
+)
 
 ShotgunModel = shotgun_model.ShotgunModel
 
@@ -62,6 +72,112 @@ class FuzzyMatcher:
             return (score, highlighted)
 
 
+class ProjectSearchIndex(object):
+    """
+    Fuzzy search index over the names of a list of projects.
+
+    Names are lowercased once when the index is built. The hits of the queries typed
+    so far are kept, so a query extending the previous one only searches through the
+    previous hits and deleting characters goes back to results already computed.
+    Highlighted names are only generated when they are requested, which is when a
+    row is displayed.
+    """
+
+    def __init__(self, projects):
+        """
+        :param list projects: Project dictionaries to index.
+        """
+        self._projects = projects
+        self._keys = []
+        for project in projects:
+            name = project["name"]
+            lowered = name.lower()
+            # Lowercasing some characters changes the length of the string, which
+            # would change the scores, so those names are searched case
+            # insensitively instead.
+            self._keys.append(lowered if len(lowered) == len(name) else None)
+
+        # Stack of (query, hits) for the queries typed so far, each query extending
+        # the previous one. Hits are (-score, position) tuples.
+        self._history = [("", [(0, position) for position in range(len(projects))])]
+        self._matcher = None
+        self._hit_ids = set()
+        self._highlights = {}
+
+    def search(self, query):
+        """
+        Ranks the projects against the given query.
+
+        :param str query: Text to search for.
+
+        :returns: The projects matching the query, best matches first.
+        """
+        query = query.lower()
+
+        # Rewind to the last query the new one extends.
+        while not query.startswith(self._history[-1][0]):
+            self._history.pop()
+
+        if query != self._history[-1][0]:
+            self._history.append((query, self._match(query, self._history[-1][1])))
+
+        # Positions break ties, so projects with the same score keep the model's
+        # order.
+        hits = sorted(self._history[-1][1])
+        projects_in_order = [self._projects[position] for _, position in hits]
+
+        self._matcher = FuzzyMatcher(query)
+        self._hit_ids = set(project["id"] for project in projects_in_order)
+        self._highlights = {}
+        return projects_in_order
+
+    def _match(self, query, candidates):
+        """
+        :returns: The hits for the query amongst the hits of a previous query.
+        """
+        # Same matches as FuzzyMatcher, but "a[^b]*b" finds the first "b" after "a"
+        # without backtracking like "(a).*?(b)" does when there is no match.
+        pattern = re.escape(query[0]) + "".join(
+            "[^{0}]*{0}".format(re.escape(char)) for char in query[1:]
+        )
+        search = re.compile(pattern).search
+        case_insensitive_search = re.compile(pattern, re.IGNORECASE).search
+
+        hits = []
+        for _, position in candidates:
+            key = self._keys[position]
+            if key is not None:
+                match = search(key)
+            else:
+                match = case_insensitive_search(self._projects[position]["name"])
+            if match is not None:
+                # Same scoring as FuzzyMatcher.score
+                start, end = match.span()
+                hits.append((-100.0 / ((1 + start) * (end - start + 1)), position))
+        return hits
+
+    def highlight(self, project):
+        """
+        :param dict project: Project to highlight the name of.
+
+        :returns: The project name with the characters matching the last query
+            highlighted, or None if the project didn't match.
+        """
+        project_id = project["id"]
+        if project_id not in self._hit_ids:
+            return None
+
+        if project_id not in self._highlights:
+            _, self._highlights[project_id] = self._matcher.score(
+                project["name"], self._highlighter
+            )
+        return self._highlights[project_id]
+
+    @staticmethod
+    def _highlighter(char):
+        return "<b><u><font color='white'>" + char + "</font></u></b>"
+
+
 class SgProjectModelProxy(QtGui.QSortFilterProxyModel):
     """Enable sorting and filtering on projects"""
 
@@ -71,6 +187,8 @@ class SgProjectModelProxy(QtGui.QSortFilterProxyModel):
 
         self._limit = None  # limit how many items to show
         self._search_text = ""  # search text for ranking projects
+        self._projects = None  # projects read from the model, None when out of date
+        self._search_index = None  # search index over self._projects
 
     def setSourceModel(self, model):
         """
@@ -78,8 +196,33 @@ class SgProjectModelProxy(QtGui.QSortFilterProxyModel):
         internal representation for sorting and filtering.
         """
         QtGui.QSortFilterProxyModel.setSourceModel(self, model)
+        # Projects are read from the model again after it changes.
+        model.modelReset.connect(self._on_source_model_changed)
+        model.layoutChanged.connect(self._on_source_model_changed)
+        model.rowsInserted.connect(self._on_source_model_changed)
+        model.rowsRemoved.connect(self._on_source_model_changed)
+        model.dataChanged.connect(self._on_source_data_changed)
+        self._on_source_model_changed()
         self._update_cached_data()
 
+    def _on_source_data_changed(self, top_left, bottom_right, roles=None):
+        """
+        Called when data changed in the source model.
+        """
+        # Thumbnails keep getting downloaded while the user is searching and don't
+        # affect the projects.
+        thumbnail_roles = (QtCore.Qt.DecorationRole, SgProjectModel.THUMBNAIL_PATH_ROLE)
+        if roles and all(role in thumbnail_roles for role in roles):
+            return
+        self._on_source_model_changed()
+
+    def _on_source_model_changed(self, *args):
+        """
+        Called when the source model changed.
+        """
+        self._projects = None
+        self._search_index = None
+
     #############################################
     # properties
 
@@ -103,8 +246,10 @@ class SgProjectModelProxy(QtGui.QSortFilterProxyModel):
         if self._search_text == value:
             return
         self._search_text = value
+        # The projects haven't changed, so skip invalidate, which reads them from
+        # the model again.
         self._update_cached_data()
-        self.invalidate()
+        QtGui.QSortFilterProxyModel.invalidate(self)
 
     search_text = property(_get_search_text, _set_search_text)
 
@@ -120,44 +265,22 @@ class SgProjectModelProxy(QtGui.QSortFilterProxyModel):
             # project list is stored on the model, so return unless the model is set.
             return
 
-        # grab the full list of projects from the model
-        projects = []
-        for row in range(src_model.rowCount()):
-            item = src_model.item(row, 0)
-            project = item.data(ShotgunModel.SG_DATA_ROLE)
-            if project is not None:
-                project["__item"] = item
-                projects.append(project)
+        if self._projects is None:
+            # grab the full list of projects from the model
+            self._projects = []
+            for row in range(src_model.rowCount()):
+                item = src_model.item(row, 0)
+                project = item.data(ShotgunModel.SG_DATA_ROLE)
+                if project is not None:
+                    self._projects.append(project)
 
         # apply ordering
         if self.search_text:
-
-            def highlighter(char):
-                return "<b><u><font color='white'>" + char + "</font></u></b>"
-
             # order is done by search text
-            ratios = []
-            matcher = FuzzyMatcher(self.search_text.lower())
-            for project in projects:
-                ratio, highlighted = matcher.score(project["name"], highlighter)
-                if ratio:
-                    ratios.append((ratio, project))
-                    project["__item"].setData(
-                        highlighted, SgProjectModel.DISPLAY_NAME_ROLE
-                    )
-                else:
-                    project["__item"].setData(
-                        project["name"], SgProjectModel.DISPLAY_NAME_ROLE
-                    )
-            ratios_in_order = sorted(ratios, key=lambda key: -key[0])
-            projects_in_order = [r[1] for r in ratios_in_order]
+            if self._search_index is None:
+                self._search_index = ProjectSearchIndex(self._projects)
+            projects_in_order = self._search_index.search(self.search_text)
         else:
-            # clear any existing highlighting
-            for project in projects:
-                project["__item"].setData(
-                    project["name"], SgProjectModel.DISPLAY_NAME_ROLE
-                )
-
             # sort by last_accessed_by_current_user
             def key_for_project(project):
                 return (
@@ -169,45 +292,66 @@ class SgProjectModelProxy(QtGui.QSortFilterProxyModel):
                     project["id"],
                 )
 
-            projects_in_order = sorted(projects, key=key_for_project, reverse=True)
+            projects_in_order = sorted(
+                self._projects, key=key_for_project, reverse=True
+            )
 
         # apply limit post sort
         if self.limit is not None:
             projects_in_order = projects_in_order[: self.limit]
 
-        # grab the ids for easy access during lessThan and filterAcceptsRow
-        self._ids_in_order = [p["id"] for p in projects_in_order]
+        # rank of each project id, so lessThan and filterAcceptsRow don't have to
+        # search through the list of projects.
+        self._ranks = {p["id"]: rank for rank, p in enumerate(projects_in_order)}
 
     def invalidate(self):
         """
         Override invalidate to update our cached data before calling the base implementation.
         """
+        self._on_source_model_changed()
         self._update_cached_data()
         QtGui.QSortFilterProxyModel.invalidate(self)
 
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        """
+        QSortFilterProxyModel override to highlight the characters matching the
+        search text in the project names, only for the rows that get displayed.
+        """
+        if (
+            role == SgProjectModel.DISPLAY_NAME_ROLE
+            and self._search_text
+            and self._search_index is not None
+        ):
+            project = QtGui.QSortFilterProxyModel.data(
+                self, index, ShotgunModel.SG_DATA_ROLE
+            )
+            if project is not None:
+                highlighted = self._search_index.highlight(project)
+                if highlighted is not None:
+                    return highlighted
+        return QtGui.QSortFilterProxyModel.data(self, index, role)
+
     def lessThan(self, left, right):
         """
         QSortFilterProxyModel override to base ordering on our cached values.
         """
-        left_sg_data = left.data(ShotgunModel.SG_DATA_ROLE)
-        if left_sg_data is None:
-            left_index = sys.maxint
-        else:
-            left_index = self._ids_in_order.index(left_sg_data["id"])
-
-        right_sg_data = right.data(ShotgunModel.SG_DATA_ROLE)
-        if right_sg_data is None:
-            right_index = sys.maxint
-        else:
-            right_index = self._ids_in_order.index(right_sg_data["id"])
+        return self._get_rank(left) < self._get_rank(right)
 
-        return left_index < right_index
+    def _get_rank(self, index):
+        """
+        :returns: The position of the project at the given index in the sorted list,
+            projects that are filtered out being last.
+        """
+        sg_data = index.data(ShotgunModel.SG_DATA_ROLE)
+        if sg_data is None:
+            return sys.maxsize
+        return self._ranks.get(sg_data["id"], sys.maxsize)
 
     def filterAcceptsRow(self, source_row, source_parent):
         """
         QSortFilterProxyModel override to base filtering on our cached values.
         """
-        if not hasattr(self, "_ids_in_order"):
+        if not hasattr(self, "_ranks"):
             """
             The cache probably is not ready yet. With Qt5.15 sometimes we are
             called by setSourceModel so for sure the cache is not ready yet.
@@ -228,57 +372,75 @@ class SgProjectModelProxy(QtGui.QSortFilterProxyModel):
         current_sg_data = current_item.data(ShotgunModel.SG_DATA_ROLE)
 
         if current_sg_data and "id" in current_sg_data:
-            return current_sg_data["id"] in self._ids_in_order
+            return current_sg_data["id"] in self._ranks
         return False
 
 
+def _scale_icon(image):
+    """
+    Scales a thumbnail to the size of the item icons. Runs in a background thread.
+    """
+    return image.scaled(
+        SgProjectModel.ICON_SIZE,
+        SgProjectModel.ICON_SIZE,
+        QtCore.Qt.KeepAspectRatioByExpanding,
+        QtCore.Qt.SmoothTransformation,
+    )
+
+
 class SgProjectModel(ShotgunModel):
     """
     This model represents the data which is displayed in the projects list view
     """
 
     DISPLAY_NAME_ROLE = QtCore.Qt.UserRole + 101
+    # Path to the downloaded thumbnail, None until it is downloaded.
+    THUMBNAIL_PATH_ROLE = QtCore.Qt.UserRole + 102
+    # Size of the item icons, which are only displayed in the project header.
+    ICON_SIZE = 84
 
     thumbnail_updated = QtCore.Signal(QtGui.QStandardItem)
     project_launched = QtCore.Signal()
 
-    _supports_project_templates = None
-
     @classmethod
     def supports_project_templates(cls):
         """
-        Tests if Shotgun 6.0 Project Templates are supported on the server. If
-        this method has never been called, the server will be contacted
-        synchronously and the result will be cached so subsequent calls are
-        faster.
+        Tests if Shotgun 6.0 Project Templates are supported on the server. The
+        result is cached per site on disk and revalidated in the background, so the
+        server is only contacted synchronously the first time the site is used.
 
         :returns: True if the server supports Shotgun 6.0 Project Templates,
                   False otherwise.
         """
+        return get_site_capabilities().has_field("Project", "is_template")
 
-        connection = sgtk.platform.current_engine().shotgun
-
-        # If we haven't checked on the server yet.
-        if cls._supports_project_templates is None:
-            try:
-                # Try to read the field's schema.
-                connection.schema_field_read("Project", "is_template")
-                # It worked therefore it exists.
-                cls._supports_project_templates = True
-            except Exception:
-                # We got an error, so it doesn't exist.
-                cls._supports_project_templates = False
-        return cls._supports_project_templates
+    def __init__(self, parent, overlay_parent_widget, delta_sync=False):
+        """
+        Constructor
 
-    def __init__(self, parent, overlay_parent_widget):
-        """Constructor"""
-        ShotgunModel.__init__(self, parent, download_thumbs=True)
+        :param parent: Parent of this Qt object.
+        :param overlay_parent_widget: Widget the model is displayed in.
+        :param bool delta_sync: If ``True``, only the projects updated since the
+            cached data was downloaded are queried instead of all of them.
+        """
+        # Thumbnails are decoded in the background.
+        ShotgunModel.__init__(self, parent, download_thumbs=True, bg_load_thumbs=True)
 
         # load up the thumbnail to use when there is none set in Shotgun
         self._missing_thumbnail_project = QtGui.QPixmap(
             ":/tk-desktop/missing_thumbnail_project.png"
         )
 
+        # Decoded thumbnails, which the delegates scale instead of decoding them
+        # again for as long as the budget allows.
+        self._thumbnail_images = ThumbnailCache()
+        # The item icons are scaled in the background as well.
+        self._icon_loader = ThumbnailLoader(parent=self)
+        self._icon_loader.thumbnail_loaded.connect(self._on_icon_loaded)
+        # Indexes of the items whose icon is being scaled, by loader key.
+        self._pending_icons = {}
+        self.modelAboutToBeReset.connect(self._cancel_icons)
+
         # load up the cached data for the model
         filters = [["name", "is_not", "Template Project"], ["archived", "is_not", True]]
         # Template projects is a Shotgun 6.0 feature, so make sure it exists
@@ -302,24 +464,216 @@ class SgProjectModel(ShotgunModel):
             order=[],
         )
 
+        # Project accesses are sent to Shotgun in the background.
+        engine = sgtk.platform.current_engine()
+        self._last_accessed_queue = LastAccessedQueue(
+            os.path.join(engine.cache_location, "last_accessed_journal.json"),
+            self._send_project_accessed_time,
+            site=engine.shotgun.base_url,
+            user=engine.get_current_login(),
+        )
+        self._last_accessed_queue.start()
+
+        self._delta_sync = None
+        # Most recent updated_at the projects are synced up to in delta sync mode.
+        self._watermark = None
+        if delta_sync:
+            # The watermark of the delta sync is the most recent update.
+            delta_fields = interesting_fields + ["updated_at", "image"]
+            self._data_retriever = shotgun_data.ShotgunDataRetriever(self)
+            self._data_retriever.start()
+            self._delta_sync = ProjectDeltaSync(
+                self._data_retriever, "Project", filters, delta_fields, parent=self
+            )
+            self._delta_sync.projects_updated.connect(self._on_projects_updated)
+            self._delta_sync.projects_swept.connect(self._on_projects_swept)
+            self._delta_sync.sync_finished.connect(self._on_sync_finished)
+
+            # The projects aren't downloaded through the ShotgunModel, so they are
+            # cached separately, along with the watermark.
+            self._delta_cache = ProjectDeltaCache(
+                os.path.join(engine.cache_location, "project_delta_sync.json"),
+                filters,
+                delta_fields,
+            )
+            self._watermark, projects = self._delta_cache.load()
+            if projects:
+                self._on_projects_updated(projects)
+
+            # Deleted projects are only found by sweeps, so the projects are swept
+            # regularly while the app is running.
+            self._sweep_timer = QtCore.QTimer(self)
+            self._sweep_timer.setInterval(ProjectDeltaSync.SWEEP_INTERVAL * 1000)
+            self._sweep_timer.timeout.connect(self._on_sweep_timer)
+            self._sweep_timer.start()
+
         # and force a refresh of the data from Shotgun
-        self._refresh_data()
+        self.refresh_projects()
+
+    def refresh_projects(self):
+        """
+        Refreshes the projects from Shotgun, only downloading the ones that changed
+        in delta sync mode.
+        """
+        if self._delta_sync is None:
+            self._refresh_data()
+        else:
+            self._delta_sync.sync(self._watermark)
+
+    def hard_refresh(self):
+        """
+        Clears the cached data and downloads all the projects again.
+        """
+        if self._delta_sync is None:
+            ShotgunModel.hard_refresh(self)
+            return
+        self._delta_cache.clear()
+        self._watermark = None
+        self._delta_sync.sync()
+
+    @property
+    def thumbnail_images(self):
+        """
+        :class:`ThumbnailCache` of the thumbnails decoded in the background, by
+        ``(project id, path, None, None)`` key.
+        """
+        return self._thumbnail_images
+
+    def destroy(self):
+        """
+        Stops the background work before the model is destroyed.
+        """
+        self._last_accessed_queue.stop(timeout=1)
+        self._icon_loader.shut_down()
+        if self._delta_sync is not None:
+            self._sweep_timer.stop()
+            self._delta_sync.stop()
+            self._data_retriever.stop()
+        ShotgunModel.destroy(self)
+
+    def _on_sweep_timer(self):
+        """
+        Called regularly in delta sync mode to sweep the deleted projects, unless a
+        sync is already in progress.
+        """
+        if not self._delta_sync.is_syncing:
+            self._delta_sync.sync(self._watermark, sweep=True)
+
+    def _get_items_by_project_id(self):
+        """
+        :returns: Dictionary of the project items by project id.
+        """
+        items = {}
+        for row in range(self.rowCount()):
+            item = self.item(row, 0)
+            project = item.data(ShotgunModel.SG_DATA_ROLE)
+            if project is not None:
+                items[project["id"]] = item
+        return items
+
+    @staticmethod
+    def _clean_project(project):
+        """
+        Converts the dates of a project returned by Shotgun to Unix timestamps, like
+        the ShotgunModel does with the data it downloads.
+        """
+        for field, value in project.items():
+            if isinstance(value, datetime.datetime):
+                project[field] = time.mktime(value.timetuple())
+        return project
+
+    def _on_projects_updated(self, projects):
+        """
+        Called with a page of projects updated since the last delta sync.
+        """
+        items = self._get_items_by_project_id()
+        for project in projects:
+            project = self._clean_project(project)
+            item = items.get(project["id"])
+            if item is None:
+                item = QtGui.QStandardItem(project["name"])
+                item.setEditable(False)
+                self._populate_default_thumbnail(item)
+                self.appendRow(item)
+            item.setData(project, ShotgunModel.SG_DATA_ROLE)
+            self._populate_item(item, project)
+            if project.get("image"):
+                self._request_thumbnail_download(
+                    item, "image", project["image"], "Project", project["id"]
+                )
+        self.data_refreshed.emit(True)
+
+    def _on_projects_swept(self, projects):
+        """
+        Called with all the projects that still exist, to remove the others and
+        update the fields specific to the current user.
+        """
+        items = self._get_items_by_project_id()
+        changed = False
+        for project in projects:
+            project = self._clean_project(project)
+            item = items.pop(project["id"], None)
+            if item is None:
+                continue
+            sg_data = item.data(ShotgunModel.SG_DATA_ROLE)
+            # The image URLs are signed differently by each query, so they would
+            # always be reported as changed.
+            fields = dict(
+                (field, value)
+                for field, value in project.items()
+                if field not in ("type", "image")
+            )
+            if any(sg_data.get(field) != value for field, value in fields.items()):
+                sg_data.update(fields)
+                item.setData(sg_data, ShotgunModel.SG_DATA_ROLE)
+                changed = True
+
+        # Whatever wasn't returned has been deleted.
+        for row in sorted((item.row() for item in items.values()), reverse=True):
+            self.removeRow(row)
+
+        if changed or items:
+            self.data_refreshed.emit(True)
+
+    def _on_sync_finished(self):
+        """
+        Called once a sync is complete, to save the projects so the next launch only
+        downloads the ones that changed since.
+        """
+        projects = [
+            item.data(ShotgunModel.SG_DATA_ROLE)
+            for item in self._get_items_by_project_id().values()
+        ]
+        # Pages are downloaded by id, so the watermark is only moved once all of
+        # them are.
+        for project in projects:
+            updated_at = project.get("updated_at")
+            if updated_at is not None and (
+                self._watermark is None or updated_at > self._watermark
+            ):
+                self._watermark = updated_at
+        self._delta_cache.save(self._watermark, projects)
 
     def update_project_accessed_time(self, project):
         """
         Set the current user's last-accessed time for the given project.
 
-        This will update the value in the model and in Shotgun.
+        This will update the value in the model right away and in Shotgun in the
+        background.
         """
         if project is None:
             return
 
-        # Update Project.last_accessed_by_current_user in Shotgun
+        # Queue the update of Project.last_accessed_by_current_user in Shotgun
         engine = sgtk.platform.current_engine()
-        engine.shotgun.update_project_last_accessed(project, engine.get_current_login())
+        self._last_accessed_queue.record(project, engine.get_current_login())
 
         # Update the data in the model
-        item = self.item_from_entity("Project", project["id"])
+        if self._delta_sync is None:
+            item = self.item_from_entity("Project", project["id"])
+        else:
+            # Projects added by the delta sync are not known to the ShotgunModel.
+            item = self._get_items_by_project_id().get(project["id"])
         # set to unix seconds rather than datetime to be compatible with Shotgun model
         utc_now_epoch = time.mktime(
             datetime.datetime.now(datetime.timezone.utc).utctimetuple()
@@ -329,6 +683,15 @@ class SgProjectModel(ShotgunModel):
 
         self.project_launched.emit()
 
+    @staticmethod
+    def _send_project_accessed_time(project, user):
+        """
+        Updates Project.last_accessed_by_current_user in Shotgun. Called from the
+        last accessed queue's thread.
+        """
+        engine = sgtk.platform.current_engine()
+        engine.shotgun.update_project_last_accessed(project, user)
+
     def _populate_item(self, item, sg_data):
         """
         Implement the abstract class method from ShotgunModel.
@@ -351,9 +714,54 @@ class SgProjectModel(ShotgunModel):
 
         Set the thumbnail directly from the path.
         """
-        # first load as a pixmap to avoid the icon delayed loading
-        thumb = QtGui.QPixmap(path)
-        item.setIcon(thumb)
+        self._load_icon(item, path, path)
+
+    def _populate_thumbnail_image(self, item, field, image, path):
+        """
+        Implement the abstract class method from ShotgunModel.
+
+        Set the thumbnail from the image decoded in the background.
+        """
+        project = item.data(ShotgunModel.SG_DATA_ROLE)
+        if project is not None:
+            self._thumbnail_images.insert(
+                ThumbnailCache.key(project["id"], path, None, None), image
+            )
+        self._load_icon(item, path, image)
+
+    def _load_icon(self, item, path, source):
+        """
+        Scales the icon of an item in the background. The thumbnail is set on the
+        item once its icon is ready.
+
+        :param item: Project item.
+        :param str path: Path to the thumbnail.
+        :param source: Path to the thumbnail, or its decoded ``QImage``.
+        """
+        project = item.data(ShotgunModel.SG_DATA_ROLE)
+        project_id = project["id"] if project is not None else None
+        key = ThumbnailCache.key(project_id, path, self.ICON_SIZE, None)
+        self._pending_icons[key] = QtCore.QPersistentModelIndex(item.index())
+        self._icon_loader.load(key, source, _scale_icon)
+
+    def _cancel_icons(self):
+        """
+        Cancels the icons being scaled, since their items are about to be removed.
+        """
+        self._icon_loader.cancel_all()
+        self._pending_icons.clear()
+
+    def _on_icon_loaded(self, key, pixmap):
+        """
+        Called when the icon of an item was scaled in the background.
+        """
+        index = self._pending_icons.pop(key, None)
+        if index is None or not index.isValid():
+            # The item was removed in the meantime.
+            return
+        item = self.itemFromIndex(QtCore.QModelIndex(index))
+        item.setData(key[1], self.THUMBNAIL_PATH_ROLE)
+        item.setIcon(pixmap)
 
         # signal anybody listening for thumbnail updates
         self.thumbnail_updated.emit(item)
@@ -0,0 +1,220 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import collections
+
+from tank.platform.qt import QtCore, QtGui
+
+import sgtk
+
+from .project_delegate import ProjectThumbnails
+from .project_model import SgProjectModel
+
+shotgun_model = sgtk.platform.import_framework(
+    "tk-framework-shotgunutils", "shotgun_model"
+)
+
+ShotgunModel = shotgun_model.ShotgunModel
+
+
+class SgProjectPainterDelegate(QtGui.QStyledItemDelegate):
+    """
+    Draws the projects directly with a QPainter, with the same layout as the
+    ThumbWidget used by SgProjectDelegate, instead of styling and rendering a widget
+    for each cell.
+
+    Project names are laid out once per text and width, and the layouts and their
+    heights are cached.
+    """
+
+    # Same margins and spacing as the ThumbWidget.
+    MARGIN = 15
+    SPACING = 10
+    # Number of laid out project names kept for painting.
+    MAX_DOCUMENTS = 1000
+    # Number of project name heights kept for computing the size hints. They are
+    # much smaller than the layouts, so more of them are kept.
+    MAX_TEXT_HEIGHTS = 10000
+
+    def __init__(self, view, size, thumbnail_images=None):
+        """
+        :param view: View the delegate paints in.
+        :param size: QSize with the width of the cells.
+        :param thumbnail_images: :class:`ThumbnailCache` of the thumbnails the
+            project model already decoded.
+        """
+        QtGui.QStyledItemDelegate.__init__(self, view)
+        self._size = size
+        self._view = view
+        self._thumbnails = ProjectThumbnails(thumbnail_images, parent=self)
+        self._thumbnails.thumb_size = size.width() - 2 * self.MARGIN
+        self._thumbnails.thumbnail_loaded.connect(self._view.viewport().update)
+
+        # Laid out names and their heights by (text, width), for the current font.
+        self._font = None
+        self._documents = collections.OrderedDict()
+        self._text_heights = collections.OrderedDict()
+
+    def cache_thumbnail(self, item):
+        """
+        Scales a project thumbnail that was just downloaded in the background, so
+        painting it is only a cache lookup.
+
+        :param item: Project item from the project model.
+        """
+        self._thumbnails.cache(item)
+
+    def cancel_thumbnail_loading(self):
+        """
+        Cancels the thumbnails being scaled, for example because the model is reset.
+        """
+        self._thumbnails.cancel()
+
+    def paint(self, painter, option, index):
+        """
+        Draws the selection, the thumbnail and the name of a project.
+        """
+        painter.save()
+        rect = option.rect
+
+        if option.state & QtGui.QStyle.State_Selected:
+            # Same colors as ThumbWidget.set_selected
+            highlight = option.palette.color(
+                QtGui.QPalette.Active, QtGui.QPalette.Highlight
+            )
+            background = QtGui.QColor(highlight)
+            background.setAlphaF(0.25)
+            frame = rect.adjusted(0, 0, -1, -1)
+            painter.fillRect(frame, background)
+            painter.setPen(highlight)
+            painter.drawRect(frame)
+
+        thumb_size = self._thumbnails.thumb_size
+        thumb = self._thumbnails.get(
+            index.data(ShotgunModel.SG_DATA_ROLE),
+            index.data(SgProjectModel.THUMBNAIL_PATH_ROLE),
+        )
+        # Centered like in the ThumbWidget's label.
+        painter.drawPixmap(
+            rect.left() + self.MARGIN + (thumb_size - thumb.width()) // 2,
+            rect.top() + self.MARGIN + (thumb_size - thumb.height()) // 2,
+            thumb,
+        )
+
+        document = self._get_document(
+            index.data(SgProjectModel.DISPLAY_NAME_ROLE),
+            rect.width() - 2 * self.MARGIN,
+            option.font,
+        )
+        painter.translate(
+            rect.left() + self.MARGIN,
+            rect.top() + self.MARGIN + thumb_size + self.SPACING,
+        )
+        context = QtGui.QAbstractTextDocumentLayout.PaintContext()
+        context.palette.setColor(
+            QtGui.QPalette.Text, option.palette.color(QtGui.QPalette.WindowText)
+        )
+        document.documentLayout().draw(painter, context)
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        """
+        :returns: The size of a project cell, from the cached height of its name.
+        """
+        width = self._size.width()
+        text_height = self._get_text_height(
+            index.data(SgProjectModel.DISPLAY_NAME_ROLE),
+            width - 2 * self.MARGIN,
+            option.font,
+        )
+        height = (
+            2 * self.MARGIN + self._thumbnails.thumb_size + self.SPACING + text_height
+        )
+        return QtCore.QSize(width, height)
+
+    def precompute_size_hints(self, texts):
+        """
+        Lays out the given project names ahead of the view's layout.
+
+        :param texts: Project names.
+        """
+        width = self._size.width() - 2 * self.MARGIN
+        font = self._view.font()
+        for text in set(texts):
+            self._get_text_height(text, width, font)
+
+    def helpEvent(self, event, view, option, index):
+        """
+        Shows the project description as the tooltip.
+        """
+        if event.type() == QtCore.QEvent.ToolTip:
+            project = index.data(ShotgunModel.SG_DATA_ROLE)
+            if project is not None:
+                QtGui.QToolTip.showText(
+                    event.globalPos(), project.get("sg_description") or "", view
+                )
+                return True
+        return QtGui.QStyledItemDelegate.helpEvent(self, event, view, option, index)
+
+    def _get_text_height(self, text, width, font):
+        """
+        :returns: The height of the text laid out at the given width.
+        """
+        self._check_font(font)
+        key = (text, width)
+        height = self._text_heights.get(key)
+        if height is not None:
+            self._text_heights.move_to_end(key)
+            return height
+
+        height = int(self._get_document(text, width, font).size().height())
+        self._text_heights[key] = height
+        if len(self._text_heights) > self.MAX_TEXT_HEIGHTS:
+            self._text_heights.popitem(last=False)
+        return height
+
+    def _get_document(self, text, width, font):
+        """
+        :returns: The QTextDocument with the text laid out at the given width.
+        """
+        self._check_font(font)
+        key = (text, width)
+        document = self._documents.get(key)
+        if document is not None:
+            self._documents.move_to_end(key)
+            return document
+
+        document = QtGui.QTextDocument()
+        document.setDocumentMargin(0)
+        document.setDefaultFont(font)
+        # Same alignment and wrapping as the ThumbWidget's label.
+        text_option = QtGui.QTextOption(QtCore.Qt.AlignHCenter)
+        text_option.setWrapMode(QtGui.QTextOption.WordWrap)
+        document.setDefaultTextOption(text_option)
+        # Names are rich text while they are highlighted by a search.
+        if text and "<" in text:
+            document.setHtml(text)
+        else:
+            document.setPlainText(text or "")
+        document.setTextWidth(width)
+
+        self._documents[key] = document
+        if len(self._documents) > self.MAX_DOCUMENTS:
+            self._documents.popitem(last=False)
+        return document
+
+    def _check_font(self, font):
+        """
+        Drops the cached layouts if the font changed.
+        """
+        if font != self._font:
+            self._font = QtGui.QFont(font)
+            self._documents.clear()
+            self._text_heights.clear()
@@ -9,6 +9,8 @@
 # not expressly granted therein are reserved by Shotgun Software Inc.
 #
 
+import time
+
 from sgtk.platform.qt import QtCore
 import sgtk
 
@@ -34,10 +36,12 @@ class ProjectSynchronizationThread(QtCore.QThread):
     sync_failed = QtCore.Signal(str)
     sync_success = QtCore.Signal(str, object)
 
-    def __init__(self, manager, project):
+    def __init__(self, manager, project, throttle=0):
         """
         :param manager: ToolkitManager to prepare to prepare the engine with.
         :param project: Project for which we require the engine to be prepared.
+        :param float throttle: Number of seconds to sleep each time progress is reported,
+            to slow down syncing when it runs in the background.
         """
         super().__init__()
         self._toolkit_manager = manager
@@ -45,6 +49,7 @@ class ProjectSynchronizationThread(QtCore.QThread):
         self._abort = False
         self._engine = sgtk.platform.current_engine()
         self._project = project
+        self._throttle = throttle
 
     def _report_progress(self, pct, msg):
         """
@@ -60,6 +65,8 @@ class ProjectSynchronizationThread(QtCore.QThread):
             raise ProjectSyncingCancelledError()
         else:
             self.report_progress.emit(pct, msg)
+            if self._throttle:
+                time.sleep(self._throttle)
 
     def run(self):
         """
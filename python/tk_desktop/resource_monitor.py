@@ -0,0 +1,354 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Samples the resources used by the project background process and its children.
+"""
+
+import collections
+import os
+import sys
+import threading
+import time
+import typing
+
+import sgtk
+
+logger = sgtk.LogManager.get_logger(__name__)
+
+# Number of seconds between two samples.
+DEFAULT_SAMPLE_INTERVAL: float = 5
+# Number of samples kept in memory, an hour's worth by default.
+DEFAULT_HISTORY_SIZE: int = 720
+# Amount of memory used by the background process above which a warning is logged.
+DEFAULT_MEMORY_THRESHOLD: int = 4 * 1024**3
+
+
+class ProcessResources(typing.NamedTuple):
+    """
+    Resources used by a process tree at a given point in time.
+    """
+
+    #: Time of the sample, in seconds since the epoch.
+    timestamp: float
+    #: Total CPU time consumed so far, in seconds.
+    cpu_time: float
+    #: CPU usage since the previous sample, where 100 is one core fully used.
+    cpu_percent: float
+    #: Resident memory, in bytes.
+    rss: int
+    #: Number of threads.
+    num_threads: int
+    #: Number of open file descriptors, or None if not available.
+    num_fds: typing.Optional[int]
+    #: Number of processes, the background process included.
+    num_processes: int
+
+
+class ProcfsBackend:
+    """
+    Reads the resources of a process tree from ``/proc`` on Linux.
+    """
+
+    def __init__(self, root: str = "/proc") -> None:
+        self._root = root
+        self._clock_ticks = os.sysconf("SC_CLK_TCK")
+        self._page_size = os.sysconf("SC_PAGE_SIZE")
+
+    def sample(self, pid: int) -> typing.Optional[tuple]:
+        """
+        :param pid: Id of the root of the process tree.
+
+        :returns: A tuple of (cpu time, rss, threads, file descriptors, processes)
+            or None if the process doesn't exist anymore.
+        """
+        pids = [pid] + self._get_descendants(pid)
+        totals = [0.0, 0, 0, 0, 0]
+        for current_pid in pids:
+            stat = self._read_stat(current_pid)
+            if stat is None:
+                if current_pid == pid:
+                    return None
+                continue
+            # Fields are numbered from 1 in proc(5) and the 2 first ones
+            # were stripped, so utime (14) is at index 11.
+            totals[0] += (int(stat[11]) + int(stat[12])) / self._clock_ticks
+            totals[2] += int(stat[17])
+            totals[1] += int(stat[21]) * self._page_size
+            try:
+                totals[3] += len(
+                    os.listdir(os.path.join(self._root, str(current_pid), "fd"))
+                )
+            except OSError:
+                pass
+            totals[4] += 1
+        return tuple(totals)
+
+    def _read_stat(self, pid: int) -> typing.Optional[typing.List[str]]:
+        """
+        :returns: The fields of ``/proc/<pid>/stat`` after the command name, or None.
+        """
+        try:
+            with open(os.path.join(self._root, str(pid), "stat")) as fh:
+                content = fh.read()
+        except OSError:
+            return None
+        # The command name is between parentheses and can contain spaces.
+        return content[content.rfind(")") + 2 :].split()
+
+    def _get_descendants(self, pid: int) -> typing.List[int]:
+        """
+        :returns: The ids of all the descendants of a process.
+        """
+        children = collections.defaultdict(list)
+        for entry in os.listdir(self._root):
+            if not entry.isdigit():
+                continue
+            stat = self._read_stat(int(entry))
+            if stat is not None:
+                children[int(stat[1])].append(int(entry))
+
+        descendants = []
+        pending = [pid]
+        while pending:
+            for child in children.get(pending.pop(), []):
+                descendants.append(child)
+                pending.append(child)
+        return descendants
+
+
+class PsutilBackend:
+    """
+    Reads the resources of a process tree with ``psutil``.
+    """
+
+    def __init__(self) -> None:
+        import psutil
+
+        self._psutil = psutil
+
+    def sample(self, pid: int) -> typing.Optional[tuple]:
+        """
+        :param pid: Id of the root of the process tree.
+
+        :returns: A tuple of (cpu time, rss, threads, file descriptors, processes)
+            or None if the process doesn't exist anymore.
+        """
+        try:
+            root = self._psutil.Process(pid)
+            processes = [root] + root.children(recursive=True)
+        except self._psutil.Error:
+            return None
+
+        totals = [0.0, 0, 0, None, 0]
+        for process in processes:
+            try:
+                with process.oneshot():
+                    cpu_times = process.cpu_times()
+                    totals[0] += cpu_times.user + cpu_times.system
+                    totals[1] += process.memory_info().rss
+                    totals[2] += process.num_threads()
+                    if hasattr(process, "num_fds"):
+                        totals[3] = (totals[3] or 0) + process.num_fds()
+                    elif hasattr(process, "num_handles"):
+                        totals[3] = (totals[3] or 0) + process.num_handles()
+            except self._psutil.Error:
+                if process is root:
+                    return None
+                continue
+            totals[4] += 1
+        return tuple(totals)
+
+
+def get_default_backend():
+    """
+    :returns: The backend to use on this platform, or None if resources can't be sampled.
+    """
+    if sys.platform.startswith("linux") and os.path.isdir("/proc"):
+        return ProcfsBackend()
+    try:
+        return PsutilBackend()
+    except ImportError:
+        return None
+
+
+class ResourceMonitor:
+    """
+    Samples the resources of a process from a background thread and keeps
+    a rolling history of them.
+    """
+
+    def __init__(
+        self,
+        backend=None,
+        interval: float = DEFAULT_SAMPLE_INTERVAL,
+        history_size: int = DEFAULT_HISTORY_SIZE,
+        memory_threshold: typing.Optional[int] = DEFAULT_MEMORY_THRESHOLD,
+    ) -> None:
+        """
+        :param backend: Object with a ``sample(pid)`` method. Defaults to the best
+            backend for the platform.
+        :param interval: Number of seconds between two samples.
+        :param history_size: Number of samples to keep.
+        :param memory_threshold: Number of bytes of resident memory above which a
+            warning is logged, or None to never warn.
+        """
+        self._backend = backend if backend is not None else get_default_backend()
+        self._interval = interval
+        self.memory_threshold = memory_threshold
+        self._history = collections.deque(maxlen=history_size)
+        self._lock = threading.Lock()
+        self._wake_up = threading.Event()
+        self._thread = None
+        self._is_stopping = False
+        self._pid = None
+        self._is_above_threshold = False
+
+    @property
+    def is_available(self) -> bool:
+        """
+        ``True`` if resources can be sampled on this platform.
+        """
+        return self._backend is not None
+
+    def watch(self, pid: typing.Optional[int]) -> None:
+        """
+        Starts sampling a new process, forgetting about the previous one.
+
+        :param pid: Id of the process to watch, or None to stop watching.
+        """
+        with self._lock:
+            self._pid = pid
+            self._history.clear()
+            self._is_above_threshold = False
+
+        if pid is not None and self.is_available and self._thread is None:
+            self._is_stopping = False
+            self._thread = threading.Thread(
+                target=self._run, name="ResourceMonitor", daemon=True
+            )
+            self._thread.start()
+        self._wake_up.set()
+
+    def stop(self) -> None:
+        """
+        Stops the sampling thread.
+        """
+        self._is_stopping = True
+        self._wake_up.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self._interval)
+            self._thread = None
+
+    @property
+    def samples(self) -> typing.List[ProcessResources]:
+        """
+        Samples collected for the current process, oldest first.
+        """
+        with self._lock:
+            return list(self._history)
+
+    @property
+    def latest(self) -> typing.Optional[ProcessResources]:
+        """
+        Most recent sample, or None.
+        """
+        with self._lock:
+            return self._history[-1] if self._history else None
+
+    def format_summary(self) -> str:
+        """
+        :returns: A one line description of the latest sample and the peak memory usage.
+        """
+        if not self.is_available:
+            return "Resource monitoring is not available on this platform."
+
+        samples = self.samples
+        if not samples:
+            return "No background process resources sampled yet."
+
+        latest = samples[-1]
+        summary = (
+            "Background process: {processes} process(es), CPU {cpu:.0f}%, "
+            "memory {rss:.0f} MB (peak {peak:.0f} MB), {threads} threads"
+        ).format(
+            processes=latest.num_processes,
+            cpu=latest.cpu_percent,
+            rss=latest.rss / 1024**2,
+            peak=max(sample.rss for sample in samples) / 1024**2,
+            threads=latest.num_threads,
+        )
+        if latest.num_fds is not None:
+            summary += ", {} open files".format(latest.num_fds)
+        return summary
+
+    def sample_once(self) -> typing.Optional[ProcessResources]:
+        """
+        Samples the watched process and records the result.
+
+        :returns: The new sample, or None if no process is being watched.
+        """
+        pid = self._pid
+        if pid is None:
+            return None
+
+        values = self._backend.sample(pid)
+        now = time.time()
+        with self._lock:
+            if pid != self._pid:
+                return None
+            if values is None:
+                # The process is gone, nothing left to watch.
+                self._pid = None
+                return None
+
+            cpu_time, rss, num_threads, num_fds, num_processes = values
+            cpu_percent = 0.0
+            if self._history:
+                previous = self._history[-1]
+                elapsed = now - previous.timestamp
+                if elapsed > 0:
+                    cpu_percent = max(
+                        0.0, (cpu_time - previous.cpu_time) / elapsed * 100
+                    )
+            sample = ProcessResources(
+                now, cpu_time, cpu_percent, rss, num_threads, num_fds, num_processes
+            )
+            self._history.append(sample)
+
+            crossed = (
+                self.memory_threshold is not None
+                and rss > self.memory_threshold
+                and not self._is_above_threshold
+            )
+            if self.memory_threshold is not None:
+                self._is_above_threshold = rss > self.memory_threshold
+
+        if crossed:
+            logger.warning(
+                "The background process (pid %s) uses %.0f MB of memory, more than the "
+                "%.0f MB threshold. An app may be leaking memory.",
+                pid,
+                rss / 1024**2,
+                self.memory_threshold / 1024**2,
+            )
+        return sample
+
+    def _run(self) -> None:
+        """
+        Samples the watched process until stopped.
+        """
+        while not self._is_stopping:
+            self._wake_up.clear()
+            try:
+                self.sample_once()
+            except Exception:
+                logger.debug("Could not sample the background process.", exc_info=True)
+            self._wake_up.wait(self._interval if self._pid is not None else None)
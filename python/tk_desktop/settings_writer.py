@@ -0,0 +1,150 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Writes settings from a background thread, so clicking in the UI never waits on the
+settings file.
+"""
+
+import collections
+import copy
+import threading
+
+from sgtk import LogManager
+
+logger = LogManager.get_logger(__name__)
+
+
+class SettingsWriter(object):
+    """
+    Write-behind layer for settings that change often.
+
+    Values are kept in memory and written by a background thread a little while
+    after they change, so many changes to the same key are written once. Values that
+    haven't been written yet are returned by :meth:`get`, so reading a setting back
+    always returns the last value.
+    """
+
+    # Number of seconds to wait after a change before writing, so changes made in
+    # quick succession are batched.
+    DELAY = 2
+
+    def __init__(self, store_func, delay=DELAY):
+        """
+        :param store_func: Callable taking a key and a value, which stores the
+            setting. It is called from the background thread, and from the thread
+            calling :meth:`flush` or :meth:`stop`.
+        :param float delay: Number of seconds to wait after a change before writing.
+        """
+        self._store_func = store_func
+        self._delay = delay
+
+        self._lock = threading.Lock()
+        # Held while values are written, so they are written in order.
+        self._write_lock = threading.Lock()
+        self._wake_up = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = None
+        # Values waiting to be written, by key.
+        self._pending = collections.OrderedDict()
+        # Values being written, by key.
+        self._writing = {}
+
+    @property
+    def pending_count(self):
+        """
+        Number of keys whose value hasn't been written yet.
+        """
+        with self._lock:
+            return len(self._pending) + len(self._writing)
+
+    def write(self, key, value):
+        """
+        Queues a setting to be written.
+
+        :param str key: Name of the setting.
+        :param value: Value of the setting. It is copied, so it can be modified
+            afterwards.
+        """
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._pending.pop(key, None)
+            self._pending[key] = value
+        self._wake_up.set()
+
+    def get(self, key, default=None):
+        """
+        :param str key: Name of the setting.
+        :param default: Value returned if the setting isn't waiting to be written.
+
+        :returns: A copy of the value waiting to be written for the key, or the
+            default.
+        """
+        with self._lock:
+            if key in self._pending:
+                return copy.deepcopy(self._pending[key])
+            if key in self._writing:
+                return copy.deepcopy(self._writing[key])
+        return default
+
+    def start(self):
+        """
+        Starts writing the settings in the background.
+        """
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="SettingsWriter", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """
+        Stops the background thread and writes the remaining settings.
+
+        :param float timeout: Number of seconds to wait for a write in progress.
+        """
+        self._stopping.set()
+        self._wake_up.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        self.flush()
+
+    def flush(self):
+        """
+        Writes all the pending settings in the calling thread.
+        """
+        with self._write_lock:
+            with self._lock:
+                self._writing = self._pending
+                self._pending = collections.OrderedDict()
+            for key, value in self._writing.items():
+                try:
+                    self._store_func(key, value)
+                except Exception as e:
+                    logger.warning("Could not write setting %s: %s", key, e)
+            with self._lock:
+                self._writing = {}
+
+    def _run(self):
+        """
+        Writes the settings a little while after they change.
+        """
+        while True:
+            self._wake_up.wait()
+            if self._stopping.is_set():
+                return
+            # Let the changes made in quick succession accumulate.
+            if self._stopping.wait(self._delay):
+                return
+            self._wake_up.clear()
+            self.flush()
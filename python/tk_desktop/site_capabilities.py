@@ -0,0 +1,240 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Caches what the site supports on disk, so startup doesn't wait on the server version
+and schema queries.
+"""
+
+import json
+import os
+import re
+import threading
+import time
+
+import sgtk
+from sgtk import LogManager
+
+logger = LogManager.get_logger(__name__)
+
+# Message of the fault raised by the server when reading the schema of a field that
+# doesn't exist.
+_FIELD_NOT_FOUND_RE = re.compile(r"doesn't exist|does not exist|not a valid field")
+
+
+class SiteCapabilities(object):
+    """
+    Server version and existence of the schema fields used by Desktop, for a site.
+
+    Cached values are returned right away and revalidated in a background thread
+    once they are older than the time to live. Values that were never cached are
+    queried synchronously.
+    """
+
+    # Number of seconds before the cached values are revalidated.
+    TTL = 24 * 60 * 60
+    # Schema fields Desktop checks for, as (entity type, field name) tuples.
+    FIELDS = [("Project", "is_template")]
+
+    def __init__(self, cache_path, site_url, get_connection, ttl=TTL):
+        """
+        :param str cache_path: Path to the file the capabilities are cached in.
+        :param str site_url: Url of the site.
+        :param get_connection: Callable returning a Shotgun connection to the site.
+            It is also called from the background thread.
+        :param float ttl: Number of seconds before the cached values are
+            revalidated.
+        """
+        self._cache_path = cache_path
+        self._site_url = site_url
+        self._get_connection = get_connection
+        self._ttl = ttl
+
+        self._lock = threading.Lock()
+        self._thread = None
+        self._server_version = None
+        # Whether fields exist, by "Entity.field" key.
+        self._fields = {}
+        self._checked_at = 0
+        self._load()
+
+    @property
+    def is_stale(self):
+        """
+        ``True`` if the cached values are older than the time to live.
+        """
+        return time.time() - self._checked_at > self._ttl
+
+    def get_server_version(self):
+        """
+        :returns: Tuple of (major, minor, patch) versions.
+        """
+        with self._lock:
+            version = self._server_version
+        if version is None:
+            version = self._read_server_version(self._get_connection())
+            with self._lock:
+                self._server_version = version
+                self._save()
+        else:
+            self.revalidate()
+        return version
+
+    def has_field(self, entity_type, field_name):
+        """
+        :param str entity_type: Entity type of the field.
+        :param str field_name: Name of the field.
+
+        :returns: ``True`` if the field exists on the site.
+        """
+        key = "%s.%s" % (entity_type, field_name)
+        with self._lock:
+            exists = self._fields.get(key)
+        if exists is None:
+            try:
+                exists = self._read_field(
+                    self._get_connection(), entity_type, field_name
+                )
+            except Exception as e:
+                # Not cached, so it is checked again the next time.
+                logger.warning("Could not check if %s exists: %s", key, e)
+                return False
+            with self._lock:
+                self._fields[key] = exists
+                self._save()
+        else:
+            self.revalidate()
+        return exists
+
+    def revalidate(self):
+        """
+        Refreshes the cached values in a background thread if they are stale.
+        """
+        with self._lock:
+            if not self.is_stale or self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._revalidate, name="SiteCapabilities", daemon=True
+            )
+            self._thread.start()
+
+    def refresh(self):
+        """
+        Queries all the capabilities and caches them.
+        """
+        connection = self._get_connection()
+        with self._lock:
+            keys = set(self._fields)
+        keys.update("%s.%s" % field for field in self.FIELDS)
+
+        version = self._read_server_version(connection)
+        fields = {}
+        for key in keys:
+            fields[key] = self._read_field(connection, *key.split(".", 1))
+
+        with self._lock:
+            self._server_version = version
+            self._fields.update(fields)
+            self._checked_at = time.time()
+            self._save()
+
+    def _revalidate(self):
+        """
+        Refreshes the cached values. Runs in the background thread.
+        """
+        try:
+            self.refresh()
+        except Exception as e:
+            logger.debug("Could not revalidate the site capabilities: %s", e)
+        finally:
+            with self._lock:
+                self._thread = None
+
+    @staticmethod
+    def _read_server_version(connection):
+        return tuple(connection.server_info["version"][:3])
+
+    @staticmethod
+    def _read_field(connection, entity_type, field_name):
+        """
+        :returns: ``True`` if the field exists, ``False`` if the server reports that
+            it doesn't.
+
+        :raises Exception: If the server couldn't be queried.
+        """
+        try:
+            connection.schema_field_read(entity_type, field_name)
+        except Exception as e:
+            # The server raises a Fault for fields that don't exist. It can't be
+            # caught by class, so the message is checked. Any other error, like a
+            # network or authentication failure, says nothing about the field.
+            if _FIELD_NOT_FOUND_RE.search(str(e)):
+                return False
+            raise
+        return True
+
+    def _load(self):
+        """
+        Reads the capabilities cached for the site.
+        """
+        try:
+            with open(self._cache_path, "r") as fh:
+                data = json.load(fh)
+        except (IOError, OSError):
+            return
+        except Exception:
+            logger.warning("Ignoring invalid site capabilities %s", self._cache_path)
+            return
+
+        if data.get("site") != self._site_url:
+            return
+        if data.get("server_version"):
+            self._server_version = tuple(data["server_version"])
+        self._fields = data.get("fields", {})
+        self._checked_at = data.get("checked_at", 0)
+
+    def _save(self):
+        """
+        Writes the capabilities to the cache. Must be called with the lock.
+        """
+        data = {
+            "site": self._site_url,
+            "checked_at": self._checked_at,
+            "server_version": self._server_version,
+            "fields": self._fields,
+        }
+        try:
+            # Write to a temporary file first, so a crash never leaves a truncated
+            # cache behind.
+            tmp_path = self._cache_path + ".tmp"
+            with open(tmp_path, "w") as fh:
+                json.dump(data, fh)
+            os.replace(tmp_path, self._cache_path)
+        except (IOError, OSError) as e:
+            logger.warning("Could not write the site capabilities: %s", e)
+
+
+# Capabilities of the sites used in this process, by site url.
+_site_capabilities = {}
+
+
+def get_site_capabilities():
+    """
+    :returns: The :class:`SiteCapabilities` of the site of the current engine.
+    """
+    engine = sgtk.platform.current_engine()
+    site_url = engine.sgtk.shotgun_url
+    if site_url not in _site_capabilities:
+        _site_capabilities[site_url] = SiteCapabilities(
+            os.path.join(engine.cache_location, "site_capabilities.json"),
+            site_url,
+            lambda: sgtk.platform.current_engine().shotgun,
+        )
+    return _site_capabilities[site_url]
@@ -13,10 +13,12 @@ Implements communication channels between the desktop app and the background pro
 """
 
 import subprocess
+import typing
 
 import sgtk
 from . import bootstrap_process
 from . import communication_base
+from .resource_monitor import ResourceMonitor
 
 logger = sgtk.LogManager.get_logger(__name__)
 
@@ -35,6 +37,10 @@ class SiteCommunication(
         communication_base.CommunicationBase.__init__(self)
         sgtk.platform.qt.QtCore.QObject.__init__(self)
         self._bootstrap_process = None
+        # Terminates the bootstrap processes we're done with without blocking the UI.
+        self._process_reaper = bootstrap_process.ProcessReaper()
+        # Samples the resources used by the bootstrap process and its children.
+        self.resource_monitor = ResourceMonitor()
 
     def set_bootstrap_process(self, process: subprocess.Popen) -> None:
         """
@@ -44,14 +50,30 @@ class SiteCommunication(
         """
         self._terminate_bootstrap_process()
         self._bootstrap_process = process
+        self.resource_monitor.watch(process.pid)
 
     def _terminate_bootstrap_process(self) -> None:
         """
-        Terminates the bootstrap subprocess if one is still running.
+        Terminates the bootstrap subprocess if one is still running. This doesn't
+        wait for the process to exit.
         """
         process = self._bootstrap_process
         self._bootstrap_process = None
-        bootstrap_process.terminate_process(process)
+        self.resource_monitor.watch(None)
+        self._process_reaper.retire(process)
+
+    def wait_for_retired_processes(
+        self, timeout: typing.Optional[float] = None
+    ) -> bool:
+        """
+        Waits for the bootstrap processes being terminated to exit.
+
+        :param timeout: Number of seconds to wait for, or None to wait until
+            they are all terminated or killed.
+
+        :returns: ``True`` if all the processes exited.
+        """
+        return self._process_reaper.wait(timeout)
 
     def shut_down(self) -> None:
         """
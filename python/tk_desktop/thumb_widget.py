@@ -8,18 +8,21 @@
 # agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
 # not expressly granted therein are reserved by Shotgun Software Inc.
 
-import os
-
-from tank.platform.qt import QtGui
-from tank.platform.qt import QtCore
+from tank.platform.qt import QtCore, QtGui
 
 from .ui import thumb_widget
+from .thumbnail_cache import compose_thumbnail, get_thumbnail_mode
 
 
 class ThumbWidget(QtGui.QWidget):
     """Thumbnail widget to poplulate the projects list view"""
 
     SIZER_WIDGET = None
+    # Heights returned by height_for_width, by (text, width). They are computed with
+    # the SIZER_WIDGET and forgotten when its font or style changes.
+    _HEIGHTS = {}
+    # Number of heights remembered before starting over.
+    _MAX_HEIGHTS = 10000
 
     def __init__(self, width=120, parent=None):
         QtGui.QWidget.__init__(self, parent)
@@ -36,31 +39,50 @@ class ThumbWidget(QtGui.QWidget):
 
     def set_thumbnail(self, pixmap):
         """Set a thumbnail given the current pixmap."""
+        self.set_scaled_thumbnail(
+            compose_thumbnail(pixmap, self.thumb_size, get_thumbnail_mode())
+        )
 
-        if os.getenv("SGTK_PROJ_THUMB_OLD") == "True":
-            # zoom to fit height, then crop to center
-            pixmap = pixmap.scaledToHeight(
-                self.thumb_size, QtCore.Qt.SmoothTransformation
-            )
-            if pixmap.width() > self.thumb_size:
-                extra = pixmap.width() - self.thumb_size
-                pixmap = pixmap.copy(extra / 2, 0, self.thumb_size, self.thumb_size)
-        else:
-            # keep thumbnail ratio and add "letter box" margins if needed
-            # (margins will use background color)
-            dst_pixmap = QtGui.QPixmap(self.thumb_size, self.thumb_size)
-            pixmap = pixmap.scaled(dst_pixmap.size(), QtCore.Qt.KeepAspectRatio)
-            painter = QtGui.QPainter(dst_pixmap)
-            if pixmap.width() < self.thumb_size:
-                painter.drawPixmap((self.thumb_size - pixmap.width()) / 2, 0, pixmap)
-            else:
-                painter.drawPixmap(0, self.thumb_size - pixmap.height() / 2, pixmap)
-            painter.end()
-
+    def set_scaled_thumbnail(self, pixmap):
+        """Set a thumbnail already scaled to the thumbnail size."""
         self.ui.thumbnail.setPixmap(pixmap)
 
     @classmethod
     def height_for_width(cls, width, text):
+        key = (text, width)
+        height = cls._HEIGHTS.get(key)
+        if height is None:
+            if len(cls._HEIGHTS) >= cls._MAX_HEIGHTS:
+                cls._HEIGHTS.clear()
+            height = cls._HEIGHTS[key] = cls._compute_height_for_width(width, text)
+        return height
+
+    @classmethod
+    def precompute_heights(cls, width, texts):
+        """
+        Computes the heights of many texts at once, for example when the projects
+        are refreshed, so the view's layout only hits the cache.
+
+        :param int width: Width of the widgets.
+        :param texts: Texts to compute the heights of.
+        """
+        for text in set(texts):
+            cls.height_for_width(width, text)
+
+    def changeEvent(self, event):
+        """
+        Forgets the heights computed with the sizer widget when its font or style
+        changes.
+        """
+        if self is ThumbWidget.SIZER_WIDGET and event.type() in (
+            QtCore.QEvent.FontChange,
+            QtCore.QEvent.StyleChange,
+        ):
+            ThumbWidget._HEIGHTS.clear()
+        QtGui.QWidget.changeEvent(self, event)
+
+    @classmethod
+    def _compute_height_for_width(cls, width, text):
         if cls.SIZER_WIDGET is None:
             cls.SIZER_WIDGET = cls(width)
 
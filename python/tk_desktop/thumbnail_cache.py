@@ -0,0 +1,160 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Project thumbnails scaled to the size they are displayed at, so the project grid
+doesn't scale them every time a cell is painted.
+"""
+
+import collections
+import os
+
+from tank.platform.qt import QtCore, QtGui
+
+# Thumbnails are scaled to fit and centered, with transparent margins.
+LETTERBOX = "letterbox"
+# Thumbnails are scaled to the height and the sides are cropped.
+CROP = "crop"
+
+
+def get_thumbnail_mode():
+    """
+    :returns: The mode thumbnails are displayed with, ``CROP`` if the
+        ``SGTK_PROJ_THUMB_OLD`` environment variable is set to ``True``,
+        ``LETTERBOX`` otherwise.
+    """
+    return CROP if os.getenv("SGTK_PROJ_THUMB_OLD") == "True" else LETTERBOX
+
+
+def compose_thumbnail(pixmap, size, mode):
+    """
+    Scales a thumbnail to a square.
+
+    ``QImage`` objects can be scaled outside of the main thread, unlike ``QPixmap``
+    objects.
+
+    :param pixmap: ``QPixmap`` or ``QImage`` to scale.
+    :param int size: Width and height of the thumbnail.
+    :param str mode: ``LETTERBOX`` or ``CROP``.
+
+    :returns: The scaled ``QPixmap`` or ``QImage``, depending on the type of the
+        thumbnail.
+    """
+    if mode == CROP:
+        # zoom to fit height, then crop to center
+        pixmap = pixmap.scaledToHeight(size, QtCore.Qt.SmoothTransformation)
+        if pixmap.width() > size:
+            extra = pixmap.width() - size
+            pixmap = pixmap.copy(extra // 2, 0, size, size)
+        return pixmap
+
+    # keep thumbnail ratio and add "letter box" margins if needed
+    is_image = isinstance(pixmap, QtGui.QImage)
+    if is_image:
+        dst_pixmap = QtGui.QImage(size, size, QtGui.QImage.Format_ARGB32_Premultiplied)
+    else:
+        dst_pixmap = QtGui.QPixmap(size, size)
+    dst_pixmap.fill(QtCore.Qt.transparent)
+    pixmap = pixmap.scaled(dst_pixmap.size(), QtCore.Qt.KeepAspectRatio)
+    painter = QtGui.QPainter(dst_pixmap)
+    x = (size - pixmap.width()) // 2
+    y = (size - pixmap.height()) // 2
+    if is_image:
+        painter.drawImage(x, y, pixmap)
+    else:
+        painter.drawPixmap(x, y, pixmap)
+    painter.end()
+    return dst_pixmap
+
+
+class ThumbnailCache(object):
+    """
+    Least recently used cache of scaled thumbnails, bounded by the memory used by
+    the pixmaps.
+
+    Keys are ``(project id, thumbnail path, size, mode)`` tuples, so a new thumbnail
+    being downloaded for a project or a different size being displayed never returns
+    a stale pixmap. ``QImage`` objects can be cached the same way.
+    """
+
+    # Default number of bytes the pixmaps can use.
+    DEFAULT_BUDGET = 32 * 1024 * 1024
+
+    def __init__(self, budget=DEFAULT_BUDGET):
+        """
+        :param int budget: Number of bytes the pixmaps can use.
+        """
+        self._budget = budget
+        self._cost = 0
+        self._pixmaps = collections.OrderedDict()
+
+    @property
+    def cost(self):
+        """
+        Number of bytes used by the cached pixmaps.
+        """
+        return self._cost
+
+    def __len__(self):
+        return len(self._pixmaps)
+
+    @staticmethod
+    def key(project_id, path, size, mode):
+        """
+        :returns: The key of a thumbnail.
+        """
+        return (project_id, path, size, mode)
+
+    def get(self, key):
+        """
+        :returns: The cached ``QPixmap``, or ``None`` if it isn't cached.
+        """
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+        return pixmap
+
+    def insert(self, key, pixmap):
+        """
+        Caches a pixmap, evicting the least recently used ones if the budget is
+        exceeded.
+        """
+        self.remove(key)
+        self._pixmaps[key] = pixmap
+        self._cost += self._get_cost(pixmap)
+        while self._cost > self._budget and len(self._pixmaps) > 1:
+            _, evicted = self._pixmaps.popitem(last=False)
+            self._cost -= self._get_cost(evicted)
+
+    def remove(self, key):
+        """
+        Removes a pixmap from the cache, if it is cached.
+        """
+        pixmap = self._pixmaps.pop(key, None)
+        if pixmap is not None:
+            self._cost -= self._get_cost(pixmap)
+
+    def remove_project(self, project_id):
+        """
+        Removes all the pixmaps of a project.
+        """
+        for key in [key for key in self._pixmaps if key[0] == project_id]:
+            self.remove(key)
+
+    def clear(self):
+        """
+        Removes all the pixmaps.
+        """
+        self._pixmaps.clear()
+        self._cost = 0
+
+    @staticmethod
+    def _get_cost(pixmap):
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
@@ -0,0 +1,142 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Decodes and scales images in background threads, so only the conversion of the final
+image to a pixmap happens in the main thread.
+"""
+
+from sgtk.platform.qt import QtCore, QtGui
+from sgtk import LogManager
+
+import sgtk
+
+task_manager = sgtk.platform.import_framework(
+    "tk-framework-shotgunutils", "task_manager"
+)
+
+logger = LogManager.get_logger(__name__)
+
+
+def _load_image(source, transform):
+    """
+    Decodes and transforms an image. Runs in a background thread.
+
+    :param source: Path to the image, or ``QImage`` that was already decoded.
+
+    :returns: The transformed ``QImage``, or ``None`` if the image couldn't be
+        decoded.
+    """
+    image = source if isinstance(source, QtGui.QImage) else QtGui.QImage(source)
+    if image.isNull():
+        return None
+    return transform(image)
+
+
+class ThumbnailLoader(QtCore.QObject):
+    """
+    Loads images with a bounded number of background threads.
+
+    Each image is loaded for a key chosen by the caller, which is emitted back with
+    the resulting pixmap. Loads can be cancelled, after which their results are never
+    emitted.
+    """
+
+    # Default number of images loaded at the same time.
+    MAX_THREADS = 2
+    # Group of the tasks in the task manager.
+    _TASK_GROUP = "thumbnail_loader"
+
+    # Emitted with the key and the QPixmap once an image is loaded.
+    thumbnail_loaded = QtCore.Signal(object, object)
+
+    def __init__(self, max_threads=MAX_THREADS, parent=None):
+        """
+        :param int max_threads: Number of images loaded at the same time.
+        :param parent: Parent of this Qt object.
+        """
+        super().__init__(parent)
+        self._task_manager = task_manager.BackgroundTaskManager(
+            self, start_processing=True, max_threads=max_threads
+        )
+        self._task_manager.task_completed.connect(self._on_task_completed)
+        self._task_manager.task_failed.connect(self._on_task_failed)
+        # Keys of the images being loaded, by task id.
+        self._keys_by_task = {}
+        self._pending_keys = set()
+        # Keys of the images that couldn't be loaded, which are not retried.
+        self._failed_keys = set()
+        self._is_shut_down = False
+
+        # The background threads must be stopped before the application quits.
+        QtCore.QCoreApplication.instance().aboutToQuit.connect(self.shut_down)
+
+    def load(self, key, source, transform):
+        """
+        Loads an image, unless one is already being loaded for the key or it
+        couldn't be loaded before.
+
+        :param key: Key to emit the pixmap with.
+        :param source: Path to the image, or ``QImage`` that was already decoded, in
+            which case it is only transformed.
+        :param transform: Callable taking the decoded ``QImage`` and returning the
+            ``QImage`` to convert to a pixmap. It is called in a background thread, so
+            it must not use ``QPixmap`` objects.
+        """
+        if self._is_shut_down or key in self._pending_keys or key in self._failed_keys:
+            return
+        task_id = self._task_manager.add_task(
+            _load_image, group=self._TASK_GROUP, task_args=[source, transform]
+        )
+        self._keys_by_task[task_id] = key
+        self._pending_keys.add(key)
+
+    def cancel_all(self):
+        """
+        Cancels all the loads in progress.
+        """
+        self._task_manager.stop_task_group(self._TASK_GROUP)
+        self._keys_by_task.clear()
+        self._pending_keys.clear()
+
+    def shut_down(self):
+        """
+        Cancels all the loads and stops the background threads.
+        """
+        if self._is_shut_down:
+            return
+        self._is_shut_down = True
+        self.cancel_all()
+        self._task_manager.shut_down()
+
+    def _on_task_completed(self, uid, group, image):
+        """
+        Called in the main thread when an image is loaded.
+        """
+        key = self._keys_by_task.pop(uid, None)
+        if key is None:
+            # The load was cancelled.
+            return
+        self._pending_keys.discard(key)
+        if image is None:
+            self._failed_keys.add(key)
+        else:
+            self.thumbnail_loaded.emit(key, QtGui.QPixmap.fromImage(image))
+
+    def _on_task_failed(self, uid, group, msg, stack_trace):
+        """
+        Called in the main thread when an image couldn't be loaded.
+        """
+        key = self._keys_by_task.pop(uid, None)
+        if key is None:
+            return
+        self._pending_keys.discard(key)
+        self._failed_keys.add(key)
+        logger.debug("Could not load image for %s: %s", key, msg)
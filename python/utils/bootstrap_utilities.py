@@ -18,13 +18,23 @@ As such, the site-level engine has control over how the project-level tk-desktop
 engine is bootstrapped and finalized.
 """
 
+import importlib.machinery
 import importlib.util
 import inspect
+import json
 import logging
 import os
+import re
 import sys
+import threading
+import time
 import traceback
 
+# Set this environment variable to profile the imports done by the background process.
+IMPORT_PROFILER_ENV_VAR = "SGTK_DESKTOP_PROFILE_IMPORTS"
+# Number of modules reported in the console when profiling imports.
+IMPORT_PROFILER_REPORT_SIZE = 20
+
 
 class ProxyLoggingHandler(logging.Handler):
     """
@@ -73,6 +83,227 @@ class ProxyLoggingHandler(logging.Handler):
             pass
 
 
+class ImportProfiler(object):
+    """
+    Measures how long it takes to import each module, similar to ``python -X importtime``
+    but collected in-process so the results can be sent back to the PTR desktop app.
+
+    Modules are timed while their loader executes them, which covers every way of
+    importing them: import statements, submodules pulled in with ``from package import
+    module`` and ``importlib``, as well as the hooks Toolkit loads straight from their
+    files. Hooks and other modules that are not registered in ``sys.modules`` are
+    reported by path.
+
+    For every module executed, both the cumulative time (the module and everything it
+    imported) and the self time (the module alone) are recorded.
+    """
+
+    # Loaders whose modules are timed. Built-in and frozen modules are not, since they
+    # load almost instantly.
+    LOADER_CLASSES = (
+        importlib.machinery.SourceFileLoader,
+        importlib.machinery.SourcelessFileLoader,
+        importlib.machinery.ExtensionFileLoader,
+    )
+
+    def __init__(self):
+        # Dictionary of module name to [cumulative time, self time], in seconds.
+        self._timings = {}
+        # Original exec_module of the loader classes that defined one, by class.
+        self._original_exec_modules = None
+        # Each thread keeps its own stack of imports in progress.
+        self._local = threading.local()
+
+    def start(self):
+        """
+        Starts timing the modules that get loaded.
+        """
+        if self._original_exec_modules is not None:
+            return
+        self._original_exec_modules = {}
+        for loader_class in self.LOADER_CLASSES:
+            # Inherited implementations are restored by removing the override.
+            if "exec_module" in loader_class.__dict__:
+                self._original_exec_modules[loader_class] = loader_class.__dict__[
+                    "exec_module"
+                ]
+            loader_class.exec_module = self._wrap_exec_module(loader_class.exec_module)
+
+    def stop(self):
+        """
+        Stops timing the modules that get loaded.
+        """
+        if self._original_exec_modules is None:
+            return
+        for loader_class in self.LOADER_CLASSES:
+            if loader_class in self._original_exec_modules:
+                loader_class.exec_module = self._original_exec_modules[loader_class]
+            else:
+                del loader_class.exec_module
+        self._original_exec_modules = None
+
+    def add_timing(self, module_name, duration):
+        """
+        Records an import that was timed outside of the profiler.
+
+        :param str module_name: Name of the module.
+        :param float duration: Number of seconds it took to import it.
+        """
+        timing = self._timings.setdefault(module_name, [0.0, 0.0])
+        timing[0] += duration
+        timing[1] += duration
+
+    def _wrap_exec_module(self, exec_module):
+        """
+        :returns: A replacement for a loader's ``exec_module`` that times it.
+        """
+        profiler = self
+
+        def timed_exec_module(loader, module):
+            stack = profiler._local.__dict__.setdefault("stack", [])
+            # Accumulates the time spent importing children of this module.
+            stack.append(0.0)
+            start = time.perf_counter()
+            try:
+                return exec_module(loader, module)
+            finally:
+                cumulative = time.perf_counter() - start
+                children = stack.pop()
+                if stack:
+                    stack[-1] += cumulative
+                timing = profiler._timings.setdefault(
+                    profiler._get_module_name(module), [0.0, 0.0]
+                )
+                timing[0] += cumulative
+                timing[1] += cumulative - children
+
+        return timed_exec_module
+
+    @staticmethod
+    def _get_module_name(module):
+        """
+        :returns: The name of an imported module, or the path of a module loaded
+            straight from its file, like hooks.
+        """
+        if sys.modules.get(module.__name__) is module:
+            return module.__name__
+        return getattr(module, "__file__", None) or module.__name__
+
+    def get_top_modules(self, count=IMPORT_PROFILER_REPORT_SIZE):
+        """
+        :returns: List of (module name, cumulative time, self time) tuples for the
+            modules that took the most time to import on their own.
+        """
+        timings = sorted(
+            self._timings.items(), key=lambda item: item[1][1], reverse=True
+        )
+        return [(name, timing[0], timing[1]) for name, timing in timings[:count]]
+
+    def format_report(self, count=IMPORT_PROFILER_REPORT_SIZE):
+        """
+        :returns: A human readable table of the slowest imports.
+        """
+        lines = [
+            "Slowest imports out of {} modules:".format(len(self._timings)),
+            "{:>12} | {:>12} | {}".format("self [ms]", "cumul. [ms]", "module"),
+        ]
+        for name, cumulative, self_time in self.get_top_modules(count):
+            lines.append(
+                "{:12.1f} | {:12.1f} | {}".format(
+                    self_time * 1000, cumulative * 1000, name
+                )
+            )
+        return "\n".join(lines)
+
+    def save(self, path, metadata=None):
+        """
+        Saves every timing as a JSON file so runs can be compared.
+
+        :param str path: Path to the file to write.
+        :param dict metadata: Additional information to store alongside the timings.
+        """
+        with open(path, "w") as fh:
+            json.dump(
+                {
+                    "metadata": metadata or {},
+                    "modules": {
+                        name: {"cumulative": timing[0], "self": timing[1]}
+                        for name, timing in self._timings.items()
+                    },
+                },
+                fh,
+                indent=2,
+                sort_keys=True,
+            )
+
+
+# Profiler started by start_import_profiler, if profiling was requested.
+_import_profiler = None
+
+
+def start_import_profiler(utilities_import_time=None):
+    """
+    Starts profiling imports if the SGTK_DESKTOP_PROFILE_IMPORTS environment
+    variable is set.
+
+    :param float utilities_import_time: Number of seconds it took to import this
+        module, since it can't profile itself.
+
+    :returns: The :class:`ImportProfiler` instance or None if profiling is disabled.
+    """
+    global _import_profiler
+
+    if IMPORT_PROFILER_ENV_VAR not in os.environ:
+        return None
+
+    if _import_profiler is None:
+        _import_profiler = ImportProfiler()
+        if utilities_import_time is not None:
+            _import_profiler.add_timing(__name__, utilities_import_time)
+        _import_profiler.start()
+    return _import_profiler
+
+
+def _save_import_profile(sgtk, project, config_descriptor, stage):
+    """
+    Saves the import timings next to the log files.
+
+    :param sgtk: The sgtk module.
+    :param dict project: Project being bootstrapped.
+    :param config_descriptor: Descriptor of the configuration being bootstrapped.
+    :param str stage: Name of the bootstrap stage the profile is saved at.
+
+    :returns: Path to the file that was written.
+    """
+    config_version = "unknown"
+    if config_descriptor is not None:
+        try:
+            config_version = config_descriptor.version
+        except Exception:
+            pass
+
+    # Keep the file name safe whatever the version looks like.
+    file_name = re.sub(
+        r"[^\w.-]",
+        "_",
+        "tk-desktop.imports.{}.{}.{}.json".format(
+            project["id"] if project else "site", config_version, stage
+        ),
+    )
+    path = os.path.join(sgtk.LogManager().log_folder, file_name)
+    _import_profiler.save(
+        path,
+        {
+            "project_id": project["id"] if project else None,
+            "config_version": config_version,
+            "stage": stage,
+            "python": sys.version,
+            "timestamp": time.time(),
+        },
+    )
+    return path
+
+
 def _create_proxy(data):
     """
     Create a proxy based on the data received from the PTR desktop app.
@@ -242,6 +473,22 @@ class Bootstrap(object):
         """
         import sgtk
 
+        # Send the slowest imports back to the console while we still can.
+        if _import_profiler is not None:
+            logger = sgtk.LogManager.get_logger(__file__)
+            logger.info(_import_profiler.format_report())
+            try:
+                path = _save_import_profile(
+                    sgtk,
+                    self._project,
+                    getattr(ctx.sgtk, "configuration_descriptor", None),
+                    "pre_engine_start",
+                )
+            except Exception:
+                logger.exception("Could not save the import profile:")
+            else:
+                logger.info("Import profile saved to %s", path)
+
         # At this point we need to close the proxy because we can't have two proxies connected
         # at the same sime, especially for logging, to the server.
         # When the engine starts it will set up its own logging.
@@ -296,6 +543,21 @@ def start_engine(data):
 
     sgtk.util.prepend_path_to_env_var("PYTHONPATH", python_folder)
 
+    # The engine is now up, including Qt, so save the complete import profile.
+    if _import_profiler is not None:
+        _import_profiler.stop()
+        try:
+            path = _save_import_profile(
+                sgtk,
+                data["project"],
+                getattr(engine.sgtk, "configuration_descriptor", None),
+                "engine_started",
+            )
+        except Exception:
+            engine.logger.exception("Could not save the import profile:")
+        else:
+            engine.logger.info("Complete import profile saved to %s", path)
+
     return engine
 
 
@@ -0,0 +1,549 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Fork server for the project background processes on Linux.
+
+Instead of spawning a new interpreter every time a project is opened, the desktop app
+can start a long lived server per interpreter that has already imported ``sgtk`` and
+the bootstrap utilities. Each project is then started by forking that server, which
+skips the interpreter startup and the most expensive imports.
+
+Qt is never imported by the server, since it can't be used safely across a fork. The
+child process imports it when the engine starts, exactly like a regular bootstrap.
+
+This module only uses the standard library since it runs inside the project's
+interpreter, before Toolkit is available.
+
+Protocol: a client connects to the server's Unix socket and sends a single JSON line
+with keys ``data_path``, ``env`` and ``cwd``. The server replies with ``{"pid": ...}``
+once the child is forked, or ``{"error": ...}``, and later with ``{"returncode": ...}``
+when the child exits.
+"""
+
+import json
+import optparse
+import os
+import pickle
+import select
+import shutil
+import signal
+import socket
+import subprocess  # nosec B404
+import sys
+import tempfile
+import threading
+import time
+import traceback
+
+# Interval at which the server checks if the desktop app is still running. Children are
+# reaped as soon as they exit.
+POLL_INTERVAL = 0.5
+# Number of seconds to wait for the server to reply to a launch request. Forking is
+# quick, so a server that takes longer is busy and the process is launched normally.
+REPLY_TIMEOUT = 1
+# Qt bindings that must not be loaded before forking.
+QT_MODULES = ("PySide6", "PySide2", "PySide", "PyQt5", "PyQt4")
+
+
+def is_supported():
+    """
+    :returns: ``True`` if the fork server can be used on this platform.
+    """
+    return sys.platform.startswith("linux") and hasattr(os, "fork")
+
+
+class ForkServerError(Exception):
+    """
+    Raised when a process can't be launched through the fork server.
+    """
+
+
+class ForkedProcess(object):
+    """
+    Handle to a process forked by the server.
+
+    It mimics the part of :class:`subprocess.Popen` used to track the
+    bootstrap process, so it can be terminated the same way. It can be polled and
+    waited on from different threads.
+    """
+
+    def __init__(self, pid, connection):
+        """
+        :param int pid: Id of the forked process.
+        :param connection: Socket on which the server will send the return code.
+        """
+        self.pid = pid
+        self.returncode = None
+        self._connection = connection
+        self._buffer = b""
+        # Held while reading from the connection.
+        self._lock = threading.Lock()
+
+    def poll(self):
+        """
+        :returns: The return code of the process or None if it is still running.
+        """
+        # If another thread is waiting on the process, it reads the return code.
+        if self.returncode is None and self._lock.acquire(blocking=False):
+            try:
+                if self.returncode is None:
+                    self._read_returncode(0)
+            finally:
+                self._lock.release()
+        return self.returncode
+
+    def wait(self, timeout=None):
+        """
+        Waits for the process to exit.
+
+        :param float timeout: Number of seconds to wait, or None to wait forever.
+
+        :raises subprocess.TimeoutExpired: If the process is still running after ``timeout``.
+        :returns: The return code of the process.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.returncode is None:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise subprocess.TimeoutExpired(str(self.pid), timeout)
+            step = POLL_INTERVAL if remaining is None else min(remaining, POLL_INTERVAL)
+            with self._lock:
+                if self.returncode is None:
+                    self._read_returncode(step)
+        return self.returncode
+
+    def terminate(self):
+        """
+        Sends SIGTERM to the process.
+        """
+        self._send_signal(signal.SIGTERM)
+
+    def kill(self):
+        """
+        Sends SIGKILL to the process.
+        """
+        self._send_signal(signal.SIGKILL)
+
+    def _send_signal(self, signum):
+        """
+        Sends a signal to the process if it is still running.
+        """
+        if self.poll() is not None:
+            return
+        try:
+            os.kill(self.pid, signum)
+        except ProcessLookupError:
+            pass
+
+    def _read_returncode(self, timeout):
+        """
+        Reads the return code sent by the server, if any. Must be called with the
+        lock.
+
+        :param float timeout: Number of seconds to wait for it.
+        """
+        if self._connection is None:
+            # The server is gone, so the process was reparented and we can only
+            # tell whether it is still alive.
+            try:
+                os.kill(self.pid, 0)
+            except ProcessLookupError:
+                self.returncode = -1
+            else:
+                time.sleep(timeout)
+            return
+
+        readable, _, _ = select.select([self._connection], [], [], timeout)
+        if not readable:
+            return
+
+        chunk = self._connection.recv(4096)
+        if not chunk:
+            self._connection.close()
+            self._connection = None
+            return
+
+        self._buffer += chunk
+        while b"\n" in self._buffer:
+            line, self._buffer = self._buffer.split(b"\n", 1)
+            message = json.loads(line.decode("utf-8"))
+            if "returncode" in message:
+                self.returncode = message["returncode"]
+                self._connection.close()
+                self._connection = None
+                return
+
+
+class ForkServer(object):
+    """
+    Starts and talks to a fork server running in a given interpreter.
+    """
+
+    def __init__(self, python, core_python_path, utilities_module_path):
+        """
+        :param str python: Path to the interpreter to run the server with.
+        :param str core_python_path: Path to the ``python`` folder of the core to preload.
+        :param str utilities_module_path: Path to the bootstrap utilities to preload.
+        """
+        self._python = python
+        self._core_python_path = core_python_path
+        self._utilities_module_path = utilities_module_path
+        self._folder = None
+        self._process = None
+
+    @property
+    def address(self):
+        """
+        Path to the server's Unix socket.
+        """
+        return os.path.join(self._folder, "server.sock") if self._folder else None
+
+    @property
+    def is_running(self):
+        """
+        ``True`` if the server process is running.
+        """
+        return self._process is not None and self._process.poll() is None
+
+    @property
+    def is_ready(self):
+        """
+        ``True`` if the server has preloaded its modules and accepts connections.
+        """
+        return self.is_running and os.path.exists(self.address)
+
+    def start(self):
+        """
+        Starts the server process without waiting for it. It will preload its modules
+        in the background.
+        """
+        if self.is_running:
+            return
+
+        self.shut_down()
+        # Only the current user can connect to the server.
+        self._folder = tempfile.mkdtemp(prefix="tk-desktop-fork-server.")
+
+        # The credentials are sent with each launch request, they don't need to linger
+        # in the server's environment.
+        env = dict(os.environ)
+        env.pop("SHOTGUN_DESKTOP_CURRENT_USER", None)
+
+        self._process = subprocess.Popen(
+            [
+                self._python,
+                os.path.abspath(__file__),
+                "--address",
+                self.address,
+                "--core",
+                self._core_python_path,
+                "--utilities",
+                self._utilities_module_path,
+            ],
+            close_fds=True,
+            env=env,
+        )  # nosec B603 - args are built from trusted toolkit internals, not user input
+
+    def wait_until_ready(self, timeout):
+        """
+        Waits for the server to accept connections.
+
+        :param float timeout: Number of seconds to wait.
+
+        :raises ForkServerError: If the server stopped or isn't ready in time.
+        """
+        deadline = time.monotonic() + timeout
+        while not self.is_ready:
+            if not self.is_running:
+                raise ForkServerError("The fork server is not running.")
+            if time.monotonic() > deadline:
+                raise ForkServerError("Timed out waiting for the fork server.")
+            time.sleep(0.05)
+
+    def launch(self, data_path, env=None, cwd=None):
+        """
+        Forks a new bootstrap process.
+
+        This never waits for the server to start. The first call starts it in the
+        background, and the process has to be launched some other way until the
+        server is ready.
+
+        :param str data_path: Path to the pickle file with the startup data.
+        :param dict env: Environment of the new process. Defaults to the current one.
+        :param str cwd: Working directory of the new process. Defaults to the current one.
+
+        :raises ForkServerError: If the process could not be forked or the server
+            stopped.
+        :returns: A :class:`ForkedProcess`, or None if the server isn't ready yet or
+            didn't reply in time.
+        """
+        if self._process is None:
+            self.start()
+            return None
+        if not self.is_running:
+            raise ForkServerError("The fork server is not running.")
+
+        connection = self._connect()
+        if connection is None:
+            return None
+        try:
+            request = {
+                "data_path": data_path,
+                "env": dict(os.environ if env is None else env),
+                "cwd": cwd or os.getcwd(),
+            }
+            connection.sendall(json.dumps(request).encode("utf-8") + b"\n")
+
+            reply = b""
+            while not reply.endswith(b"\n"):
+                chunk = connection.recv(4096)
+                if not chunk:
+                    raise ForkServerError("The fork server closed the connection.")
+                reply += chunk
+            connection.settimeout(None)
+        except socket.timeout:
+            # The server kills the child when it can't send its pid to a client that
+            # gave up, so it isn't launched twice.
+            connection.close()
+            return None
+        except (OSError, ForkServerError):
+            connection.close()
+            raise
+
+        message = json.loads(reply.decode("utf-8"))
+        if "error" in message:
+            connection.close()
+            raise ForkServerError(message["error"])
+        return ForkedProcess(message["pid"], connection)
+
+    def _connect(self):
+        """
+        Connects to the server if it accepts connections.
+
+        :returns: The connected socket, or None if the server isn't ready yet.
+        """
+        # The socket is only created once the modules are preloaded.
+        if not os.path.exists(self.address):
+            return None
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.settimeout(REPLY_TIMEOUT)
+        try:
+            connection.connect(self.address)
+        except OSError:
+            # Bound, but not listening yet.
+            connection.close()
+            return None
+        return connection
+
+    def shut_down(self):
+        """
+        Stops the server. Processes already forked keep running.
+        """
+        if self._process is not None:
+            if self._process.poll() is None:
+                self._process.terminate()
+                try:
+                    self._process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    self._process.kill()
+            self._process = None
+        if self._folder is not None:
+            shutil.rmtree(self._folder, ignore_errors=True)
+            self._folder = None
+
+
+def _run_bootstrap(utilities, data_path):
+    """
+    Bootstraps the engine in the forked process, like ``bootstrap.py`` does.
+
+    :param utilities: The bootstrap utilities module.
+    :param str data_path: Path to the pickle file with the startup data.
+    """
+    data = None
+    try:
+        with open(data_path, "rb") as fh:
+            data = pickle.load(fh)
+        utilities.execute_pre_initialization_hook(data)
+        engine = utilities.start_engine(data)
+        os._exit(utilities.start_app(engine))
+    except Exception:
+        traceback.print_exc()
+        if data is not None:
+            try:
+                utilities.handle_error(data)
+            except Exception:
+                traceback.print_exc()
+    finally:
+        os._exit(1)
+
+
+def _send(connection, message):
+    """
+    Sends a message to a client, ignoring clients that went away.
+
+    :returns: ``True`` if the message was sent.
+    """
+    try:
+        connection.sendall(json.dumps(message).encode("utf-8") + b"\n")
+    except OSError:
+        return False
+    return True
+
+
+def _fork(listener, wakeup, connection, children, utilities):
+    """
+    Reads a launch request from a client and forks the process.
+
+    :returns: The pid of the forked process, or None if it failed.
+    """
+    try:
+        connection.settimeout(5)
+        request = connection.makefile("rb").readline()
+        request = json.loads(request.decode("utf-8"))
+    except (OSError, ValueError) as exc:
+        _send(connection, {"error": "Invalid request: %s" % exc})
+        return None
+
+    loaded_qt = [name for name in QT_MODULES if name in sys.modules]
+    if loaded_qt:
+        _send(connection, {"error": "Qt was loaded before forking: %s" % loaded_qt})
+        return None
+
+    # The child inherits the server's SIGTERM handler until it restores the default
+    # one, so SIGTERM is blocked until then instead of unwinding the server's loop.
+    old_mask = signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGTERM})
+    try:
+        pid = os.fork()
+    except OSError as exc:
+        signal.pthread_sigmask(signal.SIG_SETMASK, old_mask)
+        _send(connection, {"error": "Could not fork: %s" % exc})
+        return None
+    if pid == 0:
+        _run_child(listener, wakeup, connection, children, utilities, request, old_mask)
+    signal.pthread_sigmask(signal.SIG_SETMASK, old_mask)
+
+    if not _send(connection, {"pid": pid}):
+        # The client gave up on the request and launches the process itself.
+        os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
+        return None
+    return pid
+
+
+def _run_child(listener, wakeup, connection, children, utilities, request, old_mask):
+    """
+    Runs the forked process. It only ever exits through ``os._exit``, so nothing
+    that belongs to the server runs in it.
+    """
+    try:
+        # Let go of everything that belongs to the server.
+        listener.close()
+        connection.close()
+        for other in children.values():
+            other.close()
+        signal.set_wakeup_fd(-1)
+        for fd in wakeup:
+            os.close(fd)
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.pthread_sigmask(signal.SIG_SETMASK, old_mask)
+        os.environ.clear()
+        os.environ.update(request["env"])
+        os.chdir(request["cwd"])
+        _run_bootstrap(utilities, request["data_path"])
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        os._exit(1)
+
+
+def _reap(children):
+    """
+    Sends the return code of the children that exited to their clients.
+    """
+    while children:
+        try:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if pid == 0:
+            return
+        connection = children.pop(pid, None)
+        if connection is not None:
+            _send(connection, {"returncode": os.waitstatus_to_exitcode(status)})
+            connection.close()
+
+
+def serve(address, core_python_path, utilities_module_path):
+    """
+    Preloads Toolkit and serves launch requests until the desktop app exits.
+
+    :param str address: Path of the Unix socket to listen on.
+    :param str core_python_path: Path to the ``python`` folder of the core to preload.
+    :param str utilities_module_path: Path to the bootstrap utilities to preload.
+    """
+    sys.path.insert(0, core_python_path)
+    import sgtk  # noqa
+
+    sys.path.append(os.path.dirname(utilities_module_path))
+    module_name, _ = os.path.splitext(os.path.basename(utilities_module_path))
+    utilities = __import__(module_name)
+
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(address)
+    listener.listen(8)
+
+    # Wake up the loop as soon as a child exits.
+    wakeup = os.pipe()
+    os.set_blocking(wakeup[0], False)
+    os.set_blocking(wakeup[1], False)
+    signal.set_wakeup_fd(wakeup[1])
+    signal.signal(signal.SIGCHLD, lambda *args: None)
+
+    # Connections of the running children, by pid.
+    children = {}
+    parent_pid = os.getppid()
+    try:
+        # Stop as soon as the desktop app goes away.
+        while os.getppid() == parent_pid:
+            readable, _, _ = select.select([listener, wakeup[0]], [], [], POLL_INTERVAL)
+            if wakeup[0] in readable:
+                try:
+                    os.read(wakeup[0], 4096)
+                except BlockingIOError:
+                    pass
+            if listener in readable:
+                connection, _ = listener.accept()
+                pid = _fork(listener, wakeup, connection, children, utilities)
+                if pid is None:
+                    connection.close()
+                else:
+                    connection.settimeout(None)
+                    children[pid] = connection
+            _reap(children)
+    finally:
+        listener.close()
+
+
+def main():
+    parser = optparse.OptionParser()
+    parser.add_option("--address", help="path of the unix socket to listen on")
+    parser.add_option("--core", help="path to the core's python folder")
+    parser.add_option("--utilities", help="path to the bootstrap utilities module")
+    opts, _ = parser.parse_args()
+
+    # Exit quietly when the desktop app shuts us down.
+    signal.signal(signal.SIGTERM, lambda *args: sys.exit(0))
+    serve(opts.address, opts.core, opts.utilities)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Measures how long it takes for the command panel to be painted while a project
+registers its commands.
+
+Commands are added one at a time with events processed in between, the way they are
+received from the background process. Each run is timed from the first command to
+the first paint of the panel, and to the first paint showing every command, with the
+panel either painting as commands arrive or suspended until registration is over.
+
+By default, the core is expected to be cloned next to tk-desktop.
+
+    python tests/benchmark_command_panel.py --commands 200 --groups 5
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Reuse the Qt setup and helpers of the tests.
+from test_command_panel import (  # noqa
+    PROJECT,
+    CommandPanel,
+    Settings,
+    sgtk,
+)
+
+QtCore = sgtk.platform.qt.QtCore
+QtGui = sgtk.platform.qt.QtGui
+
+# Number of seconds to wait for the panel to be painted.
+PAINT_TIMEOUT = 10
+
+
+class PaintRecorder(QtCore.QObject):
+    """
+    Records when the watched widget is painted.
+    """
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.timestamps = []
+
+    def eventFilter(self, obj, event):
+        if event.type() == QtCore.QEvent.Paint:
+            self.timestamps.append(time.perf_counter())
+        return False
+
+
+def _register(commands, groups, is_suspended):
+    """
+    Registers commands on a new panel.
+
+    :returns: Tuple of the number of seconds from the first command to the first
+        paint, to the first paint after the last command, and the number of paints.
+    """
+    scroll_area = QtGui.QScrollArea()
+    scroll_area.resize(420, 600)
+    panel = CommandPanel(scroll_area, Settings())
+    scroll_area.setWidget(panel)
+    scroll_area.setWidgetResizable(True)
+    panel.configure(PROJECT, groups, show_recents=False)
+    scroll_area.show()
+    QtGui.QApplication.processEvents()
+
+    recorder = PaintRecorder(panel)
+    panel.installEventFilter(recorder)
+
+    start = time.perf_counter()
+    if is_suspended:
+        panel.begin_registration()
+    for command in commands:
+        panel.add_command(*command)
+        QtGui.QApplication.processEvents()
+    finished = time.perf_counter()
+    if is_suspended:
+        panel.end_registration()
+
+    deadline = time.perf_counter() + PAINT_TIMEOUT
+    while not recorder.timestamps or recorder.timestamps[-1] < finished:
+        if time.perf_counter() > deadline:
+            raise RuntimeError("The panel was not painted.")
+        QtGui.QApplication.processEvents()
+
+    scroll_area.close()
+    scroll_area.deleteLater()
+    return (
+        recorder.timestamps[0] - start,
+        next(ts for ts in recorder.timestamps if ts >= finished) - start,
+        len(recorder.timestamps),
+    )
+
+
+def _report(name, results):
+    first_paint, full_paint, paint_count = zip(*results)
+    print(
+        "{:<10} first paint {:8.1f} ms | all commands painted {:8.1f} ms | "
+        "{:6.1f} paints".format(
+            name,
+            statistics.median(first_paint) * 1000,
+            statistics.median(full_paint) * 1000,
+            statistics.median(paint_count),
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--commands", type=int, default=200, help="command count")
+    parser.add_argument("--groups", type=int, default=5, help="group count")
+    parser.add_argument("--runs", type=int, default=5, help="number of runs")
+    args = parser.parse_args()
+
+    app = QtGui.QApplication.instance() or QtGui.QApplication([])  # noqa
+
+    groups = ["Group %d" % index for index in range(args.groups)]
+    commands = [
+        (
+            "command_%d" % index,
+            "App %d" % (index // 4),
+            "App %d v%d" % (index // 4, index % 4),
+            None,
+            "",
+            [groups[index % args.groups]],
+        )
+        for index in range(args.commands)
+    ]
+
+    print("{} commands in {} groups".format(args.commands, args.groups))
+    for name, is_suspended in [("streamed", False), ("suspended", True)]:
+        _report(
+            name, [_register(commands, groups, is_suspended) for _ in range(args.runs)]
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
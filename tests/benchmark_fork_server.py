@@ -0,0 +1,145 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Compares how long it takes for a background process to have Toolkit imported when
+it is spawned through bootstrap.py and when it is forked from the fork server.
+
+The engine isn't started, the processes exit as soon as sgtk is imported. By default,
+the core is expected to be cloned next to tk-desktop.
+
+    python tests/benchmark_fork_server.py --core ../tk-core/python --runs 20
+"""
+
+import argparse
+import os
+import pickle
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+sys.path.insert(0, os.path.join(ROOT, "python", "utils"))
+
+import fork_server  # noqa
+
+# Utilities module used in place of bootstrap_utilities, which only imports Toolkit.
+UTILITIES = """
+import sys
+
+
+def start_import_profiler(utilities_import_time=None):
+    pass
+
+
+def execute_pre_initialization_hook(data):
+    pass
+
+
+def start_engine(data):
+    sys.path.insert(0, data["core_python_path"])
+    import sgtk
+
+
+def start_app(engine):
+    return 0
+
+
+def handle_error(data):
+    pass
+"""
+
+
+def _time(launch, runs):
+    """
+    :returns: The duration of each run, in seconds.
+    """
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        process = launch()
+        if process.wait() != 0:
+            raise RuntimeError("The background process failed.")
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def _report(name, durations):
+    print(
+        "{:<12} median {:8.1f} ms | mean {:8.1f} ms | min {:8.1f} ms".format(
+            name,
+            statistics.median(durations) * 1000,
+            statistics.mean(durations) * 1000,
+            min(durations) * 1000,
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--core",
+        default=os.path.join(ROOT, os.pardir, "tk-core", "python"),
+        help="path to the core's python folder",
+    )
+    parser.add_argument("--python", default=sys.executable, help="interpreter to use")
+    parser.add_argument("--runs", type=int, default=10, help="number of launches")
+    args = parser.parse_args()
+
+    if not fork_server.is_supported():
+        print("The fork server is only supported on Linux.")
+        return 1
+
+    folder = tempfile.mkdtemp()
+    utilities_path = os.path.join(folder, "benchmark_utilities.py")
+    with open(utilities_path, "w") as fh:
+        fh.write(UTILITIES)
+    data_path = os.path.join(folder, "data.pkl")
+    with open(data_path, "wb") as fh:
+        pickle.dump({"core_python_path": os.path.abspath(args.core)}, fh)
+
+    cold = _time(
+        lambda: subprocess.Popen(
+            [
+                args.python,
+                os.path.join(ROOT, "bootstrap.py"),
+                "-d",
+                data_path,
+                "-u",
+                utilities_path,
+            ],
+            close_fds=True,
+        ),
+        args.runs,
+    )
+
+    server = fork_server.ForkServer(
+        args.python, os.path.abspath(args.core), utilities_path
+    )
+    try:
+        # Launches don't wait for the server to preload Toolkit.
+        start = time.perf_counter()
+        server.start()
+        server.wait_until_ready(60)
+        warm_up = [time.perf_counter() - start]
+        forked = _time(lambda: server.launch(data_path), args.runs)
+    finally:
+        server.shut_down()
+
+    _report("cold spawn", cold)
+    _report("server start", warm_up)
+    _report("fork", forked)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,241 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Headless benchmark of a project background process, without the desktop app's GUI.
+
+The site side of SiteCommunication runs against a fake engine, like tests/test_rpc.py
+does, and bootstrap.py is launched with a generated payload. The project side uses
+benchmark_project_utilities.py, which registers fake commands instead of bootstrapping
+a pipeline configuration.
+
+The following stages are timed:
+
+- spawn: from launching bootstrap.py to the process having imported Toolkit.
+- bootstrap: from there to the project side RPC server being connected and
+  registration starting.
+- registration: from there to project_commands_finished being received.
+- teardown: shutting down the communication until the process has exited.
+
+By default, the core is expected to be cloned next to tk-desktop.
+
+    python tests/benchmark_project_engine.py --commands 200 --groups 5 --runs 10
+"""
+
+import argparse
+import inspect
+import os
+import pickle
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+UTILITIES = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "benchmark_project_utilities.py"
+)
+STAGES = ["spawn", "bootstrap", "registration", "teardown"]
+# Number of seconds to wait for the background process to get to each stage.
+STAGE_TIMEOUT = 60
+
+
+class FakeEngine(object):
+    """
+    Fake site engine. Implements what the RPC classes expect from the engine and
+    records when the background process gets to each stage.
+    """
+
+    def __init__(self):
+        self.timestamps = {}
+        self.command_count = 0
+        self.error = None
+        self._events = {
+            name: threading.Event() for name in ["imported", "connected", "finished"]
+        }
+
+    def execute_in_main_thread(self, func, *args, **kwargs):
+        """
+        Just call the function directly, there is no event loop to run it in.
+        """
+        return func(*args, **kwargs)
+
+    async_execute_in_main_thread = execute_in_main_thread
+
+    def _reached(self, name):
+        self.timestamps.setdefault(name, time.perf_counter())
+        self._events[name].set()
+
+    def wait_for(self, name):
+        if not self._events[name].wait(STAGE_TIMEOUT):
+            raise RuntimeError(
+                "Timed out waiting for the background process: %s" % self.error
+            )
+        return self.timestamps[name]
+
+    def bootstrap_progress(self, value, msg):
+        self._reached("imported")
+
+    def engine_startup_error(self, exception_type, exception_str, tb=None):
+        self.error = exception_str
+
+    def set_groups(self, groups, show_recents=True):
+        # This is the first call made once the proxy has been created.
+        self._reached("connected")
+
+    def set_collapse_rules(self, collapse_rules):
+        pass
+
+    def trigger_register_command(self, name, properties, groups):
+        self.command_count += 1
+
+    def project_commands_finished(self):
+        self._reached("finished")
+
+
+def _run_once(site_communication, rpc, args, folder):
+    """
+    Launches a background process and times each stage.
+
+    :returns: Dictionary of stage name to duration in seconds.
+    """
+    engine = FakeEngine()
+    site_comm = site_communication.SiteCommunication()
+    site_comm.set_engine(engine)
+
+    # Same as DesktopEngineSiteImplementation.startup_rpc
+    site_comm.start_server()
+    site_comm.register_function(engine.bootstrap_progress, "bootstrap_progress")
+    site_comm.register_function(engine.engine_startup_error, "engine_startup_error")
+    site_comm.register_function(engine.set_groups, "set_groups")
+    site_comm.register_function(engine.set_collapse_rules, "set_collapse_rules")
+    site_comm.register_function(
+        engine.trigger_register_command, "trigger_register_command"
+    )
+    site_comm.register_function(
+        engine.project_commands_finished, "project_commands_finished"
+    )
+
+    data_path = os.path.join(folder, "data.pkl")
+    with open(data_path, "wb") as fh:
+        pickle.dump(
+            {
+                "core_python_path": os.path.abspath(args.core),
+                "rpc_lib_path": inspect.getsourcefile(rpc),
+                "proxy_data": {
+                    "proxy_pipe": site_comm.server_pipe,
+                    "proxy_auth": site_comm.server_authkey,
+                },
+                "command_count": args.commands,
+                "group_count": args.groups,
+            },
+            fh,
+        )
+
+    start = time.perf_counter()
+    # Same as the launch_python hook.
+    process = subprocess.Popen(
+        [
+            args.python,
+            os.path.join(ROOT, "bootstrap.py"),
+            "-d",
+            data_path,
+            "-u",
+            UTILITIES,
+        ],
+        close_fds=True,
+    )
+    site_comm.set_bootstrap_process(process)
+
+    try:
+        imported = engine.wait_for("imported")
+        connected = engine.wait_for("connected")
+        finished = engine.wait_for("finished")
+    except Exception:
+        process.kill()
+        raise
+
+    if engine.command_count != args.commands:
+        raise RuntimeError(
+            "Only %d commands out of %d were registered."
+            % (engine.command_count, args.commands)
+        )
+
+    teardown_start = time.perf_counter()
+    site_comm.shut_down()
+    site_comm.wait_for_retired_processes()
+    site_comm.resource_monitor.stop()
+    teardown_end = time.perf_counter()
+
+    return {
+        "spawn": imported - start,
+        "bootstrap": connected - imported,
+        "registration": finished - connected,
+        "teardown": teardown_end - teardown_start,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--core",
+        default=os.path.join(ROOT, os.pardir, "tk-core", "python"),
+        help="path to the core's python folder",
+    )
+    parser.add_argument("--python", default=sys.executable, help="interpreter to use")
+    parser.add_argument("--commands", type=int, default=100, help="fake commands")
+    parser.add_argument("--groups", type=int, default=3, help="fake groups")
+    parser.add_argument("--runs", type=int, default=5, help="number of launches")
+    args = parser.parse_args()
+
+    sys.path.insert(0, os.path.abspath(args.core))
+    sys.path.insert(0, os.path.join(ROOT, "python"))
+
+    # Patch sgtk so SiteCommunication can use Qt. No QApplication is needed,
+    # the signals are delivered directly.
+    import sgtk
+
+    importer = sgtk.util.qt_importer.QtImporter()
+    sgtk.platform.qt.QtGui = importer.QtGui
+    sgtk.platform.qt.QtCore = importer.QtCore
+
+    from tk_desktop import rpc, site_communication
+
+    folder = tempfile.mkdtemp()
+    # The first run warms up the file system caches and is not reported.
+    _run_once(site_communication, rpc, args, folder)
+    results = [
+        _run_once(site_communication, rpc, args, folder) for _ in range(args.runs)
+    ]
+
+    print(
+        "{} runs, {} commands in {} groups".format(
+            args.runs, args.commands, args.groups
+        )
+    )
+    for stage in STAGES:
+        durations = [result[stage] for result in results]
+        print(
+            "{:<14} median {:8.1f} ms | mean {:8.1f} ms | stdev {:6.1f} ms".format(
+                stage,
+                statistics.median(durations) * 1000,
+                statistics.mean(durations) * 1000,
+                statistics.stdev(durations) * 1000 if len(durations) > 1 else 0,
+            )
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
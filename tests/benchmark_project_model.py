@@ -0,0 +1,112 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Measures how long it takes for the project browser's proxy model to sort and filter
+large numbers of projects.
+
+By default, the core is expected to be cloned next to tk-desktop.
+
+    python tests/benchmark_project_model.py --projects 20000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Reuse the Qt setup and model helpers of the tests.
+from test_project_model import (  # noqa
+    QtGui,
+    SgProjectModelProxy,
+    create_model,
+    project,
+)
+
+
+def _time(func, runs):
+    """
+    :returns: The duration of each run, in seconds.
+    """
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def _report(name, durations):
+    print(
+        "{:<24} median {:8.1f} ms | mean {:8.1f} ms | min {:8.1f} ms".format(
+            name,
+            statistics.median(durations) * 1000,
+            statistics.mean(durations) * 1000,
+            min(durations) * 1000,
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--projects", type=int, default=20000, help="project count")
+    parser.add_argument("--runs", type=int, default=5, help="number of runs")
+    args = parser.parse_args()
+
+    app = QtGui.QApplication.instance() or QtGui.QApplication([])  # noqa
+
+    # Always generate the same projects so runs can be compared.
+    rng = random.Random(0)
+    projects = [
+        project(
+            index,
+            "Project %s %d" % (rng.choice(["Alpha", "Bravo", "Charlie"]), index),
+            rng.choice([None, rng.randint(0, 10**9)]),
+        )
+        for index in range(args.projects)
+    ]
+    model = create_model(projects)
+    proxy = SgProjectModelProxy()
+    proxy.setSourceModel(model)
+
+    print("{} projects".format(args.projects))
+    _report("sort", _time(lambda: proxy.sort(0), args.runs))
+    _report(
+        "invalidate and sort",
+        _time(lambda: (proxy.invalidate(), proxy.sort(0)), args.runs),
+    )
+
+    def search():
+        proxy.search_text = "bravo 1"
+        proxy.search_text = ""
+
+    _report("search and clear", _time(search, args.runs))
+
+    # Typing one character at a time, the way the desktop app receives the
+    # search text, and then erasing it.
+    query = "bravo 1"
+    keystrokes = [query[:length] for length in range(1, len(query) + 1)]
+    keystrokes += list(reversed(keystrokes[:-1])) + [""]
+    durations = []
+    for _ in range(args.runs):
+        for text in keystrokes:
+            start = time.perf_counter()
+            proxy.search_text = text
+            durations.append(time.perf_counter() - start)
+    _report("keystroke", durations)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
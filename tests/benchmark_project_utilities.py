@@ -0,0 +1,105 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Stand-in for python/utils/bootstrap_utilities.py used by benchmark_project_engine.py.
+
+It is loaded by bootstrap.py exactly like the real utilities, but instead of
+bootstrapping a pipeline configuration, which requires a site, it talks to the desktop
+app the same way the project engine does and registers the fake commands described in
+the payload.
+"""
+
+import importlib.util
+import sys
+import threading
+
+
+class _HarnessEngine(object):
+    """
+    Minimal engine for the project side RPC server.
+    """
+
+    def execute_in_main_thread(self, func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+    async_execute_in_main_thread = execute_in_main_thread
+
+
+def start_import_profiler(utilities_import_time=None):
+    pass
+
+
+def execute_pre_initialization_hook(data):
+    pass
+
+
+def start_engine(data):
+    """
+    Connects back to the desktop app and registers the commands.
+    """
+    # Same as Bootstrap.start_engine.
+    sys.path.insert(0, data["core_python_path"])
+    import sgtk  # noqa
+
+    spec = importlib.util.spec_from_file_location("rpc", data["rpc_lib_path"])
+    rpc = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(rpc)
+
+    proxy = rpc.RPCProxy(
+        data["proxy_data"]["proxy_pipe"], data["proxy_data"]["proxy_auth"]
+    )
+    proxy.call_no_response("bootstrap_progress", 1.0, "Toolkit imported.")
+
+    # Same as ProjectCommunication.connect_to_server.
+    server = rpc.RPCServerThread(_HarnessEngine())
+    server.start()
+    disconnected = threading.Event()
+    server.register_function(disconnected.set, "signal_disconnect")
+    proxy.call("create_app_proxy", server.pipe, server.authkey)
+
+    # Same as DesktopEngineProjectImplementation._register_groups and
+    # _register_commands.
+    groups = ["Group %d" % index for index in range(data["group_count"])]
+    proxy.call("set_groups", groups, show_recents=True)
+    proxy.call(
+        "set_collapse_rules",
+        [{"match": "Launch $app", "button_label": "$app", "menu_label": "None"}],
+    )
+    for index in range(data["command_count"]):
+        proxy.call(
+            "trigger_register_command",
+            "command_%d" % index,
+            {
+                "type": "default",
+                "icon": "",
+                "title": "Launch App%d" % index,
+                "description": "Fake command %d" % index,
+            },
+            [groups[index % len(groups)]] if groups else [],
+        )
+    proxy.call_no_response("project_commands_finished")
+
+    return proxy, server, disconnected
+
+
+def start_app(engine):
+    """
+    Waits for the desktop app to disconnect.
+    """
+    proxy, server, disconnected = engine
+    disconnected.wait()
+    proxy.close()
+    server.close()
+    return 0
+
+
+def handle_error(data):
+    pass
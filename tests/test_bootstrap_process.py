@@ -11,6 +11,7 @@
 import os
 import subprocess
 import sys
+import threading
 import unittest.mock
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
@@ -66,3 +67,35 @@ class TestTerminateProcess:
         process.terminate.assert_called_once_with()
         process.kill.assert_called_once_with()
         assert process.wait.call_count == 2
+
+
+class TestProcessReaper:
+    def test_ignores_exited_processes(self):
+        process = unittest.mock.Mock()
+        process.poll.return_value = 0
+
+        reaper = tk_desktop.bootstrap_process.ProcessReaper()
+        reaper.retire(process)
+        reaper.retire(None)
+
+        assert reaper.pending_count == 0
+        process.terminate.assert_not_called()
+
+    def test_terminates_in_background(self):
+        release = threading.Event()
+        process = unittest.mock.Mock()
+        process.poll.return_value = None
+        process.pid = 1234
+        process.wait.side_effect = lambda timeout: release.wait()
+
+        reaper = tk_desktop.bootstrap_process.ProcessReaper()
+        reaper.retire(process)
+
+        # The caller doesn't wait for the process to exit.
+        assert reaper.pending_count == 1
+        assert reaper.wait(timeout=0.01) is False
+
+        release.set()
+        assert reaper.wait(timeout=5) is True
+        process.terminate.assert_called_once_with()
+        process.kill.assert_not_called()
@@ -0,0 +1,81 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import os
+import sys
+import unittest.mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
+
+with unittest.mock.patch.dict(
+    "sys.modules",
+    {
+        "sgtk": unittest.mock.MagicMock(
+            LogManager=unittest.mock.MagicMock(
+                get_logger=unittest.mock.MagicMock(return_value=unittest.mock.Mock())
+            )
+        )
+    },
+):
+    import tk_desktop.collapse_rules
+
+CollapseRules = tk_desktop.collapse_rules.CollapseRules
+
+RULES = [
+    {"match": "Maya $version", "button_label": "Maya", "menu_label": "$version"},
+    {
+        "match": "$app (Python $major.$minor)",
+        "button_label": "$app",
+        "menu_label": "None",
+    },
+    {"match": "$app $version", "button_label": "$app", "menu_label": "v$version"},
+]
+
+
+def test_first_matching_rule_wins():
+    """
+    Ensure the rules are tried in order and their labels are substituted.
+    """
+    rules = CollapseRules(RULES)
+    assert rules.match("Maya 2024") == ("Maya", "2024")
+    assert rules.match("Nuke (Python 3.11)") == ("Nuke", None)
+    assert rules.match("Nuke 15.1") == ("Nuke", "v15.1")
+    assert rules.match("Houdini") is None
+    assert rules.rules is RULES
+
+
+def test_no_rules():
+    """
+    Ensure nothing matches when there are no rules.
+    """
+    assert CollapseRules([]).match("Maya 2024") is None
+
+
+def test_invalid_rules_are_ignored():
+    """
+    Ensure a rule that can't be compiled doesn't prevent the others from matching.
+    """
+    rules = CollapseRules(
+        [{"match": "$app $app", "button_label": "$app", "menu_label": "None"}] + RULES
+    )
+    assert rules.match("Maya 2024") == ("Maya", "2024")
+
+
+def test_matches_are_remembered():
+    """
+    Ensure a title is only matched once.
+    """
+    rules = CollapseRules(RULES)
+    with unittest.mock.patch.object(rules, "_match", wraps=rules._match) as match:
+        rules.match("Maya 2024")
+        rules.match("Maya 2024")
+        rules.match("Houdini")
+        rules.match("Houdini")
+    assert match.call_count == 2
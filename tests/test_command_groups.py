@@ -0,0 +1,47 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import os
+import sys
+import unittest.mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
+
+with unittest.mock.patch.dict("sys.modules", {"sgtk": unittest.mock.MagicMock()}):
+    import tk_desktop.command_groups
+
+CommandGroups = tk_desktop.command_groups.CommandGroups
+
+GROUPS = [
+    {"name": "Creative Tools", "matches": ["*Maya*", "*Nuke*"]},
+    {"name": "Nuke", "matches": ["nuke ??"]},
+    {"name": "Empty", "matches": []},
+]
+
+
+def test_groups_are_matched_without_case():
+    """
+    Ensure a command goes in every group with a matching pattern, ignoring case.
+    """
+    groups = CommandGroups(GROUPS, "Studio")
+    assert groups.get_groups("Maya 2024") == ["Creative Tools"]
+    assert groups.get_groups("NUKE 15") == ["Creative Tools", "Nuke"]
+    assert groups.get_groups("Houdini") == ["Studio"]
+
+
+def test_groups_are_remembered():
+    """
+    Ensure a display name is only matched once, and that modifying the groups
+    returned doesn't change them.
+    """
+    groups = CommandGroups(GROUPS, "Studio")
+    groups.get_groups("Houdini").append("Creative Tools")
+    groups._groups = []
+    assert groups.get_groups("Houdini") == ["Studio"]
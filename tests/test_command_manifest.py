@@ -0,0 +1,124 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import pytest
+
+from command_manifest import CommandManifest
+
+PROJECT = {"type": "Project", "id": 3}
+URI = "sgtk:descriptor:app_store?name=tk-config-basic&version=v1.0.0"
+
+
+class Settings(dict):
+    def load(self, key):
+        return self.get(key)
+
+    def save(self, key, value):
+        self[key] = value
+
+
+@pytest.fixture
+def settings():
+    return Settings()
+
+
+@pytest.fixture
+def recorded_manifest(settings):
+    """
+    Manifest for which a whole registration has been recorded and saved.
+    """
+    manifest = CommandManifest(settings)
+    manifest.start_recording(PROJECT, 12, URI)
+    manifest.record_groups(["Studio", "Creative Tools"], False)
+    manifest.record_collapse_rules(
+        [{"match": "Launch $app", "button_label": "$app", "menu_label": "None"}]
+    )
+    manifest.record_command(
+        "launch_maya", {"title": "Maya 2020", "icon": "/maya.png"}, ["Creative Tools"]
+    )
+    manifest.record_command("publish", {"title": "Publish..."}, ["Studio"])
+    manifest.save()
+    return manifest
+
+
+def test_round_trip(settings, recorded_manifest):
+    """
+    Ensure what is recorded is what is loaded back.
+    """
+    manifest = CommandManifest(settings).load(PROJECT, 12, URI)
+    assert manifest["groups"] == ["Studio", "Creative Tools"]
+    assert manifest["show_recents"] is False
+    assert manifest["collapse_rules"] == [
+        {"match": "Launch $app", "button_label": "$app", "menu_label": "None"}
+    ]
+    assert manifest["commands"] == [
+        {
+            "name": "launch_maya",
+            "properties": {"title": "Maya 2020", "icon": "/maya.png"},
+            "groups": ["Creative Tools"],
+        },
+        {
+            "name": "publish",
+            "properties": {"title": "Publish..."},
+            "groups": ["Studio"],
+        },
+    ]
+
+
+@pytest.mark.parametrize(
+    "project,pipeline_configuration_id,descriptor_uri",
+    [
+        ({"type": "Project", "id": 4}, 12, URI),
+        (PROJECT, None, URI),
+        (PROJECT, 12, URI.replace("v1.0.0", "v1.0.1")),
+    ],
+)
+def test_mismatch_is_ignored(
+    settings, recorded_manifest, project, pipeline_configuration_id, descriptor_uri
+):
+    """
+    Ensure a manifest is only used for the exact same project, pipeline
+    configuration and descriptor.
+    """
+    assert (
+        CommandManifest(settings).load(
+            project, pipeline_configuration_id, descriptor_uri
+        )
+        is None
+    )
+
+
+def test_other_versions_are_ignored(settings, recorded_manifest):
+    """
+    Ensure manifests saved in a different format are not used.
+    """
+    settings["project_command_manifest.3"]["version"] = CommandManifest.VERSION + 1
+    assert CommandManifest(settings).load(PROJECT, 12, URI) is None
+
+
+def test_reset_keeps_recording(settings, recorded_manifest):
+    """
+    Ensure resetting the manifest forgets the commands, but still saves them
+    for the same project.
+    """
+    recorded_manifest.reset()
+    recorded_manifest.record_command("publish", {"title": "Publish..."}, ["Studio"])
+    recorded_manifest.save()
+
+    manifest = CommandManifest(settings).load(PROJECT, 12, URI)
+    assert [command["name"] for command in manifest["commands"]] == ["publish"]
+
+
+def test_nothing_saved_when_not_recording(settings):
+    """
+    Ensure saving before recording anything does not write to the settings.
+    """
+    CommandManifest(settings).save()
+    assert settings == {}
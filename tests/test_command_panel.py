@@ -207,6 +207,26 @@ def test_versions_sorted_in_menu(simple_test_view, commands):
     ]
 
 
+def test_menu_actions_are_reused(simple_test_view):
+    """
+    Ensure adding a version only inserts its action and moves the default.
+    """
+    _register_commands(simple_test_view, ["Maya 2017", "Maya 2019"])
+    maya_button = list(list(simple_test_view.sections)[0].buttons)[0]
+    maya_2019, maya_2017 = maya_button.menu().actions()
+
+    _register_commands(simple_test_view, ["Maya 2018*", "Maya 2020"])
+    actions = maya_button.menu().actions()
+    assert [str(action.text()) for action in actions] == [
+        "Maya 2018*",
+        "Maya 2020",
+        "Maya 2019",
+        "Maya 2017",
+    ]
+    assert actions[2] is maya_2019
+    assert actions[3] is maya_2017
+
+
 @pytest.mark.parametrize(
     "action,expected_signal",
     [("button", "maya_2019"), ("0", "maya_2019"), ("1", "maya_2018")],
@@ -348,6 +368,149 @@ def test_recents_not_added_when_disabled(qapplication):
     assert view.recents is None
 
 
+def test_disabled_commands_until_enabled(simple_test_view):
+    """
+    Ensure commands added as disabled can't be launched until they are enabled.
+    """
+    simple_test_view.add_command(
+        "maya_2019", "Maya", "Maya 2019", None, "", ["Creative Tools"], True, False
+    )
+    simple_test_view.add_command(
+        "maya_2020", "Maya", "Maya 2020", None, "", ["Creative Tools"], False, False
+    )
+    maya_button = _get_nth(_get_nth(simple_test_view.sections, 0).buttons, 0)
+    assert maya_button.isEnabled() is False
+    assert [action.isEnabled() for action in maya_button.menu().actions()] == [
+        False,
+        False,
+    ]
+
+    simple_test_view.set_command_enabled("maya_2020", True)
+    assert maya_button.isEnabled() is True
+    assert [action.isEnabled() for action in maya_button.menu().actions()] == [
+        False,
+        True,
+    ]
+
+    # The default command is still disabled, so the button launches the other one.
+    mock = Mock()
+    simple_test_view.command_triggered.connect(mock)
+    maya_button.click()
+    mock.assert_called_once_with("maya_2020")
+
+
+def test_add_commands_in_bulk(simple_test_view):
+    """
+    Ensure commands added in bulk are laid out like commands added one by one.
+    """
+    names = ["NukeX 12.0", "Maya 2019", "3ds Max 2019", "Maya 2020", "Hiero 12"]
+    simple_test_view.add_commands(
+        (
+            _name_to_command(name),
+            name.rsplit(" ", 1)[0],
+            name,
+            None,
+            "",
+            ["Editorial" if name.startswith("Hiero") else "Creative Tools"],
+        )
+        for name in names
+    )
+
+    assert [section.name for section in simple_test_view.sections] == [
+        "Creative Tools",
+        "Editorial",
+    ]
+    creative_tools = _get_nth(simple_test_view.sections, 0)
+    assert [button.name for button in creative_tools.buttons] == [
+        "3ds Max",
+        "Maya",
+        "NukeX",
+    ]
+    maya_button = _get_nth(creative_tools.buttons, 1)
+    assert [action.text() for action in maya_button.menu().actions()] == [
+        "Maya 2020*",
+        "Maya 2019",
+    ]
+
+
+def test_nested_updates(simple_test_view):
+    """
+    Ensure the buttons are only laid out once the outermost update ends.
+    """
+    simple_test_view.begin_update()
+    simple_test_view.begin_update()
+    _register_commands(simple_test_view, ["Maya 2019", "3ds Max 2019"])
+    simple_test_view.end_update()
+    grid = _get_nth(simple_test_view.sections, 0)._list.layout()
+    assert grid.count() == 0
+
+    simple_test_view.end_update()
+    assert [grid.itemAt(i).widget().name for i in range(2)] == ["3ds Max", "Maya"]
+    assert simple_test_view.updatesEnabled()
+
+
+def test_registration_is_laid_out_once(simple_test_view):
+    """
+    Ensure commands registered by a project are laid out once registration is
+    over, or once it has taken too long.
+    """
+    simple_test_view.begin_registration()
+    _register_commands(simple_test_view, ["Maya 2019", "3ds Max 2019"])
+    grid = _get_nth(simple_test_view.sections, 0)._list.layout()
+    assert grid.count() == 0
+    assert not simple_test_view.updatesEnabled()
+
+    simple_test_view.end_registration()
+    assert [grid.itemAt(i).widget().name for i in range(2)] == ["3ds Max", "Maya"]
+    assert simple_test_view.updatesEnabled()
+
+    simple_test_view.REGISTRATION_TIMEOUT = 0
+    simple_test_view.begin_registration()
+    _register_commands(simple_test_view, ["Nuke 12"])
+    assert not simple_test_view.updatesEnabled()
+    deadline = datetime.datetime.now() + datetime.timedelta(seconds=5)
+    while not simple_test_view.updatesEnabled() and datetime.datetime.now() < deadline:
+        sgtk.platform.qt.QtGui.QApplication.processEvents()
+    assert simple_test_view.updatesEnabled()
+    assert [grid.itemAt(i).widget().name for i in range(3)] == [
+        "3ds Max",
+        "Maya",
+        "Nuke",
+    ]
+
+
+def test_collapsed_sections_create_buttons_when_expanded():
+    """
+    Ensure a collapsed section only creates its buttons once it is expanded, and
+    that commands enabled in the meantime are enabled on the buttons.
+    """
+    view = CommandPanel(
+        sgtk.platform.qt.QtGui.QScrollArea(),
+        Settings({"project_expanded_state.3": {"CREATIVE TOOLS": False}}),
+    )
+    view.configure(PROJECT, ["Creative Tools", "Editorial"])
+    view.add_command(
+        "maya_2019", "Maya", "Maya 2019", None, "", ["Creative Tools"], True, False
+    )
+    _register_commands(view, ["Nuke 12"])
+    creative_tools = _get_nth(view.sections, 0)
+    assert list(creative_tools.buttons) == []
+
+    view.set_command_enabled("maya_2019", True)
+    creative_tools.set_expanded(True)
+    assert [button.name for button in creative_tools.buttons] == ["Maya", "Nuke"]
+    assert _get_nth(creative_tools.buttons, 0).isEnabled() is True
+
+    # Once created, the buttons are kept up to date even when collapsed.
+    creative_tools.set_expanded(False)
+    _register_commands(view, ["3ds Max 2020"])
+    assert [button.name for button in creative_tools.buttons] == [
+        "3ds Max",
+        "Maya",
+        "Nuke",
+    ]
+
+
 def _name_to_command(name):
     """
     Converts a product name into a command string.
@@ -0,0 +1,170 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import os
+import pickle
+import subprocess
+import sys
+import textwrap
+import threading
+
+import pytest
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(__file__), os.pardir, "python", "utils")
+)
+
+import fork_server  # noqa
+
+pytestmark = pytest.mark.skipif(
+    not fork_server.is_supported(), reason="The fork server is only used on Linux."
+)
+
+# Utilities module that records what the forked process sees instead of
+# starting an engine.
+UTILITIES = """
+import os
+import sys
+
+
+def execute_pre_initialization_hook(data):
+    pass
+
+
+def start_engine(data):
+    with open(data["output"], "w") as fh:
+        fh.write(
+            "%s|%s|%s" % (
+                os.environ.get("SHOTGUN_DESKTOP_CURRENT_USER"),
+                os.getcwd(),
+                "sgtk" in sys.modules,
+            )
+        )
+    return data
+
+
+def start_app(engine):
+    return engine["returncode"]
+
+
+def handle_error(data):
+    pass
+"""
+
+
+@pytest.fixture
+def server(tmp_path):
+    """
+    Fork server that preloaded a fake core.
+    """
+    core = tmp_path / "core"
+    (core / "sgtk").mkdir(parents=True)
+    (core / "sgtk" / "__init__.py").write_text("")
+    utilities = tmp_path / "utilities.py"
+    utilities.write_text(textwrap.dedent(UTILITIES))
+
+    server = fork_server.ForkServer(sys.executable, str(core), str(utilities))
+    server.start()
+    server.wait_until_ready(30)
+    yield server
+    server.shut_down()
+
+
+def _write_data(tmp_path, returncode):
+    data_path = str(tmp_path / "data.pkl")
+    with open(data_path, "wb") as fh:
+        pickle.dump(
+            {"output": str(tmp_path / "output.txt"), "returncode": returncode}, fh
+        )
+    return data_path
+
+
+def test_fork_applies_environment(server, tmp_path):
+    """
+    Ensure the forked process gets the environment and working directory
+    of the request and that the return code is reported.
+    """
+    env = dict(os.environ, SHOTGUN_DESKTOP_CURRENT_USER="serialized-user")
+    process = server.launch(_write_data(tmp_path, 3), env=env, cwd=str(tmp_path))
+    assert process.wait(timeout=30) == 3
+    assert process.poll() == 3
+    assert (tmp_path / "output.txt").read_text() == "serialized-user|%s|True" % (
+        tmp_path
+    )
+
+
+def test_terminate_forked_process(server, tmp_path):
+    """
+    Ensure a forked process that doesn't exit can be terminated like a
+    regular subprocess.
+    """
+    data_path = str(tmp_path / "missing.pkl")
+    # Hang in the child by handing it a fifo to read the data from.
+    os.mkfifo(data_path)
+    process = server.launch(data_path)
+    with pytest.raises(subprocess.TimeoutExpired):
+        process.wait(timeout=0.1)
+    process.terminate()
+    assert process.wait(timeout=30) == -15
+
+
+def test_launch_does_not_wait_for_server(tmp_path):
+    """
+    Ensure the first launch starts the server without waiting for it, so the
+    process has to be launched some other way.
+    """
+    core = tmp_path / "core"
+    (core / "sgtk").mkdir(parents=True)
+    # Preloading the core takes a while.
+    (core / "sgtk" / "__init__.py").write_text("import time\ntime.sleep(1)\n")
+    utilities = tmp_path / "utilities.py"
+    utilities.write_text(textwrap.dedent(UTILITIES))
+
+    server = fork_server.ForkServer(sys.executable, str(core), str(utilities))
+    try:
+        assert server.launch(_write_data(tmp_path, 0)) is None
+        assert server.is_running
+        assert server.launch(_write_data(tmp_path, 0)) is None
+
+        server.wait_until_ready(30)
+        assert server.launch(_write_data(tmp_path, 0)).wait(timeout=30) == 0
+    finally:
+        server.shut_down()
+
+
+def test_poll_while_waiting(server, tmp_path):
+    """
+    Ensure a process can be polled while another thread waits on it.
+    """
+    data_path = str(tmp_path / "missing.pkl")
+    os.mkfifo(data_path)
+    process = server.launch(data_path)
+    returncodes = []
+    waiter = threading.Thread(target=lambda: returncodes.append(process.wait()))
+    waiter.start()
+    for _ in range(10):
+        assert process.poll() is None
+    process.terminate()
+    waiter.join(timeout=30)
+    assert returncodes == [-15]
+    assert process.poll() == -15
+
+
+def test_terminate_right_after_launch(server, tmp_path):
+    """
+    Ensure a process terminated as soon as it is forked is reported as
+    terminated, instead of running the server's SIGTERM handler.
+    """
+    data_path = str(tmp_path / "missing.pkl")
+    os.mkfifo(data_path)
+    for _ in range(20):
+        process = server.launch(data_path)
+        process.terminate()
+        assert process.wait(timeout=30) == -15
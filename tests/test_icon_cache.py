@@ -0,0 +1,129 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import os
+import sys
+import time
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
+sys.path.insert(
+    0, os.path.join(os.path.dirname(__file__), "..", "..", "tk-core", "python")
+)
+
+# Patch sgtk to se can use Qt in the tests.
+import sgtk
+
+importer = sgtk.util.qt_importer.QtImporter()
+sgtk.platform.qt.QtGui = importer.QtGui
+sgtk.platform.qt.QtCore = importer.QtCore
+
+QtGui = sgtk.platform.qt.QtGui
+
+from command_panel.icon_cache import IconCache  # noqa
+from command_panel.shared import ICON_SIZE  # noqa
+
+
+@pytest.fixture(scope="session", autouse=True)
+def qapplication():
+    yield QtGui.QApplication.instance() or QtGui.QApplication([])
+
+
+def write_icon(path, size=100):
+    pixmap = QtGui.QPixmap(size, size)
+    pixmap.fill()
+    assert pixmap.save(path, "PNG")
+    return path
+
+
+def wait_for_loads(cache, timeout=5):
+    """
+    Processes events until the icons being loaded are loaded.
+    """
+    end = time.time() + timeout
+    while cache._pending and time.time() < end:
+        QtGui.QApplication.processEvents()
+        time.sleep(0.01)
+    assert not cache._pending
+
+
+def test_icons_are_loaded_in_background(tmp_path):
+    """
+    Ensure a placeholder is returned until the icon is loaded, after which it is
+    shared.
+    """
+    path = write_icon(str(tmp_path / "maya.png"))
+    cache = IconCache()
+    loaded = []
+    cache.icon_loaded.connect(loaded.append)
+
+    placeholder = cache.get_pixmap(path)
+    assert placeholder.size() == ICON_SIZE
+    assert not cache.is_loaded(path)
+    wait_for_loads(cache)
+
+    assert loaded == [path]
+    icon = cache.get_icon(path)
+    assert cache.get_icon(path).cacheKey() == icon.cacheKey()
+    assert cache.get_pixmap(path).size() == ICON_SIZE
+    assert len(cache) == 1
+
+
+def test_modified_icons_are_reloaded(tmp_path):
+    """
+    Ensure an icon is loaded again when its file changes.
+    """
+    path = write_icon(str(tmp_path / "maya.png"))
+    cache = IconCache()
+    cache.REVALIDATE_INTERVAL = -1
+    cache.get_icon(path)
+    wait_for_loads(cache)
+    icon = cache.get_icon(path)
+    wait_for_loads(cache)
+    assert cache.get_icon(path).cacheKey() == icon.cacheKey()
+
+    os.utime(path, (0, 0))
+    cache.get_icon(path)
+    wait_for_loads(cache)
+    assert cache.get_icon(path).cacheKey() != icon.cacheKey()
+    assert len(cache) == 1
+
+
+def test_missing_icons_are_not_checked_again(tmp_path):
+    """
+    Ensure a missing icon is only checked once.
+    """
+    path = str(tmp_path / "missing.png")
+    cache = IconCache()
+    cache.get_icon(path)
+    wait_for_loads(cache)
+
+    with patch("command_panel.icon_cache._load_images") as load_images:
+        assert cache.get_pixmap(path).size() == ICON_SIZE
+        assert not cache.is_loaded(path)
+        load_images.assert_not_called()
+
+
+def test_budget_evicts_least_recently_used(tmp_path):
+    """
+    Ensure the least recently used icons are evicted once over budget.
+    """
+    paths = [write_icon(str(tmp_path / ("%d.png" % i))) for i in range(3)]
+    cache = IconCache()
+    cache.get_icon(paths[0])
+    wait_for_loads(cache)
+    cache = IconCache(budget=cache.cost * 2)
+    for path in paths:
+        cache.get_icon(path)
+        wait_for_loads(cache)
+    assert len(cache) == 2
+    assert not cache.is_loaded(paths[0])
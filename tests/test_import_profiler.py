@@ -0,0 +1,95 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import importlib.machinery
+import importlib.util
+import json
+import os
+import sys
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(__file__), os.pardir, "python", "utils")
+)
+
+import bootstrap_utilities  # noqa
+
+
+def test_profiles_first_imports_only(tmp_path):
+    """
+    Ensure only modules that weren't already loaded are timed and that
+    the profiler restores the loaders.
+    """
+    original_exec_module = importlib.machinery.SourceFileLoader.exec_module
+    sys.modules.pop("colorsys", None)
+
+    profiler = bootstrap_utilities.ImportProfiler()
+    profiler.start()
+    try:
+        import colorsys  # noqa
+        import os  # noqa
+    finally:
+        profiler.stop()
+
+    assert importlib.machinery.SourceFileLoader.exec_module is original_exec_module
+    assert "exec_module" not in importlib.machinery.SourceFileLoader.__dict__
+
+    modules = [name for name, _, _ in profiler.get_top_modules()]
+    assert "colorsys" in modules
+    assert "os" not in modules
+    assert "colorsys" in profiler.format_report()
+
+    path = str(tmp_path / "imports.json")
+    profiler.save(path, {"stage": "test"})
+    with open(path) as fh:
+        profile = json.load(fh)
+    assert profile["metadata"] == {"stage": "test"}
+    timing = profile["modules"]["colorsys"]
+    assert timing["cumulative"] >= timing["self"] >= 0
+
+
+def test_profiles_submodules_and_hooks(tmp_path, monkeypatch):
+    """
+    Ensure submodules imported with a fromlist and modules loaded straight from
+    their file, like hooks, are timed.
+    """
+    package = tmp_path / "profiled_package"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "submodule.py").write_text("")
+    hook_path = tmp_path / "hook.py"
+    hook_path.write_text("")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    profiler = bootstrap_utilities.ImportProfiler()
+    profiler.start()
+    try:
+        import profiled_package  # noqa
+
+        from profiled_package import submodule  # noqa
+
+        spec = importlib.util.spec_from_file_location("tkimp_hook", str(hook_path))
+        spec.loader.exec_module(importlib.util.module_from_spec(spec))
+    finally:
+        profiler.stop()
+        sys.modules.pop("profiled_package", None)
+        sys.modules.pop("profiled_package.submodule", None)
+
+    modules = [name for name, _, _ in profiler.get_top_modules(count=None)]
+    assert "profiled_package" in modules
+    assert "profiled_package.submodule" in modules
+    assert str(hook_path) in modules
+
+
+def test_disabled_by_default(monkeypatch):
+    """
+    Ensure profiling is opt-in.
+    """
+    monkeypatch.delenv(bootstrap_utilities.IMPORT_PROFILER_ENV_VAR, raising=False)
+    assert bootstrap_utilities.start_import_profiler() is None
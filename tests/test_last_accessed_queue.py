@@ -0,0 +1,153 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import os
+import sys
+import threading
+import unittest.mock
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
+
+with unittest.mock.patch.dict(
+    "sys.modules",
+    {
+        "sgtk": unittest.mock.MagicMock(
+            LogManager=unittest.mock.MagicMock(
+                get_logger=unittest.mock.MagicMock(return_value=unittest.mock.Mock())
+            )
+        )
+    },
+):
+    import tk_desktop.last_accessed_queue
+
+LastAccessedQueue = tk_desktop.last_accessed_queue.LastAccessedQueue
+
+USER = {"type": "HumanUser", "id": 42, "name": "Someone"}
+SITE = "https://example.shotgunstudio.com"
+
+
+@pytest.fixture
+def journal_path(tmp_path):
+    return str(tmp_path / "journal.json")
+
+
+def test_accesses_are_coalesced(journal_path):
+    """
+    Ensure accessing a project many times before the update is sent only sends
+    one update.
+    """
+    update = unittest.mock.Mock()
+    queue = LastAccessedQueue(journal_path, update)
+    for _ in range(3):
+        queue.record({"type": "Project", "id": 1}, USER)
+    queue.record({"type": "Project", "id": 2}, USER)
+    assert queue.pending_count == 2
+
+    assert queue.flush()
+    assert update.call_count == 2
+    update.assert_any_call(
+        {"type": "Project", "id": 1}, {"type": "HumanUser", "id": 42}
+    )
+    assert not os.path.exists(journal_path)
+
+
+def test_journal_survives_restarts(journal_path):
+    """
+    Ensure accesses that weren't sent are sent by the next queue.
+    """
+    failing_update = unittest.mock.Mock(side_effect=Exception("Site unreachable"))
+    queue = LastAccessedQueue(journal_path, failing_update, site=SITE, user=USER)
+    queue.record({"type": "Project", "id": 1}, USER)
+    assert not queue.flush()
+    assert os.path.exists(journal_path)
+
+    update = unittest.mock.Mock()
+    queue = LastAccessedQueue(journal_path, update, site=SITE, user=USER)
+    assert queue.pending_count == 1
+    assert queue.flush()
+    update.assert_called_once_with(
+        {"type": "Project", "id": 1}, {"type": "HumanUser", "id": 42}
+    )
+
+
+@pytest.mark.parametrize(
+    "site,user",
+    [
+        ("https://other.shotgunstudio.com", USER),
+        (SITE, {"type": "HumanUser", "id": 7}),
+    ],
+)
+def test_journal_of_others_is_dropped(journal_path, site, user):
+    """
+    Ensure accesses journaled for another site or user are not sent.
+    """
+    failing_update = unittest.mock.Mock(side_effect=Exception("Site unreachable"))
+    queue = LastAccessedQueue(journal_path, failing_update, site=SITE, user=USER)
+    queue.record({"type": "Project", "id": 1}, USER)
+    assert not queue.flush()
+
+    update = unittest.mock.Mock()
+    queue = LastAccessedQueue(journal_path, update, site=site, user=user)
+    assert queue.pending_count == 0
+    assert queue.flush()
+    update.assert_not_called()
+
+
+def test_journal_is_written_by_the_thread(journal_path):
+    """
+    Ensure recording an access doesn't write the journal, and that the background
+    thread writes it before it stops.
+    """
+    queue = LastAccessedQueue(
+        journal_path, unittest.mock.Mock(side_effect=Exception), retry_delay=60
+    )
+    queue.record({"type": "Project", "id": 1}, USER)
+    assert not os.path.exists(journal_path)
+
+    queue.start()
+    queue.stop(timeout=5)
+    assert os.path.exists(journal_path)
+
+
+def test_gives_up_after_max_attempts(journal_path):
+    """
+    Ensure an access that can never be sent doesn't stay in the queue forever.
+    """
+    queue = LastAccessedQueue(journal_path, unittest.mock.Mock(side_effect=Exception))
+    queue.record({"type": "Project", "id": 1}, USER)
+    for _ in range(LastAccessedQueue.MAX_ATTEMPTS - 1):
+        assert not queue.flush()
+    assert queue.flush()
+    assert queue.pending_count == 0
+
+
+def test_background_thread_retries(journal_path):
+    """
+    Ensure the background thread sends the accesses and retries after failures.
+    """
+    sent = threading.Event()
+    calls = []
+
+    def update(project, user):
+        calls.append(project)
+        if len(calls) == 1:
+            raise Exception("Site unreachable")
+        sent.set()
+
+    queue = LastAccessedQueue(journal_path, update, retry_delay=0.01)
+    queue.start()
+    try:
+        queue.record({"type": "Project", "id": 1}, USER)
+        assert sent.wait(5)
+    finally:
+        queue.stop(timeout=5)
+    assert len(calls) == 2
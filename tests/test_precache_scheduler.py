@@ -0,0 +1,80 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import os
+import sys
+import time
+from unittest.mock import Mock
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
+sys.path.insert(
+    0, os.path.join(os.path.dirname(__file__), "..", "..", "tk-core", "python")
+)
+
+# Patch sgtk to se can use Qt in the tests.
+import sgtk
+
+importer = sgtk.util.qt_importer.QtImporter()
+sgtk.platform.qt.QtGui = importer.QtGui
+sgtk.platform.qt.QtCore = importer.QtCore
+
+from tk_desktop.precache_scheduler import PrecacheScheduler  # noqa
+
+PROJECTS = [
+    {"id": 1, "current_user_favorite": False, "last_accessed_by_current_user": 10},
+    {"id": 2, "current_user_favorite": True, "last_accessed_by_current_user": None},
+    {"id": 3, "current_user_favorite": False, "last_accessed_by_current_user": 30},
+    {"id": 4, "current_user_favorite": False, "last_accessed_by_current_user": 20},
+]
+
+
+class Settings(dict):
+    def load(self, key):
+        return self.get(key)
+
+    def save(self, key, value):
+        self[key] = value
+
+
+@pytest.fixture
+def scheduler():
+    return PrecacheScheduler(lambda: PROJECTS, Mock(), Settings(), 3)
+
+
+def test_candidates_order(scheduler):
+    """
+    Ensure favourites are cached first, followed by the most recent projects.
+    """
+    assert [p["id"] for p in scheduler._get_candidates()] == [2, 3, 4]
+
+
+def test_fresh_projects_are_skipped(scheduler):
+    """
+    Ensure projects cached recently are not cached again, but stale ones are.
+    """
+    descriptor = Mock()
+    descriptor.get_uri.return_value = "sgtk:descriptor:path?path=/config"
+    scheduler._on_project_cached(PROJECTS[1], descriptor)
+    scheduler._settings[PrecacheScheduler.SETTINGS_KEY]["3"] = {
+        "timestamp": time.time() - PrecacheScheduler.FRESHNESS_PERIOD - 1,
+        "descriptor": None,
+    }
+
+    assert scheduler.get_freshness(2) is not None
+    assert [p["id"] for p in scheduler._get_candidates()] == [3, 4]
+
+
+def test_disabled_by_default():
+    """
+    Ensure nothing is cached when no project count is configured.
+    """
+    assert not PrecacheScheduler(lambda: PROJECTS, Mock(), Settings(), 0).is_enabled
@@ -0,0 +1,165 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
+sys.path.insert(
+    0, os.path.join(os.path.dirname(__file__), "..", "..", "tk-core", "python")
+)
+
+# Patch sgtk to se can use Qt in the tests.
+import sgtk
+
+importer = sgtk.util.qt_importer.QtImporter()
+sgtk.platform.qt.QtGui = importer.QtGui
+sgtk.platform.qt.QtCore = importer.QtCore
+
+QtCore = sgtk.platform.qt.QtCore
+
+from tk_desktop.project_delta_sync import ProjectDeltaCache, ProjectDeltaSync  # noqa
+
+
+class FakeDataRetriever(QtCore.QObject):
+    """
+    Answers find requests from a list of projects, synchronously once
+    respond is called.
+    """
+
+    work_completed = QtCore.Signal(str, str, dict)
+    work_failure = QtCore.Signal(str, str)
+
+    def __init__(self, projects):
+        super().__init__()
+        self.projects = projects
+        self.requests = []
+
+    def execute_find(self, entity_type, filters, fields, order, limit):
+        self.requests.append((filters, fields))
+        return str(len(self.requests))
+
+    def respond(self):
+        """
+        Answers the last request, only filtering on ids.
+        """
+        filters, fields = self.requests[-1]
+        last_id = filters[-1][2]
+        projects = [
+            dict((field, p[field]) for field in ["type"] + fields if field in p)
+            for p in self.projects
+            if p["id"] > last_id
+        ][: ProjectDeltaSync.PAGE_SIZE]
+        self.work_completed.emit(str(len(self.requests)), "find", {"sg": projects})
+
+
+@pytest.fixture
+def retriever():
+    return FakeDataRetriever(
+        [
+            {"type": "Project", "id": index, "name": "Project %d" % index}
+            for index in range(1, ProjectDeltaSync.PAGE_SIZE + 11)
+        ]
+    )
+
+
+@pytest.fixture
+def sync(retriever):
+    sync = ProjectDeltaSync(retriever, "Project", [], ["name"])
+    sync.pages = []
+    sync.swept = []
+    sync.projects_updated.connect(sync.pages.append)
+    sync.projects_swept.connect(sync.swept.append)
+    return sync
+
+
+def test_full_sync_is_paged(retriever, sync):
+    """
+    Ensure projects are downloaded a page at a time and all of them are reported
+    as existing when there is no watermark.
+    """
+    sync.sync()
+    retriever.respond()
+    assert len(sync.pages) == 1
+    assert sync.is_syncing
+
+    retriever.respond()
+    assert [len(page) for page in sync.pages] == [ProjectDeltaSync.PAGE_SIZE, 10]
+    assert len(sync.swept) == 1
+    assert len(sync.swept[0]) == ProjectDeltaSync.PAGE_SIZE + 10
+    assert not sync.is_syncing
+
+
+def test_delta_sync_filters_on_watermark_and_sweeps(retriever, sync):
+    """
+    Ensure only the projects updated after the watermark are requested, followed
+    by a sweep of the ids the first time.
+    """
+    sync.sync(1000)
+    filters, fields = retriever.requests[-1]
+    assert filters[0][:2] == ["updated_at", "greater_than"]
+    retriever.projects = retriever.projects[:5]
+    retriever.respond()
+
+    filters, fields = retriever.requests[-1]
+    assert fields == ProjectDeltaSync.SWEEP_FIELDS
+    assert "updated_at" not in [f[0] for f in filters]
+    retriever.respond()
+    assert [p["id"] for p in sync.swept[0]] == [1, 2, 3, 4, 5]
+
+    # The next sync doesn't need a sweep.
+    sync.sync(1000)
+    retriever.respond()
+    assert len(sync.swept) == 1
+    assert not sync.is_syncing
+
+
+def test_stale_responses_are_ignored(retriever, sync):
+    """
+    Ensure the responses to an abandoned sync are ignored.
+    """
+    sync.sync()
+    sync.stop()
+    retriever.respond()
+    assert sync.pages == []
+
+
+def test_cache_is_restored(tmp_path):
+    """
+    Ensure the projects and the watermark are read back, unless the filters or the
+    fields changed.
+    """
+    path = str(tmp_path / "project_delta_sync.json")
+    filters = [["archived", "is_not", True]]
+    fields = ["name", "updated_at"]
+    projects = [{"type": "Project", "id": 1, "name": "Alpha", "updated_at": 1000.0}]
+    assert ProjectDeltaCache(path, filters, fields).load() == (None, [])
+
+    ProjectDeltaCache(path, filters, fields).save(1000.0, projects)
+    assert ProjectDeltaCache(path, filters, fields).load() == (1000.0, projects)
+    assert ProjectDeltaCache(path, [], fields).load() == (None, [])
+    assert ProjectDeltaCache(path, filters, ["name"]).load() == (None, [])
+
+    ProjectDeltaCache(path, filters, fields).clear()
+    assert ProjectDeltaCache(path, filters, fields).load() == (None, [])
+
+
+def test_cache_only_saves_fields(tmp_path):
+    """
+    Ensure data added to the projects after they were downloaded is not saved.
+    """
+    path = str(tmp_path / "project_delta_sync.json")
+    cache = ProjectDeltaCache(path, [], ["name"])
+    cache.save(
+        1000.0, [{"type": "Project", "id": 1, "name": "Alpha", "item": object()}]
+    )
+    assert cache.load() == (1000.0, [{"type": "Project", "id": 1, "name": "Alpha"}])
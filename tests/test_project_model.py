@@ -0,0 +1,164 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import os
+import sys
+import types
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
+sys.path.insert(
+    0, os.path.join(os.path.dirname(__file__), "..", "..", "tk-core", "python")
+)
+
+# Patch sgtk to se can use Qt in the tests.
+import sgtk
+
+importer = sgtk.util.qt_importer.QtImporter()
+sgtk.platform.qt.QtGui = importer.QtGui
+sgtk.platform.qt.QtCore = importer.QtCore
+
+QtGui = sgtk.platform.qt.QtGui
+QtCore = sgtk.platform.qt.QtCore
+
+
+class ShotgunModel(QtGui.QStandardItemModel):
+    """
+    Stand-in for the shotgunutils ShotgunModel, which needs an engine.
+    """
+
+    SG_DATA_ROLE = QtCore.Qt.UserRole + 1
+
+
+with patch(
+    "sgtk.platform.import_framework",
+    return_value=types.SimpleNamespace(ShotgunModel=ShotgunModel),
+):
+    from tk_desktop.project_model import (
+        ProjectSearchIndex,
+        SgProjectModel,
+        SgProjectModelProxy,
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def qapplication():
+    yield QtGui.QApplication.instance() or QtGui.QApplication([])
+
+
+def create_model(projects):
+    """
+    :returns: A model filled with the given projects.
+    """
+    model = ShotgunModel()
+    for project in projects:
+        item = QtGui.QStandardItem(project["name"])
+        item.setData(project, ShotgunModel.SG_DATA_ROLE)
+        model.appendRow(item)
+    return model
+
+
+def create_proxy(projects, limit=None):
+    """
+    :returns: A sorted proxy on top of a model filled with the given projects.
+    """
+    proxy = SgProjectModelProxy()
+    proxy.limit = limit
+    proxy.setSourceModel(create_model(projects))
+    proxy.sort(0)
+    return proxy
+
+
+def get_ids(proxy):
+    """
+    :returns: The ids of the projects in the proxy, in order.
+    """
+    return [
+        proxy.index(row, 0).data(ShotgunModel.SG_DATA_ROLE)["id"]
+        for row in range(proxy.rowCount())
+    ]
+
+
+def project(id, name, last_accessed=None):
+    return {
+        "type": "Project",
+        "id": id,
+        "name": name,
+        "last_accessed_by_current_user": last_accessed,
+    }
+
+
+def test_sorted_by_last_accessed():
+    """
+    Ensure the most recently accessed projects come first, and the never
+    accessed ones are last.
+    """
+    proxy = create_proxy(
+        [project(1, "A", 10), project(2, "B"), project(3, "C", 30), project(4, "D", 20)]
+    )
+    assert get_ids(proxy) == [3, 4, 1, 2]
+
+
+def test_limit_filters_out_projects():
+    """
+    Ensure only the most recent projects are kept when there is a limit.
+    """
+    proxy = create_proxy(
+        [project(1, "A", 10), project(2, "B", 20), project(3, "C", 30)], limit=2
+    )
+    assert get_ids(proxy) == [3, 2]
+
+
+def test_search_ranks_projects():
+    """
+    Ensure searching filters out projects that don't match and ranks the others.
+    """
+    proxy = create_proxy(
+        [project(1, "Big Buck Bunny", 30), project(2, "Bunny", 10), project(3, "Other")]
+    )
+    proxy.search_text = "bunny"
+    assert get_ids(proxy) == [2, 1]
+
+
+def test_search_highlights_displayed_names():
+    """
+    Ensure the matching characters are highlighted in the names returned by the
+    proxy, and only while searching.
+    """
+    proxy = create_proxy([project(1, "Bunny", 10), project(2, "Other")])
+    proxy.search_text = "bn"
+    assert proxy.rowCount() == 1
+    highlighted = proxy.index(0, 0).data(SgProjectModel.DISPLAY_NAME_ROLE)
+    assert highlighted.startswith("<b><u><font color='white'>B</font></u></b>u")
+
+    proxy.search_text = ""
+    assert proxy.rowCount() == 2
+    assert proxy.index(0, 0).data(SgProjectModel.DISPLAY_NAME_ROLE) == "Bunny"
+
+
+def test_search_index_narrows_previous_hits():
+    """
+    Ensure extending or shortening a query gives the same results as searching
+    from scratch.
+    """
+    projects = [
+        project(1, "Alpha"),
+        project(2, "Bravo"),
+        project(3, "Abracadabra"),
+        project(4, "\u0130stanbul"),
+    ]
+    index = ProjectSearchIndex(projects)
+    for query in ["a", "ab", "abr", "ab", "b", "ist", "ISTA"]:
+        expected = ProjectSearchIndex(projects).search(query)
+        assert index.search(query) == expected
+    assert [p["id"] for p in index.search("abr")] == [3]
+    assert index.highlight(projects[0]) is None
@@ -0,0 +1,113 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import os
+import subprocess
+import sys
+import unittest.mock
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
+
+with unittest.mock.patch.dict(
+    "sys.modules",
+    {
+        "sgtk": unittest.mock.MagicMock(
+            LogManager=unittest.mock.MagicMock(
+                get_logger=unittest.mock.MagicMock(return_value=unittest.mock.Mock())
+            )
+        )
+    },
+):
+    import tk_desktop.resource_monitor
+
+resource_monitor = tk_desktop.resource_monitor
+
+
+class FakeBackend:
+    def __init__(self, *values):
+        self._values = list(values)
+
+    def sample(self, pid):
+        return self._values.pop(0)
+
+
+@pytest.fixture
+def logger():
+    with unittest.mock.patch.object(resource_monitor, "logger") as logger:
+        yield logger
+
+
+def test_history_and_cpu_usage(logger):
+    monitor = resource_monitor.ResourceMonitor(
+        FakeBackend((1.0, 100, 4, 10, 1), (2.0, 200, 5, 11, 2), None),
+        history_size=2,
+    )
+    monitor._pid = 1234
+
+    first = monitor.sample_once()
+    assert first.cpu_percent == 0
+    with unittest.mock.patch.object(
+        resource_monitor.time, "time", return_value=first.timestamp + 2
+    ):
+        second = monitor.sample_once()
+    assert second.cpu_percent == pytest.approx(50)
+    assert second.num_processes == 2
+    assert monitor.samples == [first, second]
+    assert "2 process(es)" in monitor.format_summary()
+
+    # The process went away.
+    assert monitor.sample_once() is None
+    assert monitor._pid is None
+
+
+def test_memory_warning_when_crossing_threshold(logger):
+    monitor = resource_monitor.ResourceMonitor(
+        FakeBackend(
+            (0, 100, 1, 1, 1),
+            (0, 300, 1, 1, 1),
+            (0, 400, 1, 1, 1),
+            (0, 100, 1, 1, 1),
+            (0, 300, 1, 1, 1),
+        ),
+        memory_threshold=200,
+    )
+    monitor._pid = 1234
+    for _ in range(5):
+        monitor.sample_once()
+    assert logger.warning.call_count == 2
+
+
+def test_watch_resets_history(logger):
+    monitor = resource_monitor.ResourceMonitor(FakeBackend((0, 1, 1, 1, 1)))
+    monitor._pid = 1234
+    monitor.sample_once()
+    monitor.watch(None)
+    assert monitor.samples == []
+    assert monitor.latest is None
+
+
+@pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="/proc is only available on Linux."
+)
+def test_procfs_includes_children():
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        cpu_time, rss, threads, fds, processes = (
+            resource_monitor.ProcfsBackend().sample(os.getpid())
+        )
+        assert processes >= 2
+        assert rss > 0
+        assert threads >= 2
+        assert fds > 0
+    finally:
+        child.kill()
+        child.wait()
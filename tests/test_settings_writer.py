@@ -0,0 +1,108 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import os
+import sys
+import threading
+import unittest.mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
+
+with unittest.mock.patch.dict(
+    "sys.modules",
+    {
+        "sgtk": unittest.mock.MagicMock(
+            LogManager=unittest.mock.MagicMock(
+                get_logger=unittest.mock.MagicMock(return_value=unittest.mock.Mock())
+            )
+        )
+    },
+):
+    import tk_desktop.settings_writer
+
+SettingsWriter = tk_desktop.settings_writer.SettingsWriter
+
+
+def test_changes_are_batched():
+    """
+    Ensure many changes to a key are written once, with the last value.
+    """
+    store = unittest.mock.Mock()
+    writer = SettingsWriter(store)
+    expanded_state = {}
+    for is_expanded in [True, False, True]:
+        expanded_state["RECENT"] = is_expanded
+        writer.write("project_expanded_state.1", expanded_state)
+    writer.write("project_recent_apps.1", {"maya": {"added": False}})
+    assert writer.pending_count == 2
+    store.assert_not_called()
+
+    writer.flush()
+    assert store.call_args_list == [
+        unittest.mock.call("project_expanded_state.1", {"RECENT": True}),
+        unittest.mock.call("project_recent_apps.1", {"maya": {"added": False}}),
+    ]
+    assert writer.pending_count == 0
+
+
+def test_pending_values_are_read_back():
+    """
+    Ensure a value that hasn't been written yet is returned, and that modifying the
+    value after writing it doesn't change what is written.
+    """
+    writer = SettingsWriter(unittest.mock.Mock())
+    value = {"RECENT": True}
+    writer.write("key", value)
+    value["RECENT"] = False
+    assert writer.get("key") == {"RECENT": True}
+    assert writer.get("other", "default") == "default"
+
+    writer.flush()
+    assert writer.get("key") is None
+
+
+def test_background_thread_writes():
+    """
+    Ensure the background thread writes the settings, and stopping writes the
+    remaining ones.
+    """
+    written = threading.Event()
+    calls = []
+
+    def store(key, value):
+        calls.append((key, value, threading.current_thread()))
+        written.set()
+
+    writer = SettingsWriter(store, delay=0.01)
+    writer.start()
+    writer.write("key", 1)
+    assert written.wait(5)
+    assert calls[0][:2] == ("key", 1)
+    assert calls[0][2] is not threading.current_thread()
+
+    # Stop before the thread has a chance to write.
+    writer._delay = 60
+    writer.write("key", 2)
+    writer.stop(timeout=5)
+    assert calls[-1][:2] == ("key", 2)
+    assert writer.pending_count == 0
+
+
+def test_failed_writes_are_dropped():
+    """
+    Ensure a setting that can't be written doesn't prevent writing the others.
+    """
+    store = unittest.mock.Mock(side_effect=[Exception("Disk full"), None])
+    writer = SettingsWriter(store)
+    writer.write("a", 1)
+    writer.write("b", 2)
+    writer.flush()
+    assert store.call_count == 2
+    assert writer.pending_count == 0
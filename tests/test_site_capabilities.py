@@ -0,0 +1,140 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import os
+import sys
+import unittest.mock
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
+
+with unittest.mock.patch.dict(
+    "sys.modules",
+    {
+        "sgtk": unittest.mock.MagicMock(
+            LogManager=unittest.mock.MagicMock(
+                get_logger=unittest.mock.MagicMock(return_value=unittest.mock.Mock())
+            )
+        )
+    },
+):
+    import tk_desktop.site_capabilities
+
+SiteCapabilities = tk_desktop.site_capabilities.SiteCapabilities
+
+SITE = "https://example.shotgunstudio.com"
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "site_capabilities.json")
+
+
+@pytest.fixture
+def connection():
+    connection = unittest.mock.Mock(server_info={"version": [8, 1, 0, "beta"]})
+
+    def schema_field_read(entity_type, field_name):
+        if field_name != "is_template":
+            raise Exception(
+                "API schema_field_read() %s.%s doesn't exist"
+                % (entity_type, field_name)
+            )
+        return {field_name: {}}
+
+    connection.schema_field_read.side_effect = schema_field_read
+    return connection
+
+
+def test_values_are_queried_once(cache_path, connection):
+    """
+    Ensure the values are only queried the first time the site is used.
+    """
+    capabilities = SiteCapabilities(cache_path, SITE, lambda: connection)
+    assert capabilities.get_server_version() == (8, 1, 0)
+    assert capabilities.has_field("Project", "is_template")
+    assert not capabilities.has_field("Project", "missing")
+    assert connection.schema_field_read.call_count == 2
+
+    capabilities.refresh()
+    connection.schema_field_read.reset_mock()
+    connection.server_info = None
+
+    # The next process only reads the cache.
+    capabilities = SiteCapabilities(cache_path, SITE, lambda: connection)
+    assert not capabilities.is_stale
+    assert capabilities.get_server_version() == (8, 1, 0)
+    assert capabilities.has_field("Project", "is_template")
+    assert not capabilities.has_field("Project", "missing")
+    connection.schema_field_read.assert_not_called()
+
+
+def test_cache_is_per_site(cache_path, connection):
+    """
+    Ensure the values cached for a site are not used for another one.
+    """
+    SiteCapabilities(cache_path, SITE, lambda: connection).refresh()
+
+    other_connection = unittest.mock.Mock(server_info={"version": [7, 0, 0]})
+    other_connection.schema_field_read.side_effect = Exception(
+        "API schema_field_read() Project.is_template doesn't exist"
+    )
+    capabilities = SiteCapabilities(
+        cache_path, "https://other.shotgunstudio.com", lambda: other_connection
+    )
+    assert capabilities.get_server_version() == (7, 0, 0)
+    assert not capabilities.has_field("Project", "is_template")
+
+
+def test_stale_values_are_revalidated_in_background(cache_path, connection):
+    """
+    Ensure stale values are returned right away and refreshed in the background.
+    """
+    SiteCapabilities(cache_path, SITE, lambda: connection).refresh()
+    connection.server_info = {"version": [8, 2, 0]}
+
+    capabilities = SiteCapabilities(cache_path, SITE, lambda: connection, ttl=-1)
+    assert capabilities.is_stale
+    assert capabilities.get_server_version() == (8, 1, 0)
+    # The thread may already be done.
+    thread = capabilities._thread
+    if thread is not None:
+        thread.join(5)
+    assert capabilities.get_server_version() == (8, 2, 0)
+
+
+def test_invalid_cache_is_ignored(cache_path, connection):
+    """
+    Ensure a corrupted cache is queried again.
+    """
+    with open(cache_path, "w") as fh:
+        fh.write("{")
+    capabilities = SiteCapabilities(cache_path, SITE, lambda: connection)
+    assert capabilities.get_server_version() == (8, 1, 0)
+
+
+def test_failed_queries_are_not_cached(cache_path, connection):
+    """
+    Ensure a query failing for another reason than a missing field doesn't change
+    the cached value.
+    """
+    capabilities = SiteCapabilities(cache_path, SITE, lambda: connection)
+    connection.schema_field_read.side_effect = Exception("Connection timed out")
+    assert not capabilities.has_field("Project", "is_template")
+
+    connection.schema_field_read.side_effect = None
+    assert capabilities.has_field("Project", "is_template")
+
+    connection.schema_field_read.side_effect = Exception("Connection timed out")
+    with pytest.raises(Exception):
+        capabilities.refresh()
+    capabilities = SiteCapabilities(cache_path, SITE, lambda: connection)
+    assert capabilities.has_field("Project", "is_template")
@@ -0,0 +1,105 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
+sys.path.insert(
+    0, os.path.join(os.path.dirname(__file__), "..", "..", "tk-core", "python")
+)
+
+# Patch sgtk to se can use Qt in the tests.
+import sgtk
+
+importer = sgtk.util.qt_importer.QtImporter()
+sgtk.platform.qt.QtGui = importer.QtGui
+sgtk.platform.qt.QtCore = importer.QtCore
+
+QtGui = sgtk.platform.qt.QtGui
+
+from tk_desktop.thumbnail_cache import (  # noqa
+    CROP,
+    LETTERBOX,
+    ThumbnailCache,
+    compose_thumbnail,
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def qapplication():
+    yield QtGui.QApplication.instance() or QtGui.QApplication([])
+
+
+def pixmap(width, height):
+    result = QtGui.QPixmap(width, height)
+    result.fill()
+    return result
+
+
+@pytest.mark.parametrize("mode", [LETTERBOX, CROP])
+def test_compose_thumbnail_is_square(mode):
+    """
+    Ensure thumbnails are scaled to a square whatever their ratio.
+    """
+    for source in [pixmap(200, 100), pixmap(100, 100), pixmap(100, 200)]:
+        result = compose_thumbnail(source, 50, mode)
+        assert result.height() == 50
+        if mode == LETTERBOX or source.width() >= source.height():
+            assert result.width() == 50
+
+
+@pytest.mark.parametrize("mode", [LETTERBOX, CROP])
+def test_compose_thumbnail_image(mode):
+    """
+    Ensure images, which can be scaled in a background thread, stay images.
+    """
+    image = QtGui.QImage(200, 100, QtGui.QImage.Format_ARGB32)
+    image.fill(0)
+    result = compose_thumbnail(image, 50, mode)
+    assert isinstance(result, QtGui.QImage)
+    assert (result.width(), result.height()) == (50, 50)
+
+
+def test_least_recently_used_are_evicted():
+    """
+    Ensure the least recently used thumbnails are evicted once over budget.
+    """
+    cost = ThumbnailCache._get_cost(pixmap(10, 10))
+    cache = ThumbnailCache(budget=cost * 2)
+    keys = [
+        ThumbnailCache.key(project_id, None, 10, LETTERBOX) for project_id in range(3)
+    ]
+
+    cache.insert(keys[0], pixmap(10, 10))
+    cache.insert(keys[1], pixmap(10, 10))
+    assert cache.get(keys[0]) is not None
+    cache.insert(keys[2], pixmap(10, 10))
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[2]) is not None
+    assert cache.cost == cost * 2
+
+
+def test_remove_project():
+    """
+    Ensure all the thumbnails of a project can be removed.
+    """
+    cache = ThumbnailCache()
+    cache.insert(ThumbnailCache.key(1, "/a.png", 10, LETTERBOX), pixmap(10, 10))
+    cache.insert(ThumbnailCache.key(1, "/b.png", 10, LETTERBOX), pixmap(10, 10))
+    cache.insert(ThumbnailCache.key(2, "/a.png", 10, LETTERBOX), pixmap(10, 10))
+    cache.remove_project(1)
+    assert len(cache) == 1
+    cache.clear()
+    assert cache.cost == 0